@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark LoginPage / DashboardPage / SiteDetailPage against the local portal stub
+(no access to beamo.dev needed). Reports per-step timings, throughput and how much
+of the wall time was injected portal latency vs. framework overhead.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from utils.config_loader import get_config, EnvironmentConfig
+from utils.browser_manager import BrowserFactory, BrowserHost
+from utils.flow_scheduler import run_flows, print_timing_summary
+from utils.portal_stub import PortalStub
+from pages.login_page import LoginPage
+from pages.dashboard_page import DashboardPage
+from pages.site_detail_page import SiteDetailPage
+
+
+SPACE_ID = "d-ge-pr"
+
+
+async def benchmark_flow(config: EnvironmentConfig, step_times: Dict[str, List[float]]) -> bool:
+    """Login -> dashboard -> search -> site detail, timing each POM step."""
+    async with BrowserFactory.create(config) as browser_manager:
+        page = browser_manager.page
+
+        async def step(name: str, coro):
+            start_time = time.perf_counter()
+            result = await coro
+            step_times[name].append(time.perf_counter() - start_time)
+            return result
+
+        login_page = LoginPage(page, config)
+        await step("LoginPage.navigate_to_login", login_page.navigate_to_login())
+        await step("LoginPage.wait_for_page_load", login_page.wait_for_page_load())
+        await step("LoginPage.login", login_page.login(
+            SPACE_ID, config.test_data.valid_user["email"], config.test_data.valid_user["password"]
+        ))
+        if not await step("LoginPage.is_logged_in", login_page.is_logged_in()):
+            return False
+
+        dashboard_page = DashboardPage(page, config)
+        await step("DashboardPage.wait_for_dashboard_load", dashboard_page.wait_for_dashboard_load())
+        addresses = await step("DashboardPage.get_site_addresses", dashboard_page.get_site_addresses())
+        await step("DashboardPage.search_sites", dashboard_page.search_sites("Site 000"))
+        await step("DashboardPage.click_search_result_by_index", dashboard_page.click_search_result_by_index(0))
+        await step("navigation to site detail", page.wait_for_url("**/sites/**"))
+
+        site_detail_page = SiteDetailPage(page, config)
+        await step("SiteDetailPage.wait_for_page_load", site_detail_page.wait_for_page_load())
+        site_name = await step("SiteDetailPage.get_site_name", site_detail_page.get_site_name())
+
+        return bool(addresses) and bool(site_name)
+
+
+def print_step_summary(step_times: Dict[str, List[float]]) -> None:
+    """Mean / p95 per POM step."""
+    print("\n⏱️ 단계별 소요시간")
+    print(f"   {'단계':<45} {'횟수':>5} {'평균(ms)':>10} {'p95(ms)':>10}")
+    for name, samples in step_times.items():
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(f"   {name:<45} {len(samples):>5} {statistics.mean(samples) * 1000:>10.1f} {p95 * 1000:>10.1f}")
+
+
+async def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="로컬 대역 포털 대상 POM 처리량/동시성 벤치마크")
+    parser.add_argument("--flows", "-n", type=int, default=10, help="실행할 플로우 수 (기본값: 10)")
+    parser.add_argument("--concurrency", "-c", type=int, default=1, help="동시 실행 플로우 수 (기본값: 1)")
+    parser.add_argument("--latency-ms", type=int, default=0, help="대역 서버 요청당 지연 시간(ms)")
+    parser.add_argument("--sites", type=int, default=50, help="대역 서버 사이트 수 (기본값: 50)")
+    parser.add_argument("--port", type=int, default=0, help="대역 서버 포트 (기본값: 임의 포트)")
+    args = parser.parse_args()
+
+    with PortalStub(port=args.port, sites=args.sites, latency_ms=args.latency_ms) as stub:
+        base_config = get_config("local")
+        config = base_config.model_copy(update={
+            "base_url": stub.base_url,
+            "api": base_config.api.model_copy(update={"base_url": f"http://127.0.0.1:{stub.port}"}),
+        })
+
+        print(f"🌐 대역 포털: {stub.base_url} (사이트 {args.sites}개, 지연 {args.latency_ms}ms)")
+        step_times: Dict[str, List[float]] = defaultdict(list)
+
+        try:
+            wall_start = time.perf_counter()
+            results = await run_flows(
+                [(f"bench_{index}", lambda: benchmark_flow(config, step_times)) for index in range(1, args.flows + 1)],
+                args.concurrency,
+            )
+            wall_time = time.perf_counter() - wall_start
+        finally:
+            await BrowserHost.shutdown()
+
+        passed = sum(1 for result in results if result.passed)
+        print("\n" + "=" * 80)
+        print(f"📊 벤치마크 결과: {passed}/{len(results)} 성공")
+        print_step_summary(step_times)
+        print_timing_summary(results, wall_time, args.concurrency)
+        if wall_time > 0:
+            print(f"   처리량: {len(results) / wall_time:.2f} 플로우/초")
+
+        # 대역 서버가 주입한 지연은 서버 스레드에서 병렬로 발생하므로 플로우 시간 합계와 비교
+        flow_time = sum(result.duration for result in results)
+        print(f"   포털 요청 수: {stub.state.requests_served}, 주입된 지연 합계: {stub.state.latency_injected:.2f}초")
+        if flow_time > 0:
+            share = min(1.0, stub.state.latency_injected / flow_time)
+            print(f"   포털 지연 비중: {share * 100:.1f}% / 프레임워크 오버헤드: {(1 - share) * 100:.1f}%")
+        print("=" * 80)
+
+        sys.exit(0 if passed == len(results) else 1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
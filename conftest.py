@@ -1,6 +1,70 @@
-import os
-from pathlib import Path
+import shutil
 import pytest
+import pytest_asyncio
+
+from utils.browser_manager import BrowserHost
+from utils.waits import wait_recorder
+from utils.spans import span_recorder
+from utils.web_vitals import vitals_recorder, format_navigation
+from utils.artifacts import artifact_log, artifact_writer
+
+# --result-stream PATH 로 테스트별 JSON 결과 기록
+pytest_plugins = ["utils.result_stream", "utils.adaptive_timeout"]
+
+
+def pytest_collection_modifyitems(items):
+    """모든 async 테스트를 세션 이벤트 루프에서 실행 (공유 브라우저 재사용 조건)."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def shared_browser_host():
+    """워커당 한 번 실행된 공유 Chromium을 세션 종료 시 닫는다."""
+    yield
+    await BrowserHost.shutdown()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """테스트별 느린 페이지 객체 단계, 페이지 로드 지표, 조건 대기 통계 출력."""
+    tests = span_recorder.tests()
+    if tests:
+        terminalreporter.section("page-object steps")
+        for test in tests:
+            steps = ", ".join(f"{name} {entry['total']:.2f}s" for name, entry in span_recorder.slowest(test, limit=3))
+            terminalreporter.write_line(f"{test}: {span_recorder.top_level_time(test):.2f}s in steps ({steps})")
+            # CDP 샘플링을 켠 경우 메인 스레드 비용이 큰 단계
+            heavy = sorted(
+                ((name, entry["cdp"]) for name, entry in span_recorder.summary(test).items() if "cdp" in entry),
+                key=lambda item: item[1]["TaskDuration"], reverse=True,
+            )[:3]
+            for name, cdp in heavy:
+                terminalreporter.write_line(
+                    f"  {name}: task {cdp['TaskDuration']:.0f}ms, script {cdp['ScriptDuration']:.0f}ms, "
+                    f"heap {cdp['JSHeapUsedSize'] / 1048576:+.1f}MB, nodes {cdp['Nodes']:+.0f}, "
+                    f"layouts {cdp['LayoutCount']:.0f}, style recalcs {cdp['RecalcStyleCount']:.0f}"
+                )
+
+    vitals_tests = vitals_recorder.tests()
+    if vitals_tests:
+        terminalreporter.section("web vitals")
+        for test in vitals_tests:
+            terminalreporter.write_line(f"{test}:")
+            for navigation in vitals_recorder.for_test(test):
+                terminalreporter.write_line(f"  {format_navigation(navigation)}")
+
+    summary = wait_recorder.summary()
+    if not summary:
+        return
+    terminalreporter.section("condition waits")
+    for name, entry in sorted(summary.items()):
+        terminalreporter.write_line(
+            f"{name:<22} x{entry['count']:<4} waited {entry['waited']:.2f}s, "
+            f"timeouts {entry['timeouts']}, saved {entry['saved']:.2f}s"
+        )
+    terminalreporter.write_line(f"total saved vs fixed sleeps: {wait_recorder.total_saved():.2f}s")
 
 
 # 각 테스트의 성공/실패 리포트를 item 속성으로 저장
@@ -14,17 +78,11 @@ def pytest_runtest_makereport(item, call):
 @pytest.fixture(autouse=True)
 def cleanup_artifacts_on_success(request):
     """
-    테스트 시작 시점의 스크린샷/비디오 목록을 기록하고,
-    테스트가 성공하면 새로 생성된 파일을 삭제한다.
-    (실패 케이스에서만 산출물이 남도록 강제)
+    테스트가 이 프로세스에서 남긴 스크린샷/비디오/트레이스만 추적해,
+    테스트가 성공하면 삭제한다. (실패 케이스에서만 산출물이 남도록 강제)
+    같은 reports/<env>/ 를 쓰는 다른 샤드/격리 레인의 파일은 건드리지 않는다.
     """
-    # 환경 디렉터리 추정 (기본 dev) — 필요 시 BEAMO_ENV 로 분기
-    env = os.getenv("BEAMO_ENV", "dev")
-    screenshots_dir = Path(f"reports/{env}/screenshots")
-    videos_dir = Path(f"reports/{env}/videos")
-
-    before_shots = set(screenshots_dir.glob("*.png")) if screenshots_dir.exists() else set()
-    before_vids = set(videos_dir.glob("*.webm")) if videos_dir.exists() else set()
+    mark = artifact_log.mark()
 
     yield
 
@@ -32,14 +90,17 @@ def cleanup_artifacts_on_success(request):
     rep_call = getattr(request.node, "rep_call", None)
     failed = bool(rep_call and rep_call.failed)
 
-    if not failed:
-        after_shots = set(screenshots_dir.glob("*.png")) if screenshots_dir.exists() else set()
-        after_vids = set(videos_dir.glob("*.webm")) if videos_dir.exists() else set()
-        new_files = (after_shots - before_shots) | (after_vids - before_vids)
+    # 백그라운드에서 쓰는 중인 스크린샷까지 기다린 뒤 처리
+    artifact_writer.drain(timeout=30)
+    new_files = [path for path in artifact_log.since(mark) if path.exists()]
+
+    if failed:
+        # 결과 스트림에 이 테스트의 산출물 경로를 남김
+        request.node.user_properties.append(("artifacts", sorted(str(f) for f in new_files)))
+    else:
         for f in new_files:
             try:
-                f.unlink()
+                # ffmpeg 없이 저장된 동영상은 프레임 디렉터리
+                shutil.rmtree(f) if f.is_dir() else f.unlink()
             except Exception:
                 pass
-
-
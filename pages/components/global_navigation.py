@@ -7,8 +7,12 @@ Handles the global navigation bar that appears on all pages
 import logging
 from typing import Optional, List, Dict
 from utils.config_loader import EnvironmentConfig
+from utils.selector_cache import SelectorResolver
+from utils.selector_race import race
+from utils.spans import record_spans
 
 
+@record_spans
 class GlobalNavigation:
     """Global Navigation Component for Beamo"""
     
@@ -55,10 +59,19 @@ class GlobalNavigation:
             "help_menu": ".help-menu, .support-menu",
             "language_selector": ".language-selector, .lang-selector",
             
+            # 톱니바퀴 설정 버튼
+            "gear_settings": ".gear-settings, .settings-gear, [data-testid*='settings']",
+            "gear_icon": ".el-icon-setting, [class*='icon-setting'], [class*='icon-gear']",
+            "gear_button": "button[aria-label*='etting'], button[title*='etting']",
+            "gear_link": "a[href*='/settings'], a[href*='/setting']",
+            
             # 모바일 메뉴
             "mobile_menu_button": ".mobile-menu-btn, .hamburger",
             "mobile_menu": ".mobile-menu, .mobile-nav",
         }
+        
+        # 폴백 셀렉터 체인에서 지난번 성공한 후보를 먼저 시도
+        self.selector_resolver = SelectorResolver(config.environment, "global_navigation")
     
     async def is_visible(self) -> bool:
         """Check if global navigation is visible."""
@@ -205,88 +218,76 @@ class GlobalNavigation:
             self.logger.error(f"Failed to click settings: {e}")
             raise
     
-    async def click_gear_settings(self) -> None:
+    async def click_gear_settings(self, timeout: int = 5000) -> None:
         """Click gear settings button (톱니바퀴 설정 버튼)."""
         try:
-            # 여러 방법으로 톱니바퀴 설정 버튼 찾기
-            gear_selectors = [
-                self.selectors["gear_settings"],
-                self.selectors["gear_icon"],
-                self.selectors["gear_button"],
-                self.selectors["gear_link"],
+            # 여러 방법으로 톱니바퀴 설정 버튼 찾기 (우선순위 순)
+            gear_selectors = self._gear_selectors() + [
                 "button:has-text('⚙️')",
                 "button:has-text('🔧')",
                 "a:has-text('⚙️')",
                 "a:has-text('🔧')",
+                # 텍스트 기반으로 찾기
+                "button:has-text('설정')",
+                "button:has-text('Settings')",
+                "button:has-text('Config')",
+                "a:has-text('설정')",
+                "a:has-text('Settings')",
+                "a:has-text('Config')"
+            ]
+            # 클래스 부분 일치 후보는 관련 없는 요소도 잡으므로 마지막에만 시도하고 캐시하지 않음
+            catch_all_selectors = [
                 "[class*='gear']",
                 "[class*='cog']",
                 "[class*='settings']",
-                "[class*='config']"
+                "[class*='config']",
             ]
+            candidates = self.selector_resolver.order("gear_settings", gear_selectors) + catch_all_selectors
             
-            gear_found = False
-            for selector in gear_selectors:
-                try:
-                    gear_elem = await self.page.query_selector(selector)
-                    if gear_elem and await gear_elem.is_visible():
-                        await gear_elem.click()
-                        self.logger.info(f"Clicked gear settings button using selector: {selector}")
-                        gear_found = True
-                        break
-                except Exception:
-                    continue
-            
-            if not gear_found:
-                # 텍스트 기반으로 찾기
-                text_selectors = [
-                    "button:has-text('설정')",
-                    "button:has-text('Settings')",
-                    "button:has-text('Config')",
-                    "a:has-text('설정')",
-                    "a:has-text('Settings')",
-                    "a:has-text('Config')"
-                ]
-                
-                for selector in text_selectors:
-                    try:
-                        text_elem = await self.page.query_selector(selector)
-                        if text_elem and await text_elem.is_visible():
-                            await text_elem.click()
-                            self.logger.info(f"Clicked gear settings button using text selector: {selector}")
-                            gear_found = True
-                            break
-                    except Exception:
-                        continue
+            # 경합은 "무언가 보일 때까지" 대기하는 용도로만 사용
+            if not await race(self.page, selectors=candidates, timeout=timeout):
+                self.selector_resolver.record("gear_settings", None)
+                raise Exception("Gear settings button not found")
             
-            if not gear_found:
+            # 보이는 후보 중 우선순위가 가장 높은 것을 클릭
+            for selector in candidates:
+                element = await self.page.query_selector(f"{selector} >> visible=true")
+                if element:
+                    break
+            else:
                 raise Exception("Gear settings button not found")
+            
+            if selector not in catch_all_selectors:
+                self.selector_resolver.record("gear_settings", selector)
+            
+            await element.click()
+            self.logger.info(f"Clicked gear settings button using selector: {selector}")
                 
         except Exception as e:
             self.logger.error(f"Failed to click gear settings: {e}")
             raise
     
-    async def is_gear_settings_visible(self) -> bool:
-        """Check if gear settings button is visible."""
+    async def is_gear_settings_visible(self, timeout: int = 1000) -> bool:
+        """Check if gear settings button is visible (waits up to ``timeout`` ms)."""
         try:
-            gear_selectors = [
-                self.selectors["gear_settings"],
-                self.selectors["gear_icon"],
-                self.selectors["gear_button"],
-                self.selectors["gear_link"]
-            ]
-            
-            for selector in gear_selectors:
-                try:
-                    gear_elem = await self.page.query_selector(selector)
-                    if gear_elem and await gear_elem.is_visible():
-                        return True
-                except Exception:
-                    continue
-            
-            return False
+            winner = await race(
+                self.page,
+                selectors=self.selector_resolver.order("gear_settings", self._gear_selectors()),
+                timeout=timeout,
+            )
+            return winner is not None
         except Exception:
             return False
     
+    def _gear_selectors(self) -> List[str]:
+        """Primary gear settings selectors (without the generic fallbacks)."""
+        return [
+            self.selectors["gear_settings"],
+            self.selectors["gear_icon"],
+            self.selectors["gear_button"],
+            self.selectors["gear_link"],
+        ]
+    
     async def click_help(self) -> None:
         """Click help menu."""
         try:
@@ -5,11 +5,63 @@ Handles dashboard functionality and navigation.
 
 import asyncio
 import logging
+import weakref
 from typing import Optional, List
+from urllib.parse import quote
 from playwright.async_api import Page
 from utils.config_loader import EnvironmentConfig
+from utils.selector_cache import SelectorResolver
+from utils.waits import Waits
+from utils.spans import record_spans
+from utils.artifacts import save_screenshot
 
 
+class SiteRecord:
+    """One site card in the dashboard list."""
+    
+    def __init__(self, index: int, name: str, address: str, last_updated: str, bookmarked: bool):
+        self.index = index
+        self.name = name
+        self.address = address
+        self.last_updated = last_updated
+        self.bookmarked = bookmarked
+    
+    def to_dict(self) -> dict:
+        """Dictionary in the get_site_info_by_index() format."""
+        return {
+            "name": self.name,
+            "address": self.address,
+            "survey_date": self.last_updated,
+            "bookmarked": self.bookmarked,
+            "index": self.index,
+        }
+    
+    def __repr__(self) -> str:
+        return f"SiteRecord(index={self.index}, name={self.name!r}, address={self.address!r})"
+
+
+# 페이지별 사이트 목록 스냅샷 (DashboardPage 인스턴스가 여러 개여도 페이지 단위로 공유)
+_site_snapshots: "weakref.WeakKeyDictionary[Page, List[SiteRecord]]" = weakref.WeakKeyDictionary()
+# framenavigated 핸들러를 이미 등록한 페이지
+_watched_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+
+def _watch_navigation(page: Page) -> None:
+    """Drop a page's site snapshot on main-frame navigation (handler registered once per page)."""
+    if page in _watched_pages:
+        return
+    _watched_pages.add(page)
+    page_ref = weakref.ref(page)
+    
+    def on_frame_navigated(frame) -> None:
+        current = page_ref()
+        if current is not None and frame == current.main_frame:
+            _site_snapshots.pop(current, None)
+    
+    page.on("framenavigated", on_frame_navigated)
+
+
+@record_spans
 class DashboardPage:
     """Page Object Model for Beamo dashboard page."""
     
@@ -75,6 +127,74 @@ class DashboardPage:
         "search_result_item": ".building, .el-card, .site-item, .list-item, [data-testid='site-item'], .card, .item, li, .site",
         "building_name": ".building-name",
         }
+        
+        # 폴백 셀렉터 체인에서 지난번 성공한 후보를 먼저 시도
+        self.selector_resolver = SelectorResolver(config.environment, "dashboard")
+        self.waits = Waits(page)
+        
+        # 네비게이션 시 사이트 목록 스냅샷 무효화 (핸들러는 페이지당 하나)
+        _watch_navigation(page)
+    
+    def invalidate_sites_snapshot(self) -> None:
+        """Drop the cached site snapshot (list content changed in place)."""
+        _site_snapshots.pop(self.page, None)
+    
+    async def snapshot_sites(self, refresh: bool = False) -> List[SiteRecord]:
+        """
+        Read every site card (name, address, last-updated date, bookmark state) in one evaluate.
+        
+        A non-empty result is cached per page until the next navigation,
+        search or site creation; pass ``refresh=True`` to force a new read.
+        
+        Returns:
+            List[SiteRecord]: Site cards in list order
+        """
+        cached = _site_snapshots.get(self.page)
+        if cached is not None and not refresh:
+            return cached
+        
+        rows = await self.page.evaluate("""
+            (selectors) => {
+                let cards = Array.from(document.querySelectorAll('.building'));
+                if (!cards.length) {
+                    // .building 카드가 없으면 주소 요소의 부모를 카드로 사용
+                    cards = Array.from(document.querySelectorAll(selectors.address)).map(el => el.parentElement);
+                }
+                const text = (card, selector) => {
+                    const el = card.querySelector(selector);
+                    return el && el.textContent ? el.textContent.trim() : '';
+                };
+                const isBookmarked = (card) => {
+                    const icon = card.querySelector(selectors.bookmark);
+                    if (!icon) return false;
+                    const state = `${icon.className} ${icon.getAttribute('aria-pressed') || ''}`;
+                    return /active|bookmarked|filled|checked|true/.test(state) || icon.textContent.includes('★');
+                };
+                return cards.map(card => ({
+                    name: text(card, selectors.name),
+                    address: text(card, selectors.address),
+                    last_updated: text(card, selectors.last_updated),
+                    bookmarked: isBookmarked(card),
+                }));
+            }
+        """, {
+            "name": self.selectors["building_name"],
+            "address": self.selectors["building_address"],
+            "last_updated": self.selectors["building_last_updated"],
+            "bookmark": self.selectors["bookmark_icon"],
+        })
+        
+        sites = [
+            SiteRecord(index, row["name"], row["address"], row["last_updated"], row["bookmarked"])
+            for index, row in enumerate(rows)
+        ]
+        # 빈 목록은 아직 렌더링 전일 수 있으므로 캐시하지 않음
+        if sites:
+            _site_snapshots[self.page] = sites
+        else:
+            _site_snapshots.pop(self.page, None)
+        self.logger.info(f"Site list snapshot taken: {len(sites)} sites")
+        return sites
     
     async def wait_for_dashboard_load(self) -> None:
         """Wait for dashboard to be fully loaded."""
@@ -203,6 +323,7 @@ class DashboardPage:
             # Select the option
             option = await self.page.wait_for_selector(f".sort-option:has-text('{option_text}')")
             await option.click()
+            self.invalidate_sites_snapshot()
             self.logger.info(f"Selected sort option: {option_text}")
         except Exception as e:
             self.logger.error(f"Failed to select sort option: {e}")
@@ -211,13 +332,7 @@ class DashboardPage:
     async def get_site_addresses(self) -> list:
         """Get all site addresses."""
         try:
-            address_elements = await self.page.query_selector_all(self.selectors["building_address"])
-            addresses = []
-            for element in address_elements:
-                text = await element.text_content()
-                if text:
-                    addresses.append(text.strip())
-            return addresses
+            return [site.address for site in await self.snapshot_sites() if site.address]
         except Exception as e:
             self.logger.error(f"Failed to get site addresses: {e}")
             return []
@@ -225,13 +340,7 @@ class DashboardPage:
     async def get_site_survey_dates(self) -> list:
         """Get all site survey dates."""
         try:
-            date_elements = await self.page.query_selector_all(self.selectors["building_last_updated"])
-            dates = []
-            for element in date_elements:
-                text = await element.text_content()
-                if text:
-                    dates.append(text.strip())
-            return dates
+            return [site.last_updated for site in await self.snapshot_sites() if site.last_updated]
         except Exception as e:
             self.logger.error(f"Failed to get site survey dates: {e}")
             return []
@@ -242,6 +351,7 @@ class DashboardPage:
             bookmark_icons = await self.page.query_selector_all(self.selectors["bookmark_icon"])
             if site_index < len(bookmark_icons):
                 await bookmark_icons[site_index].click()
+                self.invalidate_sites_snapshot()
                 self.logger.info(f"Clicked bookmark for site {site_index}")
             else:
                 raise ValueError(f"Site index {site_index} out of range")
@@ -365,14 +475,15 @@ class DashboardPage:
             
             # Submit the form
             await self.submit_create_site()
+            self.invalidate_sites_snapshot()
             
             # Wait for dialog to close (success) or error message
             try:
                 await self.page.wait_for_selector(self.selectors["site_create_dialog"], state="hidden", timeout=10000)
                 self.logger.info(f"Site created successfully: {site_name}")
                 
-                # Wait a bit for the page to update
-                await asyncio.sleep(2)
+                # 생성 완료 알림이 뜰 때까지 대기 (새로고침 전 반영 확인)
+                await self.waits.toast_shown(timeout=2000, replaces_sleep=2)
                 
                 # Refresh the page to see the new site
                 await self.page.reload()
@@ -402,7 +513,24 @@ class DashboardPage:
     # 검색 기능 관련 메서드들
     async def search_sites(self, search_term: str) -> None:
         """Search for sites using the search input."""
-        try:
+        response_task = list_task = None
+        try:
+            # 검색 전 결과 목록 상태 기록
+            before = await self.waits.list_fingerprint(".building")
+            
+            # 검색 요청(XHR/fetch)의 응답은 검색 실행 전부터 대기
+            # (폴링 등 무관한 XHR에 반응하지 않도록 검색 경로나 검색어가 URL에 있는 응답만 인정)
+            encoded_term = quote(search_term)
+            response_task = asyncio.ensure_future(self.page.wait_for_event(
+                "response",
+                predicate=lambda response: (
+                    response.request.resource_type in ("xhr", "fetch")
+                    and ("search" in response.url.lower()
+                         or bool(search_term) and (encoded_term in response.url or search_term in response.url))
+                ),
+                timeout=5000,
+            ))
+            
             # JavaScript를 사용해서 검색 실행
             await self.page.evaluate(f"""
                 (searchTerm) => {{
@@ -422,14 +550,29 @@ class DashboardPage:
                     }}
                 }}
             """, search_term)
+            self.invalidate_sites_snapshot()
             
-            # 검색 실행 후 잠시 대기
-            await asyncio.sleep(2)
+            # 결과 목록 변경 또는 검색 응답 중 먼저 오는 것을 대기
+            list_task = asyncio.ensure_future(
+                self.waits.results_list_changed(".building", before, timeout=5000, replaces_sleep=2)
+            )
+            done, _ = await asyncio.wait({response_task, list_task}, return_when=asyncio.FIRST_COMPLETED)
+            if response_task in done and response_task.exception() is None and not list_task.done():
+                # 응답 도착: 로딩 표시가 사라진 뒤 렌더링만 짧게 대기 (결과가 같으면 목록이 바뀌지 않음)
+                list_task.cancel()
+                await self.waits.loading_mask_gone(timeout=5000)
+                await self.waits.results_list_changed(".building", before, timeout=1000)
             
             self.logger.info(f"Searched for sites with term: {search_term}")
         except Exception as e:
             self.logger.error(f"Failed to search sites: {e}")
             raise
+        finally:
+            tasks = [task for task in (response_task, list_task) if task]
+            for task in tasks:
+                task.cancel()
+            # 취소/타임아웃된 대기의 예외는 무시
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     async def clear_search(self) -> None:
         """Clear the search input."""
@@ -437,6 +580,7 @@ class DashboardPage:
             search_input = await self.page.wait_for_selector(self.selectors["search_input"])
             await search_input.clear()
             await search_input.press("Enter")
+            self.invalidate_sites_snapshot()
             self.logger.info("Search cleared")
         except Exception as e:
             self.logger.error(f"Failed to clear search: {e}")
@@ -554,88 +698,34 @@ class DashboardPage:
             raise
     
     async def click_first_available_site(self) -> bool:
-        """강력한 사이트 클릭 메서드 - 여러 방법을 시도합니다."""
+        """강력한 사이트 클릭 메서드 - 여러 방법을 시도합니다 (지난번 성공한 방법부터)."""
         try:
             self.logger.info("🔍 첫 번째 사이트 클릭 시도 시작...")
             
-            # 방법 1: .building 셀렉터로 시도
-            try:
-                buildings = await self.page.query_selector_all(".building")
-                if buildings and len(buildings) > 0:
-                    await buildings[0].click()
-                    self.logger.info("✅ .building 셀렉터로 사이트 클릭 성공")
-                    await self.page.wait_for_load_state("networkidle", timeout=15000)
-                    await self.page.wait_for_selector(
-                        ".site-profile, .site-name, .site-title, .control-panel__content, .viewer-controls",
-                        timeout=15000
-                    )
-                    return True
-            except Exception as e:
-                self.logger.warning(f"⚠️ .building 방법 실패: {e}")
-            
-            # 방법 2: .building-address 셀렉터로 시도
-            try:
-                addresses = await self.page.query_selector_all(".building-address")
-                if addresses and len(addresses) > 0:
-                    await addresses[0].click()
-                    self.logger.info("✅ .building-address 셀렉터로 사이트 클릭 성공")
-                    await self.page.wait_for_load_state("networkidle", timeout=15000)
-                    await self.page.wait_for_selector(
-                        ".site-profile, .site-name, .site-title, .control-panel__content, .viewer-controls",
-                        timeout=15000
-                    )
-                    return True
-            except Exception as e:
-                self.logger.warning(f"⚠️ .building-address 방법 실패: {e}")
-            
-            # 방법 3: .el-card 셀렉터로 시도
-            try:
-                cards = await self.page.query_selector_all(".el-card")
-                if cards and len(cards) > 0:
-                    await cards[0].click()
-                    self.logger.info("✅ .el-card 셀렉터로 사이트 클릭 성공")
-                    await self.page.wait_for_load_state("networkidle", timeout=15000)
-                    await self.page.wait_for_selector(
-                        ".site-profile, .site-name, .site-title, .control-panel__content, .viewer-controls",
-                        timeout=15000
-                    )
-                    return True
-            except Exception as e:
-                self.logger.warning(f"⚠️ .el-card 방법 실패: {e}")
+            # 방법 1~5: 셀렉터 (지난번 성공한 셀렉터부터)
+            selectors = [".building", ".building-address", ".el-card", ".site-item", ".list-item"]
+            if await self.selector_resolver.resolve("first_site", selectors, self._click_first_site_with):
+                return True
             
-            # 방법 4: .site-item 셀렉터로 시도
-            try:
-                site_items = await self.page.query_selector_all(".site-item")
-                if site_items and len(site_items) > 0:
-                    await site_items[0].click()
-                    self.logger.info("✅ .site-item 셀렉터로 사이트 클릭 성공")
-                    await self.page.wait_for_load_state("networkidle", timeout=15000)
-                    await self.page.wait_for_selector(
-                        ".site-profile, .site-name, .site-title, .control-panel__content, .viewer-controls",
-                        timeout=15000
-                    )
+            # 방법 6: JavaScript 탐색, 7: 새로고침 후 .building 재시도
+            # 최후 수단은 캐시에 기록하지 않음 (새로고침이 우선 전략으로 굳지 않도록)
+            for strategy in ("js-probe", "reload"):
+                if await self._click_first_site_with(strategy):
                     return True
-            except Exception as e:
-                self.logger.warning(f"⚠️ .site-item 방법 실패: {e}")
             
-            # 방법 5: .list-item 셀렉터로 시도
-            try:
-                list_items = await self.page.query_selector_all(".list-item")
-                if list_items and len(list_items) > 0:
-                    await list_items[0].click()
-                    self.logger.info("✅ .list-item 셀렉터로 사이트 클릭 성공")
-                    await self.page.wait_for_load_state("networkidle", timeout=15000)
-                    await self.page.wait_for_selector(
-                        ".site-profile, .site-name, .site-title, .control-panel__content, .viewer-controls",
-                        timeout=15000
-                    )
-                    return True
-            except Exception as e:
-                self.logger.warning(f"⚠️ .list-item 방법 실패: {e}")
+            self.logger.error("❌ 모든 사이트 클릭 방법 실패")
+            return False
             
-            # 방법 6: JavaScript로 클릭 가능한 요소 찾기
-            try:
-                clickable_elements = await self.page.evaluate("""
+        except Exception as e:
+            self.logger.error(f"❌ click_first_available_site 실패: {e}")
+            return False
+    
+    async def _click_first_site_with(self, strategy: str) -> bool:
+        """Click the first site using one strategy and wait for the site detail page."""
+        try:
+            if strategy == "js-probe":
+                # JavaScript로 클릭 가능한 요소 찾아서 직접 클릭
+                clicked = await self.page.evaluate("""
                     () => {
                         const selectors = [
                             '.building',
@@ -651,87 +741,46 @@ class DashboardPage:
                         for (const selector of selectors) {
                             const elements = document.querySelectorAll(selector);
                             if (elements.length > 0) {
-                                return {
-                                    selector: selector,
-                                    count: elements.length,
-                                    firstElement: elements[0].tagName + (elements[0].className ? '.' + elements[0].className.split(' ').join('.') : '')
-                                };
+                                elements[0].click();
+                                return selector;
                             }
                         }
                         return null;
                     }
                 """)
+                if not clicked:
+                    return False
+                self.logger.info(f"✅ JavaScript로 {clicked} 클릭 성공")
+            else:
+                if strategy == "reload":
+                    self.logger.info("🔄 페이지 새로고침 후 재시도...")
+                    await self.page.reload()
+                    await self.page.wait_for_load_state("networkidle", timeout=10000)
                 
-                if clickable_elements:
-                    self.logger.info(f"🔍 JavaScript로 찾은 요소: {clickable_elements}")
-                    # JavaScript로 직접 클릭
-                    await self.page.evaluate(f"""
-                        () => {{
-                            const elements = document.querySelectorAll('{clickable_elements['selector']}');
-                            if (elements.length > 0) {{
-                                elements[0].click();
-                                return true;
-                            }}
-                            return false;
-                        }}
-                    """)
-                    self.logger.info(f"✅ JavaScript로 {clickable_elements['selector']} 클릭 성공")
-                    await self.page.wait_for_load_state("networkidle", timeout=15000)
-                    await self.page.wait_for_selector(
-                        ".site-profile, .site-name, .site-title, .control-panel__content, .viewer-controls",
-                        timeout=15000
-                    )
-                    return True
-                    
-            except Exception as e:
-                self.logger.warning(f"⚠️ JavaScript 방법 실패: {e}")
-            
-            # 방법 7: 페이지 새로고침 후 재시도
-            try:
-                self.logger.info("🔄 페이지 새로고침 후 재시도...")
-                await self.page.reload()
-                await self.page.wait_for_load_state("networkidle", timeout=10000)
-                
-                # 새로고침 후 다시 .building 시도
-                buildings = await self.page.query_selector_all(".building")
-                if buildings and len(buildings) > 0:
-                    await buildings[0].click()
-                    self.logger.info("✅ 새로고침 후 .building 셀렉터로 사이트 클릭 성공")
-                    await self.page.wait_for_load_state("networkidle", timeout=15000)
-                    await self.page.wait_for_selector(
-                        ".site-profile, .site-name, .site-title, .control-panel__content, .viewer-controls",
-                        timeout=15000
-                    )
-                    return True
-                    
-            except Exception as e:
-                self.logger.warning(f"⚠️ 새로고침 후 재시도 실패: {e}")
-            
-            self.logger.error("❌ 모든 사이트 클릭 방법 실패")
-            return False
+                selector = ".building" if strategy == "reload" else strategy
+                elements = await self.page.query_selector_all(selector)
+                if not elements:
+                    return False
+                await elements[0].click()
+                self.logger.info(f"✅ {selector} 셀렉터로 사이트 클릭 성공 ({strategy})")
             
+            await self.page.wait_for_load_state("networkidle", timeout=15000)
+            await self.page.wait_for_selector(
+                ".site-profile, .site-name, .site-title, .control-panel__content, .viewer-controls",
+                timeout=15000
+            )
+            return True
         except Exception as e:
-            self.logger.error(f"❌ click_first_available_site 실패: {e}")
+            self.logger.warning(f"⚠️ {strategy} 방법 실패: {e}")
             return False
     
     async def get_site_info_by_index(self, index: int) -> dict:
         """Get site information by index."""
         try:
-            addresses = await self.page.query_selector_all(self.selectors["building_address"])
-            dates = await self.page.query_selector_all(self.selectors["building_last_updated"])
-            names = await self.page.query_selector_all(self.selectors["building_name"])
+            sites = await self.snapshot_sites()
             
-            if index < len(addresses):
-                address_text = await addresses[index].text_content()
-                date_text = await dates[index].text_content() if index < len(dates) else ""
-                name_text = await names[index].text_content() if index < len(names) else ""
-                
-                return {
-                    "name": name_text.strip() if name_text else "",
-                    "address": address_text.strip() if address_text else "",
-                    "survey_date": date_text.strip() if date_text else "",
-                    "index": index
-                }
+            if index < len(sites):
+                return sites[index].to_dict()
             else:
                 raise ValueError(f"Site index {index} out of range")
         except Exception as e:
@@ -741,11 +790,10 @@ class DashboardPage:
     async def get_site_name_by_index(self, index: int) -> str:
         """Get site name by index."""
         try:
-            names = await self.page.query_selector_all(self.selectors["building_name"])
+            sites = await self.snapshot_sites()
             
-            if index < len(names):
-                name_text = await names[index].text_content()
-                return name_text.strip() if name_text else ""
+            if index < len(sites):
+                return sites[index].name
             else:
                 raise ValueError(f"Site index {index} out of range")
         except Exception as e:
@@ -755,20 +803,8 @@ class DashboardPage:
     async def take_dashboard_screenshot(self, name: str = "dashboard") -> str:
         """Take screenshot of dashboard page."""
         try:
-            # Create reports directory if it doesn't exist
-            import os
-            screenshot_dir = f"reports/{self.config.environment}/screenshots"
-            os.makedirs(screenshot_dir, exist_ok=True)
-            
-            # Generate screenshot filename
-            import time
-            timestamp = int(time.time())
-            filename = f"{name}_{timestamp}.png"
-            filepath = os.path.join(screenshot_dir, filename)
-            
-            # Take screenshot
-            await self.page.screenshot(path=filepath)
-            self.logger.info(f"Screenshot saved: {filepath}")
+            filepath = await save_screenshot(self.page, self.config, name)
+            self.logger.info(f"Screenshot queued: {filepath}")
             return filepath
         except Exception as e:
             self.logger.error(f"Failed to take screenshot: {e}")
@@ -888,21 +924,13 @@ class DashboardPage:
     
     async def take_dashboard_screenshot(self, test_name: str = "dashboard", status: str = "unknown") -> str:
         """실패/에러 상태에서만 대시보드 스크린샷 저장."""
-        from pathlib import Path
-        from datetime import datetime
-        
         if status not in ("failure", "error"):
             self.logger.info(f"Skipping dashboard screenshot for status '{status}'")
             return ""
         
-        reports_dir = Path(f"reports/{self.config.environment}/screenshots")
-        reports_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{test_name}_{status}_{timestamp}.png"
-        screenshot_path = reports_dir / filename
-        await self.page.screenshot(path=str(screenshot_path))
-        self.logger.info(f"Screenshot saved: {screenshot_path}")
-        return str(screenshot_path)
+        screenshot_path = await save_screenshot(self.page, self.config, f"{test_name}_{status}")
+        self.logger.info(f"Screenshot queued: {screenshot_path}")
+        return screenshot_path
     
     async def wait_for_navigation(self, expected_url_pattern: str, timeout: int = 10000) -> bool:
         """Wait for navigation to specific URL pattern."""
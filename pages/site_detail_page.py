@@ -3,12 +3,16 @@
 Site Detail Page Object Model
 """
 
-import asyncio
 import logging
 from typing import Optional, List, Dict
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from utils.config_loader import EnvironmentConfig
+from utils.waits import Waits
+from utils.spans import record_spans
+from utils.artifacts import save_screenshot
 
 
+@record_spans
 class SiteDetailPage:
     """Page Object Model for Beamo Site Detail Page"""
     
@@ -109,6 +113,9 @@ class SiteDetailPage:
             "gallery_images": ".gallery-item, .image-item, .photo-item, .gallery-image",
             "gallery_image": "img[src*='gallery'], img[src*='image'], img[src*='photo']",
         }
+        
+        # 고정 sleep 대신 조건 기반 대기
+        self.waits = Waits(page)
     
     async def wait_for_page_load(self) -> None:
         """Wait for site detail page to be fully loaded."""
@@ -372,18 +379,9 @@ class SiteDetailPage:
                 self.logger.info(f"Skipping screenshot for status '{status}': {test_name}")
                 return ""
 
-            import os
-            from datetime import datetime
-            screenshot_dir = f"reports/{self.config.environment}/screenshots"
-            os.makedirs(screenshot_dir, exist_ok=True)
-
-            # Generate filename with test name, status, and timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{test_name}_{status}_{timestamp}.png"
-            filepath = os.path.join(screenshot_dir, filename)
-
-            await self.page.screenshot(path=filepath)
-            self.logger.info(f"Screenshot saved: {filepath}")
+            # 인코딩/디스크 쓰기는 백그라운드 아티팩트 작성기에서 처리
+            filepath = await save_screenshot(self.page, self.config, f"{test_name}_{status}")
+            self.logger.info(f"Screenshot queued: {filepath}")
             return filepath
         except Exception as e:
             self.logger.error(f"Failed to take screenshot: {e}")
@@ -625,15 +623,9 @@ class SiteDetailPage:
                 """)
                 self.logger.info("Clicked Add Plan submit button via JavaScript")
                 
-                # 로딩 마스크가 사라질 때까지 대기
-                try:
-                    await self.page.wait_for_selector(".el-loading-mask", state="hidden", timeout=30000)
-                    self.logger.info("Loading mask disappeared")
-                except Exception as e:
-                    self.logger.warning(f"Loading mask wait timeout: {e}")
-                
-                # 추가 대기
-                await asyncio.sleep(3)
+                # 로딩 마스크가 사라지고 Add Plan 다이얼로그가 닫힐 때까지 대기
+                await self.waits.loading_mask_gone(timeout=30000)
+                await self.waits.dialog_closed(self.selectors["add_plan_dialog"], timeout=5000, replaces_sleep=3)
                 self.logger.info("About to return True from click_add_plan_submit (JavaScript path)")
                 return True
                 
@@ -648,7 +640,7 @@ class SiteDetailPage:
                     self.logger.info("Clicked Add Plan submit button via normal click")
                     
                     # 모달이 닫힐 때까지 대기
-                    await asyncio.sleep(3)
+                    await self.waits.dialog_closed(self.selectors["add_plan_dialog"], timeout=5000, replaces_sleep=3)
                     self.logger.info("About to return True from click_add_plan_submit (normal click path)")
                     return True
                 else:
@@ -660,79 +652,65 @@ class SiteDetailPage:
             return False
 
     async def wait_for_plan_creation_completion(self, max_wait_time: int = 120) -> bool:
-        """플랜 생성 완료까지 대기 (요소가 실제로 로드되면 동작)"""
+        """플랜 생성 완료까지 대기 (DOM 변경 시마다 완료 신호를 검사하고 감지 즉시 반환)"""
         try:
             self.logger.info("Waiting for plan creation completion...")
             
-            # 최대 대기 시간 (초 단위)
-            start_time = asyncio.get_event_loop().time()
-            
-            while (asyncio.get_event_loop().time() - start_time) < max_wait_time:
-                try:
-                    # 1. 서베이 생성 모달이 나타났는지 확인
-                    survey_modal = await self.page.query_selector(self.selectors["survey_creation_modal"])
-                    if survey_modal and await survey_modal.is_visible():
-                        self.logger.info("Survey creation modal appeared - plan creation completed!")
-                        return True
-                    
-                    # 2. New Survey 버튼이 나타났는지 확인
-                    new_survey_btn = await self.page.query_selector(self.selectors["new_survey_button"])
-                    if new_survey_btn and await new_survey_btn.is_visible():
-                        self.logger.info("New Survey button appeared - plan creation completed!")
-                        return True
+            # 서베이 생성 모달 / New survey 버튼 / 성공 메시지 중 하나가 보이면 그 신호 문자열을 반환
+            # (polling="mutation": DOM 변경마다 재검사, 페이지 이동 후에도 새 문서에서 계속 대기)
+            handle = await self.page.wait_for_function("""
+                () => {
+                    const isVisible = (el) => {
+                        if (!el || !el.getClientRects().length) return false;
+                        const style = getComputedStyle(el);
+                        return style.visibility !== 'hidden' && style.display !== 'none';
+                    };
+                    const hasText = (el, text) => (el.textContent || '').toLowerCase().includes(text);
                     
-                    # 3. 페이지에서 "New survey" 텍스트가 포함된 버튼이 나타났는지 확인
-                    all_buttons = await self.page.query_selector_all("button")
-                    for button in all_buttons:
-                        try:
-                            button_text = await button.text_content()
-                            if button_text and "new survey" in button_text.lower():
-                                if await button.is_visible():
-                                    self.logger.info("New Survey button found via text search - plan creation completed!")
-                                    self.logger.info("About to return True from wait_for_plan_creation_completion")
-                                    return True
-                        except Exception:
-                            continue
-                    
-                    # 4. 성공 메시지나 알림이 나타났는지 확인
-                    success_elements = await self.page.query_selector_all("[class*='success'], [class*='Success'], [class*='message'], [class*='alert']")
-                    for element in success_elements:
-                        try:
-                            if await element.is_visible():
-                                element_text = await element.text_content()
-                                if element_text and any(keyword in element_text.lower() for keyword in ['success', 'completed', 'created', 'added']):
-                                    self.logger.info(f"Success message appeared: {element_text} - plan creation completed!")
-                                    return True
-                        except Exception:
-                            continue
-                    
-                    # 5. 로딩 상태가 완료되었는지 확인
-                    loading_masks = await self.page.query_selector_all(".el-loading-mask, [class*='loading'], [class*='spinner']")
-                    loading_active = False
-                    for loading in loading_masks:
-                        try:
-                            if await loading.is_visible():
-                                loading_active = True
-                                break
-                        except Exception:
-                            continue
-                    
-                    if not loading_active:
-                        # 로딩이 완료되었지만 아직 요소가 나타나지 않았다면 잠시 대기
-                        await asyncio.sleep(1)
-                        continue
-                    
-                    # 로딩 중이면 잠시 대기
-                    await asyncio.sleep(2)
-                    
-                except Exception as e:
-                    self.logger.debug(f"Element check iteration error: {e}")
-                    await asyncio.sleep(1)
-                    continue
+                    // 1. 서베이 생성 모달 (survey_creation_modal)
+                    for (const dialog of document.querySelectorAll('.el-dialog')) {
+                        if ((dialog.textContent || '').includes('Create a new survey') && isVisible(dialog)) {
+                            return 'Survey creation modal appeared';
+                        }
+                    }
+                    // 2. New Survey 버튼 (new_survey_button 셀렉터와 동일한 클래스 조건)
+                    const newSurveyButtons = document.querySelectorAll(
+                        'button.el-button--primary.el-button--mini, button.create-survey-button'
+                    );
+                    for (const button of newSurveyButtons) {
+                        if (hasText(button, 'new survey') && isVisible(button)) {
+                            return 'New Survey button appeared';
+                        }
+                    }
+                    // 3. "New survey" 텍스트가 포함된 임의의 버튼
+                    for (const button of document.querySelectorAll('button')) {
+                        if (hasText(button, 'new survey') && isVisible(button)) {
+                            return 'New Survey button found via text search';
+                        }
+                    }
+                    // 4. 성공 메시지나 알림
+                    const messages = document.querySelectorAll(
+                        "[class*='success'], [class*='Success'], [class*='message'], [class*='alert']"
+                    );
+                    for (const element of messages) {
+                        const text = (element.textContent || '').trim();
+                        if (['success', 'completed', 'created', 'added'].some(k => text.toLowerCase().includes(k))
+                                && isVisible(element)) {
+                            return `Success message appeared: ${text}`;
+                        }
+                    }
+                    return null;
+                }
+            """, timeout=max_wait_time * 1000, polling="mutation")
+            
+            signal = await handle.json_value()
+            await handle.dispose()
+            self.logger.info(f"{signal} - plan creation completed!")
+            return True
             
+        except PlaywrightTimeoutError:
             self.logger.warning(f"Plan creation completion not confirmed within {max_wait_time} seconds")
             return False
-            
         except Exception as e:
             self.logger.error(f"Error waiting for plan creation completion: {e}")
             return False
@@ -762,7 +740,7 @@ class SiteDetailPage:
                 self.logger.info("Clicked X button to close survey creation modal")
                 
                 # 모달이 닫힐 때까지 대기
-                await asyncio.sleep(2)
+                await self.waits.dialog_closed(self.selectors["survey_creation_modal"], timeout=5000, replaces_sleep=2)
                 return True
             else:
                 self.logger.warning("Survey creation modal close button not found")
@@ -999,8 +977,11 @@ class SiteDetailPage:
                         if close_button:
                             await close_button.click()
                             self.logger.info("Closed hidden modal")
-                            # 닫힘 반영 대기
-                            await self.page.wait_for_timeout(200)
+                            # 닫힘 애니메이션(다이얼로그/배경 마스크 leave 트랜지션)이 끝날 때까지 대기
+                            await self.waits.dialog_closed(
+                                ".dialog-fade-leave-active, .v-modal-leave, .v-modal-leave-active",
+                                timeout=1000, replaces_sleep=0.2,
+                            )
                 except Exception as e:
                     continue
             
@@ -1029,32 +1010,14 @@ class SiteDetailPage:
     async def create_new_survey(self, survey_name: str) -> bool:
         """새 서베이 생성"""
         try:
-            # New Survey 모달이 나타날 때까지 대기 (여러 방법 시도)
-            modal_found = False
-            
-            # 방법 1: 기본 셀렉터로 대기
-            try:
-                await self.page.wait_for_selector(self.selectors["new_survey_modal"], timeout=5000)
-                modal_found = True
-                self.logger.info("New Survey modal found with basic selector")
-            except:
-                pass
-            
-            # 방법 2: 모달이 보일 때까지 대기
-            if not modal_found:
-                for attempt in range(10):
-                    if await self.is_new_survey_modal_visible():
-                        modal_found = True
-                        self.logger.info("New Survey modal found with visibility check")
-                        break
-                    await asyncio.sleep(1)
-            
-            if not modal_found:
+            # New Survey 모달이 나타날 때까지 대기
+            if not await self.waits.dialog_opened(self.selectors["new_survey_modal"], timeout=15000):
                 self.logger.error("New Survey modal not found after waiting")
                 return False
+            self.logger.info("New Survey modal found")
             
-            # 모달이 완전히 로드될 때까지 추가 대기
-            await asyncio.sleep(3)
+            # 모달 입력창이 입력 가능해질 때까지 대기
+            await self.waits.input_enabled(".el-dialog.create-survey-dialog input", timeout=5000, replaces_sleep=3)
             
             # 서베이 이름 입력 (여러 방법 시도)
             name_input = None
@@ -1079,7 +1042,10 @@ class SiteDetailPage:
                 await name_input.clear()
                 await name_input.fill(survey_name)
                 self.logger.info(f"Entered survey name: {survey_name}")
-                await asyncio.sleep(1)
+                
+                # 이름 입력 후 Add 버튼이 활성화될 때까지 대기
+                await self.waits.input_enabled(".el-dialog.create-survey-dialog .el-button--primary",
+                                               timeout=3000, replaces_sleep=1)
                 
                 # Add 버튼 클릭 (여러 방법 시도)
                 add_button = None
@@ -1105,7 +1071,7 @@ class SiteDetailPage:
                 if add_button:
                     await add_button.click()
                     self.logger.info("Clicked Add button to create survey")
-                    await asyncio.sleep(3)
+                    await self.waits.dialog_closed(self.selectors["new_survey_modal"], timeout=10000, replaces_sleep=3)
                     return True
                 else:
                     self.logger.warning("Add button not found in new survey modal")
@@ -1125,7 +1091,7 @@ class SiteDetailPage:
             if close_button:
                 await close_button.click()
                 self.logger.info("New survey modal closed")
-                await asyncio.sleep(2)
+                await self.waits.dialog_closed(self.selectors["new_survey_modal"], timeout=5000, replaces_sleep=2)
                 return True
             else:
                 self.logger.warning("New survey modal close button not found")
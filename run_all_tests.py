@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """
-Run all tests in sequence
+Run all tests in sequence (or concurrently with --concurrency N)
 """
 
+import argparse
 import asyncio
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 
@@ -12,6 +14,12 @@ from datetime import datetime
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from utils.browser_manager import BrowserFactory, BrowserHost
+from utils.config_loader import config_loader
+from utils.flow_scheduler import run_flows, print_timing_summary
+from utils.run_history import RunHistory
+from utils.adaptive_timeout import DeadlinePolicy
+from utils.spans import span_recorder, step_totals
 from tests.smoke.test_dashboard import test_dashboard_functions
 from tests.smoke.test_site_creation import test_create_site_final
 from tests.smoke.test_site_detail import test_site_detail_pom_simple
@@ -19,51 +27,58 @@ from tests.smoke.test_global_navigation import test_global_navigation
 from tests.smoke.test_search_and_site_selection import test_search_and_site_selection
 
 
-async def run_all_tests():
-    """Run all tests in sequence"""
+async def run_all_tests(concurrency: int = 1):
+    """Run all tests (sequentially, or up to ``concurrency`` at a time)"""
     print("🚀 전체 테스트 실행 시작")
     print("=" * 80)
     print(f"📅 실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"🔀 동시 실행 수: {concurrency}")
     print("=" * 80)
     
-    test_results = []
-    
-    # 테스트 목록
+    # 테스트 목록 (이름, 함수, 순차 실행 여부 - 포털 데이터를 변경하는 플로우는 다른 플로우와 겹치지 않게 실행)
     tests = [
-        ("대시보드 테스트", test_dashboard_functions),
-        ("사이트 생성 테스트", test_create_site_final),
-        ("사이트 상세 페이지 테스트", test_site_detail_pom_simple),
-        ("글로벌 네비게이션 테스트", test_global_navigation),
-        ("검색 및 사이트 선택 테스트", test_search_and_site_selection),
+        ("대시보드 테스트", test_dashboard_functions, False),
+        ("사이트 생성 테스트", test_create_site_final, True),
+        ("사이트 상세 페이지 테스트", test_site_detail_pom_simple, False),
+        ("글로벌 네비게이션 테스트", test_global_navigation, False),
+        ("검색 및 사이트 선택 테스트", test_search_and_site_selection, False),
     ]
     
     total_tests = len(tests)
-    passed_tests = 0
-    failed_tests = 0
     
-    for i, (test_name, test_func) in enumerate(tests, 1):
-        print(f"\n📋 테스트 {i}/{total_tests}: {test_name}")
-        print("-" * 60)
-        
-        try:
-            start_time = datetime.now()
-            success = await test_func("dev")
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            
-            if success:
-                print(f"✅ {test_name} 성공 (소요시간: {duration:.2f}초)")
-                passed_tests += 1
-                test_results.append((test_name, "PASS", duration))
-            else:
-                print(f"❌ {test_name} 실패 (소요시간: {duration:.2f}초)")
-                failed_tests += 1
-                test_results.append((test_name, "FAIL", duration))
-                
-        except Exception as e:
-            print(f"❌ {test_name} 오류 발생: {e}")
-            failed_tests += 1
-            test_results.append((test_name, "ERROR", 0))
+    # BEAMO_ENV 기준 환경 (이력 기록/제한 시간도 같은 환경으로 집계)
+    environment = config_loader.get_current_environment()
+    
+    started_at = time.time()
+    # pytest 실행과 같은 이력(p99) 기반 플로우별 제한 시간
+    policy = DeadlinePolicy.from_history(environment)
+    deadlines = {test_name: policy.deadline(flow_nodeid(test_func))[0] for test_name, test_func, _ in tests}
+    
+    # 동시 실행 시 컨텍스트를 미리 준비해 두고 플로우끼리 돌려 씀
+    # (대부분의 플로우가 쓰는 functional 프로필, 다른 프로필의 플로우는 풀을 건너뜀)
+    pool = None
+    if concurrency > 1:
+        pool = await BrowserFactory.create_pool(
+            config_loader.load_config(environment), size=concurrency, network_profile="functional"
+        )
+    
+    wall_start = time.perf_counter()
+    try:
+        results = await run_flows(
+            [(test_name, lambda test_func=test_func: test_func(environment), serial)
+             for test_name, test_func, serial in tests],
+            concurrency,
+            deadlines,
+            pool=pool,
+        )
+    finally:
+        if pool:
+            await pool.close()
+    wall_time = time.perf_counter() - wall_start
+    
+    test_results = [(result.name, result.status, result.duration) for result in results]
+    passed_tests = sum(1 for result in results if result.passed)
+    failed_tests = total_tests - passed_tests
     
     # 결과 요약
     print("\n" + "=" * 80)
@@ -80,6 +95,9 @@ async def run_all_tests():
     print(f"   실패: {failed_tests}개")
     print(f"   성공률: {(passed_tests/total_tests)*100:.1f}%")
     
+    print_timing_summary(results, wall_time, concurrency)
+    record_history(tests, results, started_at, "success" if failed_tests == 0 else "failure", environment)
+    
     if failed_tests == 0:
         print("\n🎉 모든 테스트가 성공했습니다!")
     else:
@@ -92,10 +110,48 @@ async def run_all_tests():
     return failed_tests == 0
 
 
+def flow_nodeid(test_func) -> str:
+    """pytest node ID of a test function, so both runners share history."""
+    return f"{test_func.__module__.replace('.', '/')}.py::{test_func.__name__}"
+
+
+def record_history(tests, results, started_at: float, status: str, environment: str):
+    """Store this run in the run-history DB under the same node IDs pytest uses."""
+    outcomes = {"PASS": "passed", "FAIL": "failed", "ERROR": "error"}
+    nodeids = {test_name: flow_nodeid(test_func) for test_name, test_func, _ in tests}
+    try:
+        history = RunHistory()
+        run_id = history.start_run(environment, runner="run_all_tests", started_at=started_at)
+        history.record_results(run_id, environment, [
+            {"nodeid": nodeids[result.name], "outcome": outcomes.get(result.status, "error"), "duration": result.duration}
+            for result in results
+        ])
+        # span 은 플로우 이름으로 기록되므로 pytest 와 같은 node ID 로 바꿔 저장
+        steps = step_totals(str(span_recorder.path(environment)), since=started_at)
+        history.record_steps(run_id, environment, {
+            (nodeids.get(test, test), step): entry for (test, step), entry in steps.items()
+        })
+        history.finish_run(run_id, status)
+        print(f"🗄️ 실행 이력 기록: run #{run_id}")
+    except Exception as e:
+        print(f"⚠️ 실행 이력 기록 실패: {e}")
+
+
 async def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="Beamo 전체 테스트 실행")
+    parser.add_argument(
+        "--concurrency", "-c", type=int, default=1,
+        help="동시에 실행할 테스트 수 (기본값: 1, 순차 실행)"
+    )
+    args = parser.parse_args()
+    
     try:
-        success = await run_all_tests()
+        try:
+            success = await run_all_tests(args.concurrency)
+        finally:
+            # 테스트 간 공유한 브라우저 종료
+            await BrowserHost.shutdown()
         if success:
             print("🎉 전체 테스트 성공!")
             sys.exit(0)
@@ -4,19 +4,24 @@ Beamo 전체 테스트 실행 및 이메일 리포트 전송
 """
 
 import asyncio
+import os
 import sys
 import time
-import subprocess
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
-import re
 
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from utils.config_loader import get_config
+from utils.artifacts import screenshot_globs
+from utils import result_stream
+from utils.run_history import RunHistory
+from utils.flakiness import FlakinessDetector, QuarantineLane
+from utils.spans import span_recorder, step_totals
+from utils.streaming_executor import StreamingExecutor, ExecutionResult
 from utils.email_sender import EmailSender
 
 # 로깅 설정
@@ -35,11 +40,26 @@ logger = logging.getLogger(__name__)
 class TestRunnerWithEmail:
     """테스트 실행 및 이메일 전송을 담당하는 클래스"""
     
-    def __init__(self, environment: str = "dev"):
+    def __init__(self, environment: str = "dev", timeout: int = 300, quarantine: bool = True, retries: int = 2):
         self.environment = environment
+        self.timeout = timeout
+        self.quarantine = quarantine
+        self.retries = retries
+        self.quarantine_lane: Optional[QuarantineLane] = None
         self.config = get_config(environment)
         self.start_time = None
         self.end_time = None
+        self.results_path = Path(result_stream.default_path(environment))
+        self.results: List[Dict[str, Any]] = []
+        self.result_tail: Optional[result_stream.ResultTail] = None
+        self._last_poll = 0.0
+        
+        # 실행 이력 DB (없거나 열 수 없어도 테스트 실행에는 영향 없음)
+        try:
+            self.history: Optional[RunHistory] = RunHistory()
+        except Exception as e:
+            logger.warning(f"실행 이력 DB를 열 수 없습니다: {e}")
+            self.history = None
         
         # 이메일 설정 확인
         if not hasattr(self.config, 'email') or not self.config.email:
@@ -66,12 +86,19 @@ class TestRunnerWithEmail:
         self.start_time = time.time()
         
         try:
+            self._plan_quarantine_lane()
             result = self._execute_pytest()
+            # 격리 레인은 같은 포털 계정의 데이터를 건드리므로 메인 레인이 끝난 뒤 실행
+            self._run_quarantine_lane()
             self.end_time = time.time()
             execution_time = self.end_time - self.start_time
             
             test_summary = self._generate_test_summary(result, execution_time)
-            logger.info(f"✅ 테스트 실행 완료 (소요시간: {execution_time:.1f}초)")
+            self._add_quarantine_results(test_summary)
+            if result.timed_out:
+                logger.warning(f"⏰ 테스트 실행 시간 초과 ({self.timeout}초), 완료된 {test_summary['total_tests']}개 결과만 집계")
+            else:
+                logger.info(f"✅ 테스트 실행 완료 (소요시간: {execution_time:.1f}초)")
             return test_summary
             
         except Exception as e:
@@ -90,8 +117,12 @@ class TestRunnerWithEmail:
                 "error_message": str(e)
             }
     
-    def _execute_pytest(self) -> subprocess.CompletedProcess:
-        """pytest 실행"""
+    def _execute_pytest(self) -> ExecutionResult:
+        """pytest 실행 (출력은 콘솔/로그 파일로 실시간 전달, 테스트별 결과는 results.jsonl 로 스트리밍)"""
+        # 이전 실행 결과가 섞이지 않도록 스트림 파일 초기화
+        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+        self.results_path.unlink(missing_ok=True)
+        
         cmd = [
             sys.executable, "-m", "pytest",
             "tests",
@@ -100,65 +131,146 @@ class TestRunnerWithEmail:
             f"--html=reports/{self.environment}/test_report.html",
             "--self-contained-html",
             "--capture=no",
+            f"--result-stream={self.results_path}",
         ]
+        # 격리된 flaky 테스트는 별도 레인에서 실행하므로 빠른 메인 레인에서 제외
+        if self.quarantine_lane:
+            cmd += [f"--deselect={nodeid}" for nodeid in self.quarantine_lane.scores]
         
         logger.info(f"실행 명령어: {' '.join(cmd)}")
         
-        result = subprocess.run(
+        self.result_tail = result_stream.ResultTail(str(self.results_path))
+        executor = StreamingExecutor(f"reports/{self.environment}/pytest_output.log")
+        result = executor.run(
             cmd,
-            capture_output=True,
-            text=True,
-            cwd=project_root,
-            timeout=300
+            cwd=str(project_root),
+            env={**os.environ, "BEAMO_ENV": self.environment},
+            timeout=self.timeout,
+            on_line=self._on_output_line,
         )
         
+        # 타임아웃으로 중단된 경우에도 그때까지 기록된 결과는 모두 읽음
+        self._poll_results()
         return result
     
-    def _generate_test_summary(self, result: subprocess.CompletedProcess, execution_time: float) -> Dict[str, Any]:
-        """테스트 결과 요약 생성"""
-        output = result.stdout + result.stderr
-        
-        # pytest 세션 결과에서 추출
-        passed_tests = 0
-        failed_tests = 0
-        skipped_tests = 0
-        
-        if "passed in" in output:
-            passed_match = re.search(r'(\d+) passed', output)
-            if passed_match:
-                passed_tests = int(passed_match.group(1))
-        
-        if "failed" in output:
-            failed_match = re.search(r'(\d+) failed', output)
-            if failed_match:
-                failed_tests = int(failed_match.group(1))
-        
-        total_tests = passed_tests + failed_tests + skipped_tests
+    def _plan_quarantine_lane(self) -> None:
+        """실행 이력상 flaky 점수가 높은 테스트를 재시도 포함 비차단 레인으로 분리 (메인 레인에서 제외)"""
+        if not self.quarantine or self.history is None:
+            return
+        try:
+            scores = FlakinessDetector(self.history, self.environment).quarantined()
+        except Exception as e:
+            logger.warning(f"flaky 테스트 판별 실패: {e}")
+            return
+        if not scores:
+            return
+        for nodeid, score in scores.items():
+            logger.info(f"🧪 격리 레인으로 실행: {nodeid} (flaky 점수 {score:.2f})")
+        self.quarantine_lane = QuarantineLane(self.environment, scores, retries=self.retries,
+                                              cwd=str(project_root))
+    
+    def _run_quarantine_lane(self, budget: Optional[float] = None) -> None:
+        """
+        격리 레인 실행 (기본 예산은 남은 실행 시간, 지나면 pytest/브라우저 프로세스까지 종료)
+        """
+        if not self.quarantine_lane:
+            return
+        remaining = budget if budget is not None else self.timeout - (time.time() - self.start_time)
+        if remaining <= 0:
+            logger.warning("⏰ 남은 실행 시간이 없어 격리 레인을 건너뜁니다")
+            return
+        self.quarantine_lane.timeout = remaining
+        self.quarantine_lane.start()
+        self.quarantine_lane.join(timeout=remaining)
+    
+    def _add_quarantine_results(self, test_summary: Dict[str, Any]) -> None:
+        """격리 레인 결과를 요약에 추가 (실행 상태/성공 여부에는 반영하지 않음)"""
+        if not self.quarantine_lane:
+            return
+        results = list(self.quarantine_lane.results)
+        test_summary["quarantine"] = results
+        flaky = sum(1 for result in results if result["outcome"] == "flaky")
+        failed = sum(1 for result in results if result["outcome"] in ("failed", "error"))
+        logger.info(f"🧪 격리 레인 결과: {len(results)}개 중 재시도 후 통과 {flaky}, 실패 {failed} (실행 상태에는 미반영)")
+    
+    def _on_output_line(self, line: str) -> None:
+        """pytest 출력 줄마다 호출 — 결과 스트림은 최대 1초에 한 번만 읽음."""
+        now = time.monotonic()
+        if now - self._last_poll >= 1.0:
+            self._last_poll = now
+            self._poll_results()
+    
+    def _poll_results(self) -> None:
+        new_results = self.result_tail.poll()
+        if new_results:
+            counts = result_stream.summarize(self.result_tail.results)
+            logger.info(
+                f"📈 진행: {counts['total_tests']}개 완료 "
+                f"(성공 {counts['passed_tests']}, 실패 {counts['failed_tests']}, 건너뜀 {counts['skipped_tests']})"
+            )
+    
+    def _generate_test_summary(self, result: ExecutionResult, execution_time: float) -> Dict[str, Any]:
+        """테스트 결과 요약 생성 (pytest 출력 대신 테스트별 결과 스트림 사용)"""
+        self.results = self.result_tail.results if self.result_tail else result_stream.read_results(str(self.results_path))
+        counts = result_stream.summarize(self.results)
         
         # 상태 판단
-        if result.returncode == 0:
+        if result.timed_out:
+            status = "timeout"
+        elif result.returncode == 0:
             status = "success"
-        elif failed_tests > 0:
+        elif counts["failed_tests"] > 0:
             status = "failure"
         else:
             status = "error"
         
         summary = {
-            "total_tests": total_tests,
-            "passed_tests": passed_tests,
-            "failed_tests": failed_tests,
-            "skipped_tests": skipped_tests,
+            "total_tests": counts["total_tests"],
+            "passed_tests": counts["passed_tests"],
+            "failed_tests": counts["failed_tests"],
+            "error_tests": counts["error_tests"],
+            "skipped_tests": counts["skipped_tests"],
             "execution_time": f"{execution_time:.1f}s",
             "environment": self.environment,
             "status": status,
-            "return_code": result.returncode
+            "return_code": result.returncode,
+            "timed_out": result.timed_out,
+            "failures": counts["failures"],
+            "slowest_tests": result_stream.slowest(self.results, limit=5),
         }
         
-        logger.info(f"📊 테스트 결과 요약: {summary}")
+        logger.info(
+            f"📊 테스트 결과 요약: 전체 {summary['total_tests']}, 성공 {summary['passed_tests']}, "
+            f"실패 {summary['failed_tests']} (오류 {summary['error_tests']}), 건너뜀 {summary['skipped_tests']}"
+        )
         return summary
     
+    def record_history(self, test_summary: Dict[str, Any]) -> None:
+        """이번 실행(환경/커밋/포털 빌드/시작·종료 시각)과 테스트별 결과, 단계별 소요시간을 이력 DB에 기록"""
+        if self.history is None or self.start_time is None:
+            return
+        try:
+            run_id = self.history.start_run(self.environment, runner=type(self).__name__, started_at=self.start_time)
+            quarantined = self.quarantine_lane.results if self.quarantine_lane else []
+            self.history.record_results(run_id, self.environment, self.results + quarantined)
+            # 페이지 객체 단계 소요시간은 이번 실행 시작 이후의 span 만 집계
+            spans_path = span_recorder.path(self.environment)
+            self.history.record_steps(run_id, self.environment, step_totals(str(spans_path), since=self.start_time))
+            self.history.finish_run(run_id, test_summary.get("status", "error"), ended_at=self.end_time)
+            logger.info(f"🗄️ 실행 이력 기록 완료 (run #{run_id}, 테스트 {len(self.results)}개)")
+        except Exception as e:
+            logger.warning(f"실행 이력 기록 실패: {e}")
+    
     def collect_artifacts(self) -> tuple[List[str], List[str]]:
         """테스트 아티팩트 수집"""
+        recorded = result_stream.artifacts(self.results)
+        if recorded:
+            # 결과 스트림에 기록된 이번 실행의 실패 산출물만 사용
+            screenshots = [path for path in recorded if Path(path).parent.name == "screenshots"]
+            videos = [path for path in recorded if Path(path).parent.name in ("videos", "traces")]
+            logger.info(f"📎 수집된 아티팩트: 스크린샷 {len(screenshots)}개, 동영상/트레이스 {len(videos)}개")
+            return screenshots, videos
+        
         reports_dir = Path(f"reports/{self.environment}")
         
         screenshots = []
@@ -167,11 +279,16 @@ class TestRunnerWithEmail:
         if reports_dir.exists():
             screenshot_dir = reports_dir / "screenshots"
             if screenshot_dir.exists():
-                screenshots = [str(f) for f in screenshot_dir.glob("*.png")]
+                screenshots = [str(f) for pattern in screenshot_globs() for f in screenshot_dir.glob(pattern)]
             
             video_dir = reports_dir / "videos"
             if video_dir.exists():
                 videos = [str(f) for f in video_dir.glob("*.webm")]
+            
+            # 실패한 테스트의 Playwright 트레이스도 동영상과 함께 첨부
+            trace_dir = reports_dir / "traces"
+            if trace_dir.exists():
+                videos += [str(f) for f in trace_dir.glob("*.zip")]
         
         logger.info(f"📎 수집된 아티팩트: 스크린샷 {len(screenshots)}개, 동영상 {len(videos)}개")
         return screenshots, videos
@@ -201,6 +318,7 @@ class TestRunnerWithEmail:
         """전체 테스트 실행 및 이메일 전송"""
         try:
             test_summary = self.run_all_tests()
+            self.record_history(test_summary)
             
             if self.email_enabled and test_summary.get("send_on_completion", True):
                 email_success = self.send_email_report(test_summary)
@@ -232,10 +350,23 @@ async def main():
         "--no-email", action="store_true",
         help="이메일 전송 비활성화"
     )
+    parser.add_argument(
+        "--no-quarantine", action="store_true",
+        help="flaky 테스트 격리 레인 비활성화 (모든 테스트를 메인 레인에서 실행)"
+    )
+    parser.add_argument(
+        "--retries", type=int, default=2,
+        help="격리 레인에서 실패한 테스트 재시도 횟수 (기본값: 2)"
+    )
+    parser.add_argument(
+        "--timeout", type=int, default=300,
+        help="전체 pytest 실행 제한 시간(초), 초과 시 완료된 결과만 집계 (기본값: 300)"
+    )
     
     args = parser.parse_args()
     
-    runner = TestRunnerWithEmail(args.environment)
+    runner = TestRunnerWithEmail(args.environment, timeout=args.timeout,
+                                 quarantine=not args.no_quarantine, retries=args.retries)
     
     if args.no_email:
         runner.email_enabled = False
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Beamo 테스트를 여러 pytest 프로세스로 분할 실행 (기록된 소요시간 기반 LPT 분배)
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, List
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from run_all_tests_with_email import TestRunnerWithEmail, logger
+from utils.streaming_executor import terminate_process_group
+from utils.test_sharding import DurationStore, plan_shards, collect_nodeids, parse_junit
+
+
+class ShardedTestRunner(TestRunnerWithEmail):
+    """pytest 스위트를 K개 워커 프로세스로 나눠 실행하고 결과를 합쳐 이메일로 전송"""
+
+    def __init__(self, environment: str = "dev", shards: int = 2, test_path: str = "tests",
+                 shard_timeout: int = 600):
+        super().__init__(environment)
+        self.shards = shards
+        self.test_path = test_path
+        self.shard_timeout = shard_timeout
+        self.shard_dir = project_root / "reports" / environment / "shards"
+
+    def run_all_tests(self) -> Dict[str, Any]:
+        """샤드별 pytest 실행 후 결과 병합"""
+        logger.info(f"🚀 {self.environment} 환경에서 {self.shards}개 샤드로 전체 테스트 실행 시작")
+        self.start_time = time.time()
+
+        try:
+            nodeids = collect_nodeids(self.test_path, project_root)
+            if not nodeids:
+                raise RuntimeError(f"수집된 테스트가 없습니다: {self.test_path}")
+
+            # flaky 테스트는 격리 레인에서 따로 실행하고 샤드에는 안정적인 테스트만 분배
+            self._plan_quarantine_lane()
+            if self.quarantine_lane:
+                nodeids = [nodeid for nodeid in nodeids if nodeid not in self.quarantine_lane.scores]
+
+            # 포털 데이터를 공유하는(serial 마커) 테스트는 서로 겹치지 않도록 한 샤드에 고정
+            pinned = collect_nodeids(self.test_path, project_root, marker="serial")
+            durations = DurationStore(self.environment, history=self.history)
+            plan = plan_shards(nodeids, self.shards, durations.estimate, pinned=pinned)
+            for index, shard in enumerate(plan):
+                expected = sum(durations.estimate(nodeid) for nodeid in shard)
+                logger.info(f"📦 샤드 {index}: {len(shard)}개 테스트, 예상 소요시간 {expected:.1f}초")
+
+            results, return_codes = self._execute_shards(plan)
+            # 샤드와 같은 포털 데이터를 건드리지 않도록 격리 레인은 샤드가 모두 끝난 뒤 실행
+            # (샤드는 shard_timeout 으로 따로 제한되므로 격리 레인에는 self.timeout 예산을 줌)
+            self._run_quarantine_lane(budget=self.timeout)
+
+            for nodeid, result in results.items():
+                durations.record(nodeid, result["duration"])
+            durations.save()
+            # 이력 DB 기록용 테스트별 결과 (결과 스트림과 같은 형태)
+            self.results = [{"nodeid": nodeid, **result} for nodeid, result in results.items()]
+
+            self.end_time = time.time()
+            execution_time = self.end_time - self.start_time
+            test_summary = self._merge_results(results, return_codes, execution_time)
+            self._add_quarantine_results(test_summary)
+            logger.info(f"✅ 테스트 실행 완료 (소요시간: {execution_time:.1f}초)")
+            return test_summary
+
+        except Exception as e:
+            logger.error(f"❌ 테스트 실행 중 오류 발생: {e}")
+            self.end_time = time.time()
+            execution_time = self.end_time - self.start_time
+
+            return {
+                "total_tests": 0,
+                "passed_tests": 0,
+                "failed_tests": 0,
+                "skipped_tests": 0,
+                "execution_time": f"{execution_time:.1f}s",
+                "environment": self.environment,
+                "status": "error",
+                "error_message": str(e)
+            }
+
+    def _execute_shards(self, plan: List[List[str]]) -> tuple[Dict[str, Dict], List[int]]:
+        """샤드마다 pytest 프로세스를 동시에 실행하고 JUnit XML 결과를 수집"""
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        env = dict(os.environ, BEAMO_ENV=self.environment)
+
+        workers = []
+        for index, shard in enumerate(plan):
+            xml_path = self.shard_dir / f"shard_{index}.xml"
+            log_file = open(self.shard_dir / f"shard_{index}.log", 'w', encoding='utf-8')
+            cmd = [
+                sys.executable, "-m", "pytest",
+                *shard,
+                "-v",
+                "--tb=short",
+                f"--junitxml={xml_path}",
+            ]
+            # 타임아웃 시 샤드가 띄운 브라우저까지 함께 종료하기 위해 별도 프로세스 그룹으로 실행
+            process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT, cwd=project_root, env=env,
+                                       start_new_session=(os.name == "posix"))
+            workers.append((index, process, log_file, xml_path, shard))
+
+        deadline = time.time() + self.shard_timeout
+        results: Dict[str, Dict] = {}
+        return_codes: List[int] = []
+
+        for index, process, log_file, xml_path, shard in workers:
+            try:
+                return_codes.append(process.wait(timeout=max(0, deadline - time.time())))
+            except subprocess.TimeoutExpired:
+                logger.error(f"⏰ 샤드 {index} 타임아웃 ({self.shard_timeout}초 초과) - 프로세스 그룹 종료")
+                terminate_process_group(process)
+                return_codes.append(process.returncode)
+            finally:
+                log_file.close()
+
+            shard_results = parse_junit(xml_path, shard)
+            logger.info(f"📦 샤드 {index} 종료 (코드 {process.returncode}, 결과 {len(shard_results)}개)")
+            # 결과를 남기지 못한 테스트(타임아웃/비정상 종료)는 빠뜨리지 않고 오류로 집계
+            missing = [nodeid for nodeid in shard if nodeid not in shard_results]
+            if missing:
+                logger.error(f"📦 샤드 {index}: 결과 없는 테스트 {len(missing)}개를 오류로 집계")
+                for nodeid in missing:
+                    shard_results[nodeid] = {"outcome": "error", "duration": 0.0}
+            results.update(shard_results)
+
+        return results, return_codes
+
+    def _merge_results(self, results: Dict[str, Dict], return_codes: List[int],
+                       execution_time: float) -> Dict[str, Any]:
+        """샤드 결과를 TestRunnerWithEmail 요약 형식으로 병합"""
+        outcomes = [result["outcome"] for result in results.values()]
+        passed_tests = outcomes.count("passed")
+        failed_tests = outcomes.count("failed") + outcomes.count("error")
+        skipped_tests = outcomes.count("skipped")
+
+        # pytest 종료 코드 5 = 수집된 테스트 없음
+        if all(code in (0, 5) for code in return_codes):
+            status = "success"
+        elif failed_tests > 0:
+            status = "failure"
+        else:
+            status = "error"
+
+        summary = {
+            "total_tests": passed_tests + failed_tests + skipped_tests,
+            "passed_tests": passed_tests,
+            "failed_tests": failed_tests,
+            "skipped_tests": skipped_tests,
+            "execution_time": f"{execution_time:.1f}s",
+            "environment": self.environment,
+            "status": status,
+            # 시그널로 종료된 샤드(음수 코드)도 드러나도록 0이 아닌 첫 코드를 사용
+            "return_code": next((code for code in return_codes if code != 0), 0),
+            "shards": len(return_codes),
+        }
+
+        logger.info(f"📊 테스트 결과 요약: {summary}")
+        return summary
+
+
+async def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Beamo 테스트 분할 실행 및 이메일 리포트 전송")
+    parser.add_argument(
+        "--environment", "-e", default="dev",
+        choices=["dev", "stage", "live"],
+        help="실행할 환경 (기본값: dev)"
+    )
+    parser.add_argument(
+        "--shards", "-k", type=int, default=2,
+        help="pytest 워커 프로세스 수 (기본값: 2)"
+    )
+    parser.add_argument(
+        "--tests", default="tests",
+        help="테스트 경로 (기본값: tests)"
+    )
+    parser.add_argument(
+        "--no-email", action="store_true",
+        help="이메일 전송 비활성화"
+    )
+
+    args = parser.parse_args()
+
+    runner = ShardedTestRunner(args.environment, args.shards, args.tests)
+
+    if args.no_email:
+        runner.email_enabled = False
+        logger.info("이메일 전송이 비활성화되었습니다.")
+
+    success = runner.run()
+
+    if success:
+        logger.info("✅ 모든 작업이 성공적으로 완료되었습니다.")
+        sys.exit(0)
+    else:
+        logger.error("❌ 일부 작업에서 오류가 발생했습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
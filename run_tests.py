@@ -3,8 +3,10 @@
 Main test runner for Beamo Automated Testing
 """
 
+import argparse
 import asyncio
 import sys
+import time
 from pathlib import Path
 
 # Add project root to Python path
@@ -12,11 +14,12 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from utils.config_loader import get_config
-from utils.browser_manager import BrowserFactory
+from utils.browser_manager import BrowserFactory, BrowserHost
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.site_detail_page import SiteDetailPage
 from pages.components.global_navigation import GlobalNavigation
+from utils.flow_scheduler import run_flows, print_timing_summary
 
 
 async def test_login():
@@ -53,16 +56,12 @@ async def test_dashboard():
     async with BrowserFactory.create(config) as browser_manager:
         # 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
-        
-        if not await login_page.is_logged_in():
+        if not await login_page.login_with_cache(space_id, email, password):
             print("❌ 로그인 실패")
             return False
         
@@ -86,16 +85,12 @@ async def test_site_creation():
     async with BrowserFactory.create(config) as browser_manager:
         # 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
-        
-        if not await login_page.is_logged_in():
+        if not await login_page.login_with_cache(space_id, email, password):
             print("❌ 로그인 실패")
             return False
         
@@ -136,16 +131,12 @@ async def test_global_navigation():
     async with BrowserFactory.create(config) as browser_manager:
         # 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
-        
-        if not await login_page.is_logged_in():
+        if not await login_page.login_with_cache(space_id, email, password):
             print("❌ 로그인 실패")
             return False
         
@@ -173,16 +164,12 @@ async def test_add_plan_dialog():
     async with BrowserFactory.create(config) as browser_manager:
         # 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
-        
-        if not await login_page.is_logged_in():
+        if not await login_page.login_with_cache(space_id, email, password):
             print("❌ 로그인 실패")
             return False
         
@@ -228,43 +215,53 @@ async def test_add_plan_dialog():
         return True
 
 
-async def run_all_tests():
-    """Run all tests"""
+async def run_all_tests(concurrency: int = 1):
+    """Run all tests (sequentially, or up to ``concurrency`` at a time)"""
     print("🚀 Beamo 자동화 테스트 시작")
+    print(f"🔀 동시 실행 수: {concurrency}")
     print("=" * 60)
     
+    # (이름, 함수, 순차 실행 여부) - 사이트를 생성하는 플로우는 다른 플로우와 겹치지 않게 실행
     tests = [
-        ("로그인", test_login),
-        ("대시보드", test_dashboard),
-        ("사이트 생성", test_site_creation),
-        ("글로벌 네비게이션", test_global_navigation),
-        ("Add a new plan 다이얼로그", test_add_plan_dialog),
+        ("로그인", test_login, False),
+        ("대시보드", test_dashboard, False),
+        ("사이트 생성", test_site_creation, True),
+        ("글로벌 네비게이션", test_global_navigation, False),
+        ("Add a new plan 다이얼로그", test_add_plan_dialog, True),
     ]
     
-    results = {}
+    # 동시 실행 시 컨텍스트를 미리 준비해 두고 플로우끼리 돌려 씀
+    pool = await BrowserFactory.create_pool(get_config("dev"), size=concurrency) if concurrency > 1 else None
     
-    for test_name, test_func in tests:
-        print(f"\n📋 {test_name} 테스트")
-        print("-" * 30)
-        
-        try:
-            success = await test_func()
-            results[test_name] = "✅ 성공" if success else "❌ 실패"
-        except Exception as e:
-            print(f"❌ {test_name} 테스트 오류: {e}")
-            results[test_name] = "❌ 오류"
+    wall_start = time.perf_counter()
+    try:
+        flow_results = await run_flows(tests, concurrency, pool=pool)
+    finally:
+        if pool:
+            await pool.close()
+    wall_time = time.perf_counter() - wall_start
+    
+    results = {}
+    for flow in flow_results:
+        if flow.status == "PASS":
+            results[flow.name] = "✅ 성공"
+        elif flow.status == "FAIL":
+            results[flow.name] = "❌ 실패"
+        else:
+            results[flow.name] = "❌ 오류"
     
     print("\n" + "=" * 60)
     print("📊 테스트 결과 요약")
     print("=" * 60)
     
-    for test_name, result in results.items():
-        print(f"{result} {test_name}")
+    for flow in flow_results:
+        print(f"{results[flow.name]} {flow.name} ({flow.duration:.2f}초)")
     
     success_count = sum(1 for result in results.values() if "성공" in result)
     total_count = len(results)
     
     print(f"\n📈 성공률: {success_count}/{total_count} ({success_count/total_count*100:.1f}%)")
+    print_timing_summary(flow_results, wall_time, concurrency)
     
     if success_count == total_count:
         print("🎉 모든 테스트 통과!")
@@ -276,7 +273,19 @@ async def run_all_tests():
 
 async def main():
     """Main function"""
-    await run_all_tests()
+    parser = argparse.ArgumentParser(description="Beamo 자동화 테스트 실행")
+    parser.add_argument(
+        "--concurrency", "-c", type=int, default=1,
+        help="동시에 실행할 테스트 수 (기본값: 1, 순차 실행)"
+    )
+    # Dockerfile CMD의 --env/--tags 등 다른 인자는 무시
+    args, _ = parser.parse_known_args()
+    
+    try:
+        await run_all_tests(args.concurrency)
+    finally:
+        # 테스트 간 공유한 브라우저 종료
+        await BrowserHost.shutdown()
 
 
 if __name__ == "__main__":
@@ -7,7 +7,6 @@ Settings Menu Analysis Test
 import asyncio
 import sys
 from pathlib import Path
-from functools import wraps
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
@@ -18,19 +17,6 @@ from utils.browser_manager import BrowserFactory
 from pages.login_page import LoginPage
 from pages.components.global_navigation import GlobalNavigation
 
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
 async def analyze_settings_menu(environment: str = "dev"):
     """설정 메뉴 요소 분석"""
     print(f"🔍 {environment.upper()} 환경 설정 메뉴 분석 시작...")
@@ -7,7 +7,6 @@ Gear Settings Dropdown Test
 import asyncio
 import sys
 from pathlib import Path
-from functools import wraps
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
@@ -18,19 +17,6 @@ from utils.browser_manager import BrowserFactory
 from pages.login_page import LoginPage
 from pages.components.global_navigation import GlobalNavigation
 
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
 async def test_gear_settings_dropdown(environment: str = "dev"):
     """톱니바퀴 설정 버튼 드롭다운 테스트"""
     print(f"🔍 {environment.upper()} 환경에서 톱니바퀴 설정 버튼 드롭다운 테스트...")
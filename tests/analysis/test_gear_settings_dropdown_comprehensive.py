@@ -8,7 +8,6 @@ import asyncio
 import sys
 import pytest
 from pathlib import Path
-from functools import wraps
 import time
 
 project_root = Path(__file__).parent.parent.parent
@@ -19,21 +18,9 @@ from utils.browser_manager import BrowserFactory
 from pages.login_page import LoginPage
 from pages.components.global_navigation import GlobalNavigation
 
-def timeout(seconds):
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 함수 실행 시간 초과 ({seconds}초)")
-                return False
-        return wrapper
-    return decorator
-
 @pytest.mark.p0
 @pytest.mark.env('dev')
-@timeout(120)  # 2분 타임아웃
+@pytest.mark.deadline(120)  # 히스토리가 쌓이기 전까지 2분
 async def test_gear_settings_dropdown_comprehensive(environment: str = "dev"):
     print(f"🔍 {environment.upper()} 환경에서 톱니바퀴 설정 드롭다운 종합 테스트...")
     config = get_config(environment)
@@ -8,7 +8,6 @@ import asyncio
 import sys
 import pytest
 from pathlib import Path
-from functools import wraps
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
@@ -19,22 +18,8 @@ from utils.browser_manager import BrowserFactory
 from pages.login_page import LoginPage
 from pages.components.global_navigation import GlobalNavigation
 
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
 @pytest.mark.p0
 @pytest.mark.env('dev')
-@timeout(60)  # 60초 타임아웃으로 증가
 async def test_gear_settings_dropdown_improved(environment: str = "dev"):
     """개선된 톱니바퀴 설정 버튼 드롭다운 테스트"""
     print(f"🔍 {environment.upper()} 환경에서 개선된 톱니바퀴 설정 버튼 드롭다운 테스트...")
@@ -5,7 +5,6 @@ Tests the same functionality across different environments (dev, stage, live)
 """
 
 import asyncio
-from functools import wraps
 import sys
 from pathlib import Path
 
@@ -18,23 +17,6 @@ from utils.browser_manager import BrowserFactory
 from pages.login_page import LoginPage
 
 
-
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
-@timeout(30)  # 30초 타임아웃
-
-
 async def test_login_across_environments():
     """Test login functionality across all environments"""
     print("🔍 환경 간 로그인 통합 테스트...")
@@ -5,10 +5,11 @@ Tests the complete user journey: Login → Dashboard → Site Creation → Site
 """
 
 import asyncio
-from functools import wraps
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
@@ -20,23 +21,7 @@ from pages.dashboard_page import DashboardPage
 from pages.site_detail_page import SiteDetailPage
 
 
-
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
-@timeout(45)  # 45초 타임아웃
-
-
+@pytest.mark.serial
 async def test_full_workflow(environment: str = "dev"):
     """Test complete user workflow"""
     print(f"🔍 {environment.upper()} 환경 전체 워크플로우 테스트...")
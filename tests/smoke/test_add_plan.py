@@ -8,7 +8,6 @@ import asyncio
 import sys
 import os
 from pathlib import Path
-from functools import wraps
 
 import pytest
 
@@ -22,24 +21,11 @@ from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.site_detail_page import SiteDetailPage
 
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
 @pytest.mark.asyncio
 @pytest.mark.smoke
 @pytest.mark.p0
 @pytest.mark.env('dev')
-@timeout(45)  # 45초 타임아웃
+@pytest.mark.serial
 async def test_add_plan_complete_flow(environment: str = "dev"):
     """Add Plan 완전한 플로우 테스트"""
     print(f"🔍 {environment.upper()} 환경 Add Plan 완전한 플로우 테스트...")
@@ -52,16 +38,12 @@ async def test_add_plan_complete_flow(environment: str = "dev"):
         
         # 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
-        
-        if not await login_page.is_logged_in():
+        if not await login_page.login_with_cache(space_id, email, password):
             print("❌ 로그인 실패")
             return False
         
@@ -250,7 +232,7 @@ def create_sample_plan_file() -> str:
 @pytest.mark.smoke
 @pytest.mark.p1
 @pytest.mark.env('dev')
-@timeout(30)  # 30초 타임아웃
+@pytest.mark.serial
 async def test_add_plan_dialog_elements(environment: str = "dev"):
     """Add Plan 다이얼로그 요소 테스트"""
     print(f"🔍 {environment.upper()} 환경 Add Plan 다이얼로그 요소 테스트...")
@@ -260,16 +242,12 @@ async def test_add_plan_dialog_elements(environment: str = "dev"):
     async with BrowserFactory.create(config) as browser_manager:
         # 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
-        
-        if not await login_page.is_logged_in():
+        if not await login_page.login_with_cache(space_id, email, password):
             print("❌ 로그인 실패")
             return False
         
@@ -6,7 +6,6 @@
 import asyncio
 import sys
 from pathlib import Path
-from functools import wraps
 
 import pytest
 
@@ -19,38 +18,20 @@ from utils.browser_manager import BrowserFactory
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
 @pytest.mark.asyncio
 @pytest.mark.smoke
 @pytest.mark.p0
 @pytest.mark.env('dev')
-@timeout(45)  # 45초 타임아웃
 async def test_dashboard_functions(environment: str = "dev"):
     """업데이트된 대시보드 기능 테스트"""
     print(f"🔍 {environment.upper()} 환경 대시보드 기능 테스트...")
     
     config = get_config(environment)
     
-    async with BrowserFactory.create(config) as browser_manager:
+    async with BrowserFactory.create(config, network_profile="functional") as browser_manager:
         # 로그인 페이지 생성
         login_page = LoginPage(browser_manager.page, config)
         
-        # 로그인 페이지로 이동
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
-        
         # 3단계 로그인 실행
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
@@ -61,11 +42,8 @@ async def test_dashboard_functions(environment: str = "dev"):
         print(f"   - 이메일: {email}")
         print(f"   - 비밀번호: {password}")
         
-        # 로그인 실행
-        await login_page.login(space_id, email, password)
-        
-        # 로그인 성공 확인
-        if await login_page.is_logged_in():
+        # 로그인 실행 (캐시된 세션 우선)
+        if await login_page.login_with_cache(space_id, email, password):
             print("✅ 로그인 성공!")
             
             # 대시보드 페이지 생성
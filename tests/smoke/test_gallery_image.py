@@ -5,7 +5,6 @@ Gallery Image Upload Tests
 """
 
 import asyncio
-from functools import wraps
 import sys
 import os
 from pathlib import Path
@@ -34,22 +33,8 @@ def create_sample_gallery_image() -> str:
     return str(image_path)
 
 
-
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
 @pytest.mark.env('dev')
-@timeout(30)  # 30초 타임아웃
+@pytest.mark.serial
 async def test_gallery_image_upload_complete_flow(environment: str = "dev"):
     """갤러리 이미지 업로드 완전한 플로우 테스트"""
     print(f"🖼️ {environment.upper()} 환경 갤러리 이미지 업로드 완전한 플로우 테스트...")
@@ -60,16 +45,12 @@ async def test_gallery_image_upload_complete_flow(environment: str = "dev"):
     
         # 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
-        
-        if not await login_page.is_logged_in():
+        if not await login_page.login_with_cache(space_id, email, password):
             print("❌ 로그인 실패")
             return False
         
@@ -166,7 +147,6 @@ async def test_gallery_image_upload_complete_flow(environment: str = "dev"):
 
 
 @pytest.mark.asyncio
-@timeout(30)  # 30초 타임아웃
 async def test_gallery_image_dialog_elements(environment: str = "dev"):
     """갤러리 이미지 업로드 다이얼로그 요소 테스트"""
     config = get_config(environment)
@@ -178,15 +158,13 @@ async def test_gallery_image_dialog_elements(environment: str = "dev"):
         
         # 1단계: 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         # 3단계 로그인 실행
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
+        await login_page.login_with_cache(space_id, email, password)
         print("✅ 로그인 성공")
         
         # 2단계: 대시보드로 이동
@@ -257,7 +235,6 @@ async def test_gallery_image_dialog_elements(environment: str = "dev"):
 
 
 @pytest.mark.asyncio
-@timeout(30)  # 30초 타임아웃
 async def test_gallery_image_verification(environment: str = "dev"):
     """갤러리 이미지 검증 테스트"""
     config = get_config(environment)
@@ -269,15 +246,13 @@ async def test_gallery_image_verification(environment: str = "dev"):
         
         # 1단계: 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         # 3단계 로그인 실행
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
+        await login_page.login_with_cache(space_id, email, password)
         print("✅ 로그인 성공")
         
         # 2단계: 대시보드로 이동
@@ -8,7 +8,6 @@ import pytest
 import asyncio
 import sys
 from pathlib import Path
-from functools import wraps
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
@@ -19,44 +18,26 @@ from utils.browser_manager import BrowserFactory
 from pages.login_page import LoginPage
 from pages.components.global_navigation import GlobalNavigation
 
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
 @pytest.mark.p0
 @pytest.mark.env('dev')
-@timeout(45)  # 45초 타임아웃
 async def test_gear_settings_button(environment: str = "dev"):
     """톱니바퀴 설정 버튼 테스트"""
     print(f"🔍 {environment.upper()} 환경 톱니바퀴 설정 버튼 테스트...")
 
     config = get_config(environment)
 
-    async with BrowserFactory.create(config) as browser_manager:
+    async with BrowserFactory.create(config, network_profile="functional") as browser_manager:
         # Set test name for video naming
         browser_manager.set_current_test("gear_settings_button")
         
         # 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
-        
-        if not await login_page.is_logged_in():
+        if not await login_page.login_with_cache(space_id, email, password):
             print("❌ 로그인 실패")
             return False
         
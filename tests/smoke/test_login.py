@@ -6,27 +6,11 @@ Tests basic login flows across different environments.
 import pytest
 import pytest_asyncio
 import logging
-import asyncio
-from functools import wraps
 from utils.config_loader import get_config
 from utils.browser_manager import BrowserFactory
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
-
 class TestLoginSmoke:
     """Smoke tests for login functionality."""
     
@@ -61,7 +45,6 @@ class TestLoginSmoke:
     @pytest.mark.smoke
     @pytest.mark.p0
     @pytest.mark.env('dev')
-    @timeout(30)  # 30초 타임아웃
     async def test_valid_login_dev(self, browser_manager, test_data):
         """Test valid login on dev environment."""
         self.logger.info("Starting valid login test for dev environment")
@@ -101,7 +84,6 @@ class TestLoginSmoke:
     @pytest.mark.smoke
     @pytest.mark.p1
     @pytest.mark.env('dev')
-    @timeout(22)  # 22초 타임아웃
     async def test_login_page_elements_dev(self, browser_manager):
         """Test login page elements are present on dev environment."""
         self.logger.info("Starting login page elements test for dev environment")
@@ -4,7 +4,6 @@ Test search and site selection
 """
 
 import asyncio
-from functools import wraps
 import sys
 import os
 from pathlib import Path
@@ -22,40 +21,23 @@ from pages.dashboard_page import DashboardPage
 from pages.site_detail_page import SiteDetailPage
 
 
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
 @pytest.mark.env('dev')
-@timeout(30)  # 30초 타임아웃
+@pytest.mark.serial
 async def test_search_and_site_selection(environment: str = "dev"):
     """Test search and site selection"""
     print(f"🔍 {environment.upper()} 환경 검색 및 사이트 선택 테스트...")
     
     config = get_config(environment)
     
-    async with BrowserFactory.create(config) as browser_manager:
+    async with BrowserFactory.create(config, network_profile="functional") as browser_manager:
         # 로그인
         login_page = LoginPage(browser_manager.page, config)
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
         
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
         password = config.test_data.valid_user["password"]
         
-        await login_page.login(space_id, email, password)
-        
-        if not await login_page.is_logged_in():
+        if not await login_page.login_with_cache(space_id, email, password):
             print("❌ 로그인 실패")
             return False
         
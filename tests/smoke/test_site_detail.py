@@ -4,7 +4,6 @@
 """
 
 import asyncio
-from functools import wraps
 import sys
 from pathlib import Path
 
@@ -20,21 +19,7 @@ from pages.login_page import LoginPage
 from pages.site_detail_page import SiteDetailPage
 
 
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
 @pytest.mark.env('dev')
-@timeout(37)  # 37초 타임아웃
 async def test_site_detail_pom_simple(environment: str = "dev"):
     """간단한 사이트 상세 페이지 POM 테스트"""
     print(f"🔍 {environment.upper()} 환경 간단한 사이트 상세 페이지 POM 테스트...")
@@ -45,10 +30,6 @@ async def test_site_detail_pom_simple(environment: str = "dev"):
         # 로그인 페이지 생성
         login_page = LoginPage(browser_manager.page, config)
         
-        # 로그인 페이지로 이동
-        await login_page.navigate_to_login()
-        await login_page.wait_for_page_load()
-        
         # 로그인 실행
         space_id = "d-ge-pr"
         email = config.test_data.valid_user["email"]
@@ -59,11 +40,8 @@ async def test_site_detail_pom_simple(environment: str = "dev"):
         print(f"   - 이메일: {email}")
         print(f"   - 비밀번호: {password}")
         
-        # 로그인 실행
-        await login_page.login(space_id, email, password)
-        
-        # 로그인 성공 확인
-        if await login_page.is_logged_in():
+        # 로그인 실행 (캐시된 세션 우선)
+        if await login_page.login_with_cache(space_id, email, password):
             print("✅ 로그인 성공!")
             
             print(f"📄 페이지 제목: {await browser_manager.page.title()}")
@@ -4,7 +4,6 @@ Test search for "Tag Test" and enter the site
 """
 
 import asyncio
-from functools import wraps
 import sys
 import os
 from pathlib import Path
@@ -22,25 +21,10 @@ from pages.dashboard_page import DashboardPage
 from pages.site_detail_page import SiteDetailPage
 
 
-def timeout(seconds):
-    """타임아웃 데코레이터"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
-            except asyncio.TimeoutError:
-                print(f"⏰ 테스트 타임아웃 ({seconds}초 초과)")
-                return False
-        return wrapper
-    return decorator
-
-
 class TestTagTestSearch:
     """Tag Test 검색 테스트 클래스"""
 
     @pytest.mark.asyncio
-    @timeout(60)  # 60초 타임아웃
     async def test_tag_test_search_and_enter(self):
         """Tag Test 검색 및 진입 테스트"""
         print("🔍 Tag Test 검색 및 진입 테스트 시작...")
@@ -55,18 +39,17 @@ class TestTagTestSearch:
             # 1단계: 로그인
             print("\n📋 1단계: 로그인")
             login_page = LoginPage(browser_manager.page, config)
-            await login_page.navigate_to_login()
             
             # 로그인 정보로 로그인
             space_id = "d-ge-pr"  # Dev 환경 스페이스 ID
-            await login_page.login(
+            logged_in = await login_page.login_with_cache(
                 space_id=space_id,
                 email=config.test_data.valid_user["email"],
                 password=config.test_data.valid_user["password"]
             )
             
             # 로그인 성공 확인
-            if not await login_page.is_logged_in():
+            if not logged_in:
                 print("❌ 로그인 실패")
                 return False
             
@@ -0,0 +1,133 @@
+"""
+History-driven test deadlines for Beamo automated testing platform.
+A pytest plugin that gives every async test a deadline derived from its
+recorded p99 duration in the current environment (run history), with a
+cold-start default for tests that have too little history.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import os
+from typing import Dict, Optional, Tuple
+
+import pytest
+
+from .run_history import RunHistory
+
+
+logger = logging.getLogger(__name__)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("beamo-deadlines", "history-driven test deadlines")
+    group.addoption(
+        "--no-adaptive-timeout", action="store_true", default=False,
+        help="disable per-test deadlines from the run history",
+    )
+    group.addoption(
+        "--timeout-margin", type=float, default=1.5, metavar="FACTOR",
+        help="deadline = p99 * FACTOR + --timeout-slack (default: 1.5)",
+    )
+    group.addoption(
+        "--timeout-slack", type=float, default=10.0, metavar="SECONDS",
+        help="fixed seconds added to the scaled p99 (default: 10)",
+    )
+    group.addoption(
+        "--cold-start-timeout", type=float, default=60.0, metavar="SECONDS",
+        help="deadline for tests with too little history (default: 60)",
+    )
+
+
+class DeadlinePolicy:
+    """
+    Per-test deadline from historical durations.
+
+    Tests with at least ``min_runs`` recorded runs get
+    ``max(floor, p99 * margin + slack)``; others get the cold-start default
+    (or their ``@pytest.mark.deadline(seconds)`` value).
+    """
+
+    def __init__(self, stats: Dict[str, Dict[str, float]], margin: float = 1.5, slack: float = 10.0,
+                 cold_start: float = 60.0, min_runs: int = 5, floor: float = 15.0):
+        self.stats = stats
+        self.margin = margin
+        self.slack = slack
+        self.cold_start = cold_start
+        self.min_runs = min_runs
+        self.floor = floor
+
+    @classmethod
+    def from_history(cls, environment: str, history: Optional[RunHistory] = None, **kwargs) -> "DeadlinePolicy":
+        """Policy from the run history (cold start for every test if it can't be read)."""
+        try:
+            stats = (history or RunHistory()).percentiles(environment)
+        except Exception as e:
+            logger.warning(f"Run history unavailable, using cold-start deadlines: {e}")
+            stats = {}
+        return cls(stats, **kwargs)
+
+    def deadline(self, nodeid: str, cold_start: Optional[float] = None) -> Tuple[float, str]:
+        """(seconds, basis) for one test; basis describes where the number came from."""
+        entry = self.stats.get(nodeid)
+        if entry is None or entry["count"] < self.min_runs:
+            runs = entry["count"] if entry else 0
+            return cold_start or self.cold_start, f"cold start, {runs} run(s) recorded"
+        seconds = max(self.floor, entry["p99"] * self.margin + self.slack)
+        return seconds, f"p99 {entry['p99']:.1f}s over {entry['count']} runs"
+
+
+class AdaptiveTimeout:
+    """Wraps each coroutine test in asyncio.wait_for with its deadline."""
+
+    def __init__(self, policy: DeadlinePolicy):
+        self.policy = policy
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_call(self, item):
+        test_function = getattr(item, "obj", None)
+        if not inspect.iscoroutinefunction(test_function):
+            yield
+            return
+
+        marker = item.get_closest_marker("deadline")
+        seconds, basis = self.policy.deadline(item.nodeid, marker.args[0] if marker and marker.args else None)
+        item.user_properties.append(("deadline", round(seconds, 1)))
+        logger.info(f"⏱️ Deadline {seconds:.0f}s for {item.nodeid} ({basis})")
+
+        @functools.wraps(test_function)
+        async def with_deadline(*args, **kwargs):
+            task = asyncio.ensure_future(test_function(*args, **kwargs))
+            try:
+                # 테스트 안에서 난 TimeoutError와 구분하도록 제한 시간은 wait()로 따로 확인
+                done, _ = await asyncio.wait({task}, timeout=seconds)
+            except BaseException:
+                task.cancel()
+                raise
+            if task in done:
+                # 테스트 자신의 결과/예외(원래 traceback 포함)를 그대로 전달
+                return task.result()
+            # 취소되면 BrowserManager.__aexit__ 가 실패로 정리하며 트레이스/동영상을 남김
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            pytest.fail(f"Deadline exceeded: {seconds:.0f}s ({basis})", pytrace=False)
+
+        item.obj = with_deadline
+        try:
+            yield
+        finally:
+            item.obj = test_function
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "deadline(seconds): cold-start deadline until the test has enough history")
+    if config.getoption("no_adaptive_timeout", default=False):
+        return
+    policy = DeadlinePolicy.from_history(
+        os.getenv("BEAMO_ENV", "dev"),
+        margin=config.getoption("timeout_margin"),
+        slack=config.getoption("timeout_slack"),
+        cold_start=config.getoption("cold_start_timeout"),
+    )
+    config.pluginmanager.register(AdaptiveTimeout(policy), "beamo_adaptive_timeout")
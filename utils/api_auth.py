@@ -0,0 +1,182 @@
+"""
+API-level authenticator for Beamo automated testing platform.
+Performs the space -> user -> password login exchange over HTTP and seeds
+the resulting cookies/token into a Playwright BrowserContext.
+"""
+
+import logging
+import weakref
+from typing import Optional, Dict, Any, List
+from urllib.parse import urlparse
+import httpx
+from playwright.async_api import BrowserContext, Route
+from .config_loader import EnvironmentConfig
+
+
+# 컨텍스트별 Authorization 헤더 라우트 (pattern, handler) - 로그아웃/풀 초기화 시 해제
+_auth_routes: "weakref.WeakKeyDictionary[BrowserContext, tuple]" = weakref.WeakKeyDictionary()
+
+
+async def clear_api_auth(context: BrowserContext) -> None:
+    """Remove the bearer-token route installed by ApiAuthenticator.apply_to_context()."""
+    entry = _auth_routes.pop(context, None)
+    if entry:
+        await context.unroute(*entry)
+
+
+class ApiAuthError(Exception):
+    """Raised when the API login exchange fails."""
+
+
+class ApiSession:
+    """Result of an API login: browser cookies and optional bearer token."""
+
+    def __init__(self, cookies: List[Dict[str, Any]], token: Optional[str] = None,
+                 dashboard_url: Optional[str] = None):
+        self.cookies = cookies
+        self.token = token
+        self.dashboard_url = dashboard_url
+
+
+class ApiAuthenticator:
+    """Logs in through the Beamo API instead of driving the login UI."""
+
+    # 응답 JSON에서 토큰을 찾을 키 (data 하위 포함)
+    TOKEN_KEYS = ("accessToken", "access_token", "token")
+
+    def __init__(self, config: EnvironmentConfig):
+        self.config = config
+        self.api = config.api
+        self.logger = logging.getLogger(__name__)
+
+    async def authenticate(self, space_id: str, email: str, password: str) -> ApiSession:
+        """
+        Run the 3-step login exchange against the API.
+
+        Args:
+            space_id: Beamo space ID
+            email: User ID / email
+            password: User password
+
+        Returns:
+            ApiSession: Cookies and token issued by the API
+
+        Raises:
+            ApiAuthError: If any step of the exchange fails
+        """
+        if not self.api.login_configured:
+            raise ApiAuthError("API login is disabled or its endpoints (space_path, user_path, login_path) are not configured")
+
+        timeout = self.api.timeout / 1000
+        async with httpx.AsyncClient(base_url=self.api.base_url, timeout=timeout,
+                                     follow_redirects=True) as client:
+            try:
+                # 1단계: 스페이스 확인
+                await self._post(client, self.api.space_path, {"spaceId": space_id})
+
+                # 2단계: 사용자 확인
+                await self._post(client, self.api.user_path, {"spaceId": space_id, "userId": email})
+
+                # 3단계: 비밀번호 인증
+                payload = await self._post(client, self.api.login_path, {
+                    "spaceId": space_id,
+                    "userId": email,
+                    "userPassword": password,
+                })
+            except httpx.HTTPError as e:
+                raise ApiAuthError(f"API login request failed: {e}") from e
+
+            session = ApiSession(
+                cookies=self._to_browser_cookies(client.cookies.jar, self.portal_domain()),
+                token=self._extract_token(payload),
+                dashboard_url=self.dashboard_url(space_id),
+            )
+
+        if not session.cookies and not session.token:
+            raise ApiAuthError("API login returned neither cookies nor a token")
+
+        self.logger.info(f"API login completed for: {email} in space: {space_id}")
+        return session
+
+    async def apply_to_context(self, session: ApiSession, context: BrowserContext) -> None:
+        """
+        Inject API-issued cookies and token into a browser context.
+
+        The bearer token is added only to requests for the API origin (via a
+        context route), never to analytics, fonts, map tiles or other hosts.
+        """
+        if session.cookies:
+            await context.add_cookies(session.cookies)
+        if session.token:
+            await clear_api_auth(context)
+            parsed = urlparse(self.api.base_url)
+            pattern = f"{parsed.scheme}://{parsed.netloc}/**"
+            authorization = f"Bearer {session.token}"
+
+            async def add_authorization(route: Route) -> None:
+                # fallback 으로 넘겨 네트워크 차단 프로필 등 다른 라우트도 그대로 적용
+                await route.fallback(headers={**route.request.headers, "authorization": authorization})
+
+            await context.route(pattern, add_authorization)
+            _auth_routes[context] = (pattern, add_authorization)
+        self.logger.info(f"Seeded browser context with {len(session.cookies)} cookies from API login")
+
+    async def login(self, context: BrowserContext, space_id: str, email: str, password: str) -> ApiSession:
+        """Authenticate over the API and seed the given context."""
+        session = await self.authenticate(space_id, email, password)
+        await self.apply_to_context(session, context)
+        return session
+
+    def portal_domain(self) -> str:
+        """Parent domain shared by the accounts and space hosts (e.g. beamo.dev)."""
+        host = urlparse(self.config.base_url).hostname or ""
+        if host.startswith("accounts."):
+            host = host[len("accounts."):]
+        return host
+
+    def dashboard_url(self, space_id: str) -> str:
+        """Build the space dashboard URL (https://{space-id}.beamo.dev/list) from base_url."""
+        parsed = urlparse(self.config.base_url)
+        host = parsed.netloc
+        if host.startswith("accounts."):
+            host = host[len("accounts."):]
+        return f"{parsed.scheme}://{space_id}.{host}/list"
+
+    async def _post(self, client: httpx.AsyncClient, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """POST one login step and return its JSON body."""
+        response = await client.post(path, json=body)
+        if response.status_code >= 400:
+            raise ApiAuthError(f"{path} returned HTTP {response.status_code}")
+        try:
+            return response.json()
+        except ValueError:
+            return {}
+
+    def _extract_token(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Find an access token in the login response, if the API returns one."""
+        for container in (payload, payload.get("data") if isinstance(payload.get("data"), dict) else {}):
+            for key in self.TOKEN_KEYS:
+                if container.get(key):
+                    return container[key]
+        return None
+
+    @staticmethod
+    def _to_browser_cookies(jar, portal_domain: str) -> List[Dict[str, Any]]:
+        """
+        Convert an httpx cookie jar into Playwright add_cookies() format.
+
+        Host-only cookies issued by the API host are widened to
+        ``.{portal_domain}`` so they also reach ``{space}.{portal_domain}``.
+        """
+        cookies = []
+        for cookie in jar:
+            cookies.append({
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain if cookie.domain_specified else f".{portal_domain}",
+                "path": cookie.path or "/",
+                "expires": cookie.expires if cookie.expires else -1,
+                "secure": cookie.secure,
+                "httpOnly": bool(cookie.has_nonstandard_attr("HttpOnly")),
+            })
+        return cookies
@@ -0,0 +1,163 @@
+"""
+Background artifact writer for Beamo automated testing platform.
+Screenshots are captured on the event loop and encoded/written by a bounded
+thread pool, so slow disks don't block test steps.
+"""
+
+import asyncio
+import atexit
+import io
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Set
+
+try:
+    from PIL import Image  # WebP 인코딩용 (선택 의존성)
+except ImportError:
+    Image = None
+
+
+SCREENSHOT_FORMATS = ("png", "jpeg", "webp")
+SCREENSHOT_EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+
+class ArtifactLog:
+    """
+    Artifacts written by this process, in order.
+
+    The success-cleanup fixture deletes only what the current test produced,
+    so parallel shards or lanes sharing reports/<env>/ never delete each
+    other's files.
+    """
+
+    def __init__(self):
+        self._paths: List[Path] = []
+        self._lock = threading.Lock()
+
+    def track(self, path) -> None:
+        with self._lock:
+            self._paths.append(Path(path))
+
+    def mark(self) -> int:
+        with self._lock:
+            return len(self._paths)
+
+    def since(self, mark: int) -> List[Path]:
+        """Artifacts tracked after ``mark``."""
+        with self._lock:
+            return list(self._paths[mark:])
+
+
+# 이 프로세스가 기록한 스크린샷/동영상/트레이스 목록
+artifact_log = ArtifactLog()
+
+
+class ArtifactWriter:
+    """
+    Bounded background queue for artifact encoding and disk writes.
+
+    At most ``max_pending`` artifacts are in flight; when the queue is full
+    the caller waits (backpressure) instead of memory growing without bound.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16):
+        self.max_pending = max_pending
+        self.logger = logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifact-writer")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+
+    async def save_screenshot(self, page, environment: str, name: str, image_format: str = "png",
+                              quality: int = 80) -> str:
+        """
+        Capture a screenshot and queue it to ``reports/<env>/screenshots/<name>_<timestamp>.<ext>``.
+
+        PNG/JPEG are encoded by the browser; WebP is re-encoded from PNG in the
+        writer thread (requires Pillow, falls back to JPEG without it).
+
+        Returns:
+            str: Path the screenshot is written to (the write may still be in flight)
+        """
+        if image_format not in SCREENSHOT_FORMATS:
+            raise ValueError(f"Invalid screenshot format: {image_format} (expected one of {', '.join(SCREENSHOT_FORMATS)})")
+        if image_format == "webp" and Image is None:
+            self.logger.warning("Pillow not installed, saving screenshot as JPEG instead of WebP")
+            image_format = "jpeg"
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = Path(f"reports/{environment}/screenshots/{name}_{timestamp}.{SCREENSHOT_EXTENSIONS[image_format]}")
+
+        if image_format == "jpeg":
+            data = await page.screenshot(type="jpeg", quality=quality)
+        else:
+            data = await page.screenshot(type="png")
+
+        await self.submit(path, data, convert_to="webp" if image_format == "webp" else None, quality=quality)
+        artifact_log.track(path)
+        return str(path)
+
+    async def submit(self, path: Path, data: bytes, convert_to: Optional[str] = None, quality: int = 80) -> Future:
+        """Queue bytes to be (optionally re-encoded and) written to path."""
+        if not self._slots.acquire(blocking=False):
+            # 큐가 가득 차면 자리가 날 때까지 이벤트 루프를 막지 않고 대기
+            await asyncio.to_thread(self._slots.acquire)
+        future = self._executor.submit(self._write, Path(path), data, convert_to, quality)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def _write(self, path: Path, data: bytes, convert_to: Optional[str], quality: int) -> Path:
+        try:
+            if convert_to == "webp":
+                output = io.BytesIO()
+                Image.open(io.BytesIO(data)).save(output, format="WEBP", quality=quality)
+                data = output.getvalue()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            self.logger.info(f"Screenshot saved: {path} ({len(data) / 1024:.0f}KB)")
+            return path
+        except Exception as e:
+            self.logger.error(f"Failed to write artifact {path}: {e}")
+            raise
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """Block until every queued artifact has been written."""
+        with self._lock:
+            pending = list(self._pending)
+        if pending:
+            wait(pending, timeout=timeout)
+
+    async def flush(self, timeout: Optional[float] = None) -> None:
+        """Async variant of drain() for use on the event loop."""
+        await asyncio.to_thread(self.drain, timeout)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+# 프로세스 전체에서 공유하는 아티팩트 작성기 (종료 시 남은 쓰기 완료)
+artifact_writer = ArtifactWriter()
+atexit.register(artifact_writer.shutdown)
+
+
+async def save_screenshot(page, config, name: str) -> str:
+    """Screenshot through the shared writer using test_config.screenshot_format/quality."""
+    return await artifact_writer.save_screenshot(
+        page, config.environment, name,
+        config.test_config.screenshot_format, config.test_config.screenshot_quality,
+    )
+
+
+def screenshot_globs():
+    """Glob patterns matching every screenshot format the writer produces."""
+    return [f"*.{extension}" for extension in SCREENSHOT_EXTENSIONS.values()]
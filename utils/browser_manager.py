@@ -5,27 +5,88 @@ Handles Playwright browser initialization and configuration.
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from .config_loader import EnvironmentConfig
+from .network_profiles import ResourceBlocker
+from .har_replay import resolve_har_mode, resolve_not_found, flow_name, har_path
+from .web_vitals import WebVitalsCollector, vitals_recorder
+from .screencast import ScreencastBuffer
+from .artifacts import artifact_log, save_screenshot
+from .api_auth import clear_api_auth
 
 
-class BrowserManager:
-    """Manages Playwright browser instances and contexts."""
+# run_flows()가 플로우마다 설정하는 공유 컨텍스트 풀 (pool 을 넘기지 않은 BrowserManager가 사용)
+current_pool: ContextVar[Optional["BrowserContextPool"]] = ContextVar("current_pool", default=None)
+
+
+class BrowserHost:
+    """
+    Session-scoped Playwright/Chromium host.
+
+    Launches Chromium once per worker process (and event loop) and hands out
+    fresh BrowserContexts, so each test only pays for ``new_context()``
+    instead of ``async_playwright().start()`` + ``chromium.launch()``.
+    """
+    
+    # (event loop id, headless, slow_mo) -> host
+    _hosts: Dict[Tuple[int, bool, int], "BrowserHost"] = {}
+    _locks: Dict[int, asyncio.Lock] = {}
     
-    def __init__(self, config: EnvironmentConfig):
+    def __init__(self, config: EnvironmentConfig, loop: asyncio.AbstractEventLoop):
         self.config = config
+        self.loop = loop
         self.playwright = None
         self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
         self.logger = logging.getLogger(__name__)
-        self.current_test_name = "unknown"
-        self.test_status = "unknown"  # "success", "failure", "error"
     
-    async def start_browser(self) -> None:
-        """Start Playwright browser with environment-specific configuration."""
+    @classmethod
+    async def get(cls, config: EnvironmentConfig) -> "BrowserHost":
+        """
+        Get the shared host for the running event loop, launching it on first use.
+        
+        Args:
+            config: Environment configuration (launch options are taken from it)
+            
+        Returns:
+            BrowserHost: Started browser host
+        """
+        loop = asyncio.get_running_loop()
+        cls._discard_stale_hosts()
+        
+        key = (id(loop), config.browser.headless, config.browser.slow_mo)
+        lock = cls._locks.setdefault(id(loop), asyncio.Lock())
+        async with lock:
+            host = cls._hosts.get(key)
+            if host is None or not host.is_connected():
+                host = cls(config, loop)
+                await host.start()
+                cls._hosts[key] = host
+        return host
+    
+    @classmethod
+    def _discard_stale_hosts(cls) -> None:
+        """Forget hosts whose event loop has already been closed."""
+        for key, host in list(cls._hosts.items()):
+            if host.loop.is_closed():
+                del cls._hosts[key]
+                cls._locks.pop(key[0], None)
+    
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close every host that belongs to the running event loop."""
+        loop = asyncio.get_running_loop()
+        for key, host in list(cls._hosts.items()):
+            if host.loop is loop:
+                del cls._hosts[key]
+                await host.close()
+        cls._locks.pop(id(loop), None)
+    
+    async def start(self) -> None:
+        """Start Playwright and launch Chromium."""
         try:
             self.playwright = await async_playwright().start()
             
@@ -37,27 +98,116 @@ class BrowserManager:
             
             # Launch browser (Chrome by default)
             self.browser = await self.playwright.chromium.launch(**launch_options)
+            self.logger.info("Shared browser launched")
+        except Exception as e:
+            self.logger.error(f"Failed to launch shared browser: {e}")
+            await self.close()
+            raise
+    
+    def is_connected(self) -> bool:
+        """Check if the shared browser is still usable."""
+        return self.browser is not None and self.browser.is_connected()
+    
+    async def new_context(self, **context_options) -> BrowserContext:
+        """Create a new isolated context in the shared browser."""
+        if not self.is_connected():
+            raise RuntimeError("Shared browser is not running")
+        return await self.browser.new_context(**context_options)
+    
+    async def close(self) -> None:
+        """Close the shared browser and stop Playwright."""
+        try:
+            if self.browser:
+                await self.browser.close()
+        except Exception as e:
+            self.logger.error(f"Error closing shared browser: {e}")
+        finally:
+            self.browser = None
+        
+        try:
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception as e:
+            self.logger.error(f"Error stopping Playwright: {e}")
+        finally:
+            self.playwright = None
+        
+        self.logger.info("Shared browser closed")
+
+
+class BrowserManager:
+    """Manages Playwright browser instances and contexts."""
+    
+    def __init__(self, config: EnvironmentConfig, pool: Optional["BrowserContextPool"] = None,
+                 network_profile: Optional[str] = None, flow_name: Optional[str] = None):
+        self.config = config
+        self.network_profile = network_profile or config.browser.network_profile
+        self.flow_name = flow_name
+        self.har_mode = resolve_har_mode(config)
+        self.har_path: Optional[Path] = None
+        self.blocker: Optional[ResourceBlocker] = None
+        self.vitals: Optional[WebVitalsCollector] = None
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self.host: Optional[BrowserHost] = None
+        self.pool = pool if pool is not None else current_pool.get()
+        self.pooled: Optional["PooledContext"] = None
+        self.logger = logging.getLogger(__name__)
+        self.current_test_name = "unknown"
+        self.test_status = "unknown"  # "success", "failure", "error"
+        self.blocked_requests: Dict[str, int] = {}
+        self.web_vitals: List[Dict] = []  # 이 테스트에서 측정한 페이지 로드별 지표
+        self.tracing = config.test_config.trace_recording  # 실패한 테스트만 트레이스 보관
+        self.trace_chunk_open = False
+        self.trace_path: Optional[Path] = None
+        self.screencast: Optional[ScreencastBuffer] = None  # 마지막 N초 화면 (실패 시에만 동영상 저장)
+        self.video_path: Optional[Path] = None
+    
+    async def start_browser(self) -> None:
+        """Start Playwright browser with environment-specific configuration."""
+        try:
+            if self.pool and self.har_mode != "off":
+                # HAR 기록/재생은 컨텍스트 생성 옵션이라 풀 컨텍스트를 쓸 수 없음
+                self.logger.warning(f"HAR {self.har_mode} mode: bypassing context pool")
+            elif self.pool and self.pool.network_profile != self.network_profile:
+                # 풀 컨텍스트에는 이미 다른 차단 프로필이 적용되어 있음
+                self.logger.info(f"Network profile '{self.network_profile}' differs from the pool's "
+                                 f"'{self.pool.network_profile}': bypassing context pool")
+            elif self.pool:
+                # 미리 준비된 컨텍스트를 풀에서 꺼내 사용
+                self.pooled = await self.pool.acquire(timeout=self.config.browser.pool_acquire_timeout)
+                self.context = self.pooled.context
+                self.page = self.pooled.page
+                self.blocker = self.pooled.blocker
+                self.vitals = self.pooled.vitals
+                await self._start_trace_chunk()
+                await self._start_screencast()
+                self.logger.info(f"Browser context checked out from pool for {self.config.environment} environment")
+                return
             
-            # Create browser context
-            context_options = {
-                "viewport": {"width": 1920, "height": 1080},
-                "ignore_https_errors": True,  # For dev/stage environments
-                "record_video_dir": None,  # 동영상 녹화 완전 비활성화
-                "record_video_size": None,  # 동영상 크기 설정도 비활성화
-                "record_har_path": f"reports/{self.config.environment}/har" if self.config.test_config.trace_recording else None,
-                "accept_downloads": True,  # 파일 다운로드 자동 승인
-            }
-            
-            self.context = await self.browser.new_context(**context_options)
-            
-            # Create new page
-            self.page = await self.context.new_page()
-            
-            # Set default timeout
-            self.page.set_default_timeout(self.config.browser.timeout)
+            if self.config.browser.shared:
+                # 워커당 한 번만 실행된 공유 브라우저에서 컨텍스트만 새로 생성
+                self.host = await BrowserHost.get(self.config)
+                self.playwright = self.host.playwright
+                self.browser = self.host.browser
+            else:
+                self.playwright = await async_playwright().start()
+                
+                # Browser launch options
+                launch_options = {
+                    "headless": self.config.browser.headless,
+                    "slow_mo": self.config.browser.slow_mo,
+                }
+                
+                # Launch browser (Chrome by default)
+                self.browser = await self.playwright.chromium.launch(**launch_options)
             
-            # 파일 다이얼로그 자동 처리 설정
-            self.page.on("filechooser", self._handle_file_chooser)
+            # Create browser context and page
+            self.context, self.page, self.blocker, self.vitals = await self.open_context(self.browser)
+            await self._start_trace_chunk()
+            await self._start_screencast()
             
             self.logger.info(f"Browser started for {self.config.environment} environment")
             
@@ -65,6 +215,138 @@ class BrowserManager:
             self.logger.error(f"Failed to start browser: {e}")
             raise
     
+    async def open_context(self, browser: Browser) -> Tuple[BrowserContext, Page, ResourceBlocker,
+                                                            Optional[WebVitalsCollector]]:
+        """
+        Create a context and its first page with the standard options and handlers.
+        
+        The context's ResourceBlocker and WebVitalsCollector (None when
+        browser.web_vitals is off) are returned rather than stored on self,
+        since the pool opens several contexts concurrently on one factory.
+        """
+        options = self.get_context_options()
+        if self.har_mode == "record":
+            # 플로우별 HAR 파일 (컨텍스트를 닫을 때 기록됨)
+            self.har_path = har_path(self.config, flow_name(self.flow_name))
+            self.har_path.parent.mkdir(parents=True, exist_ok=True)
+            options["record_har_path"] = str(self.har_path)
+        
+        context = await browser.new_context(**options)
+        
+        # 네트워크 차단 프로필은 첫 요청 전에 적용
+        blocker = ResourceBlocker(self.network_profile)
+        await blocker.apply(context)
+        
+        if self.config.browser.web_vitals:
+            # 모든 문서 로드마다 Navigation Timing / Web Vitals 수집
+            vitals = WebVitalsCollector()
+            await vitals.apply(context)
+        else:
+            vitals = None
+        
+        if self.tracing:
+            # 트레이스는 컨텍스트당 한 번 시작하고 테스트마다 chunk로 나눔
+            await context.tracing.start(screenshots=True, snapshots=True)
+        
+        if self.har_mode == "replay":
+            # 나중에 등록한 라우트가 먼저 처리되므로 HAR 응답이 차단 프로필보다 우선
+            await self._replay_har(context)
+        
+        page = await context.new_page()
+        self._setup_page(page)
+        return context, page, blocker, vitals
+    
+    async def _start_trace_chunk(self) -> None:
+        """Start this test's trace chunk on the context."""
+        if not self.tracing or not self.context:
+            return
+        try:
+            await self.context.tracing.start_chunk(title=flow_name(self.flow_name))
+            self.trace_chunk_open = True
+        except Exception as e:
+            self.logger.warning(f"Failed to start trace chunk: {e}")
+    
+    async def _stop_trace_chunk(self, test_name: str, status: str) -> None:
+        """Save the trace chunk for failed tests, discard it otherwise."""
+        if not self.trace_chunk_open:
+            return
+        self.trace_chunk_open = False
+        try:
+            if status in ["failure", "error"]:
+                from datetime import datetime
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                trace_dir = Path(f"reports/{self.config.environment}/traces")
+                trace_dir.mkdir(parents=True, exist_ok=True)
+                self.trace_path = trace_dir / f"{test_name}_{status}_{timestamp}.zip"
+                await self.context.tracing.stop_chunk(path=str(self.trace_path))
+                artifact_log.track(self.trace_path)
+                self.logger.info(f"Trace saved for failed test: {self.trace_path} (playwright show-trace {self.trace_path})")
+            else:
+                # 경로 없이 멈추면 chunk는 파일로 내보내지 않고 버려짐
+                await self.context.tracing.stop_chunk()
+        except Exception as e:
+            self.logger.warning(f"Failed to stop trace chunk: {e}")
+    
+    async def _start_screencast(self) -> None:
+        """Start buffering the page's screencast in memory."""
+        if not self.config.test_config.video_recording or not self.page:
+            return
+        self.screencast = ScreencastBuffer(self.page, seconds=self.config.test_config.video_buffer_seconds)
+        await self.screencast.start()
+    
+    async def _finish_screencast(self, test_name: str, status: str) -> Optional[Path]:
+        """Stop the screencast and encode the buffer to a video only for failed tests."""
+        if not self.screencast:
+            return None
+        screencast, self.screencast = self.screencast, None
+        await screencast.stop()
+        try:
+            if status in ["failure", "error"] and not self.video_path:
+                from datetime import datetime
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                path = Path(f"reports/{self.config.environment}/videos/{test_name}_{status}_{timestamp}.webm")
+                self.video_path = await screencast.save(path)
+                if self.video_path:
+                    artifact_log.track(self.video_path)
+                    self.logger.info(f"Video saved for failed test (last {screencast.seconds}s): {self.video_path}")
+            return self.video_path
+        except Exception as e:
+            self.logger.warning(f"Failed to save screencast video: {e}")
+            return None
+        finally:
+            screencast.clear()
+    
+    def get_context_options(self) -> Dict[str, Any]:
+        """Build BrowserContext options for the current environment."""
+        return {
+            "viewport": {"width": 1920, "height": 1080},
+            "ignore_https_errors": True,  # For dev/stage environments
+            "record_video_dir": None,  # 동영상 녹화 완전 비활성화
+            "record_video_size": None,  # 동영상 크기 설정도 비활성화
+            "accept_downloads": True,  # 파일 다운로드 자동 승인
+        }
+    
+    async def _replay_har(self, context: BrowserContext) -> None:
+        """Serve the context's requests from the flow's recorded HAR."""
+        name = flow_name(self.flow_name)
+        self.har_path = har_path(self.config, name)
+        if not self.har_path.exists():
+            raise FileNotFoundError(
+                f"No recorded HAR for flow '{name}': {self.har_path} (record it first with har_mode=record)"
+            )
+        
+        not_found = resolve_not_found(self.config)
+        await context.route_from_har(str(self.har_path), not_found=not_found, url=self.config.test_config.har_url)
+        self.logger.info(f"Replaying HAR {self.har_path} (not_found={not_found})")
+    
+    def _setup_page(self, page: Page) -> None:
+        """Apply default timeout and handlers to a new page."""
+        # Set default timeout
+        page.set_default_timeout(self.config.browser.timeout)
+        
+        # 파일 다이얼로그 자동 처리 설정
+        page.on("filechooser", self._handle_file_chooser)
+    
     def set_current_test(self, test_name: str):
         """Set current test name for video naming."""
         self.current_test_name = test_name
@@ -74,22 +356,11 @@ class BrowserManager:
         self.test_status = status
         self.logger.info(f"Test status set to: {status}")
         
-        # 실패한 테스트에서만 동영상 녹화 활성화
-        if status in ["failure", "error"] and self.context:
-            try:
-                # 동영상 녹화 디렉토리 설정
-                video_dir = f"reports/{self.config.environment}/videos"
-                import os
-                os.makedirs(video_dir, exist_ok=True)
-                
-                self.logger.info(f"Video recording will be enabled for failed test: {status}")
-            except Exception as e:
-                self.logger.warning(f"Failed to setup video recording: {e}")
-        elif status == "success" and self.context:
-            try:
-                self.logger.info(f"Video recording disabled for successful test: {status}")
-            except Exception as e:
-                self.logger.warning(f"Failed to disable video recording: {e}")
+        # 실패한 테스트만 메모리에 보관 중인 화면을 종료 시점에 동영상으로 인코딩
+        if status in ["failure", "error"] and self.screencast:
+            self.logger.info(f"Buffered video (last {self.screencast.seconds}s) will be saved for failed test")
+        elif status == "success" and self.screencast:
+            self.logger.info("Buffered video will be discarded for successful test")
     
     async def _handle_file_chooser(self, file_chooser):
         """Handle file chooser dialog automatically."""
@@ -116,7 +387,7 @@ class BrowserManager:
             raise RuntimeError("Browser context not initialized")
         
         page = await self.context.new_page()
-        page.set_default_timeout(self.config.browser.timeout)
+        self._setup_page(page)
         return page
     
     async def navigate_to(self, url: str) -> None:
@@ -148,20 +419,11 @@ class BrowserManager:
             self.logger.info(f"Skipping screenshot for successful test: {test_name}")
             return None
         
-        # Create reports directory if it doesn't exist
-        screenshot_dir = Path(f"reports/{self.config.environment}/screenshots")
-        screenshot_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Generate filename with test name, status, and timestamp
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{test_name}_{status}_{timestamp}.png"
-        filepath = screenshot_dir / filename
-        
         try:
-            await self.page.screenshot(path=str(filepath))
-            self.logger.info(f"Screenshot saved: {filepath}")
-            return str(filepath)
+            # 인코딩/디스크 쓰기는 백그라운드 아티팩트 작성기에서 처리
+            filepath = await save_screenshot(self.page, self.config, f"{test_name}_{status}")
+            self.logger.info(f"Screenshot queued: {filepath}")
+            return filepath
         except Exception as e:
             self.logger.error(f"Failed to take screenshot: {e}")
             raise
@@ -214,7 +476,11 @@ class BrowserManager:
         Only saves videos for failed tests.
         """
         try:
-            if self.page and self.page.video:
+            if self.screencast:
+                # 메모리 버퍼의 마지막 N초를 바로 저장 (실패한 테스트만)
+                video_path = await self._finish_screencast(test_name or self.current_test_name, status or self.test_status)
+                return str(video_path) if video_path else None
+            elif self.page and self.page.video:
                 # Use current test info if not provided
                 if test_name is None:
                     test_name = self.current_test_name
@@ -238,6 +504,7 @@ class BrowserManager:
                 # Save video with custom filename
                 video_path = video_dir / filename
                 await self.page.video.save_as(str(video_path))
+                artifact_log.track(video_path)
                 self.logger.info(f"Video recording stopped and saved: {video_path}")
                 return str(video_path)
             else:
@@ -256,15 +523,29 @@ class BrowserManager:
             if status is None:
                 status = self.test_status
             
-            # Save video before closing only for failed tests
-            if self.context and hasattr(self.context, 'close'):
-                try:
-                    if self.test_status in ["failure", "error"]:
-                        self.logger.info(f"Video will be saved automatically for failed test: {test_name}_{self.test_status}")
-                    else:
-                        self.logger.info(f"Video recording skipped for successful test: {test_name}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to handle video: {e}")
+            # 실패한 테스트만 트레이스/동영상 저장 (풀 반납/컨텍스트 종료 전에 처리)
+            if self.context:
+                await self._stop_trace_chunk(test_name, status)
+            await self._finish_screencast(test_name, status)
+            
+            if self.blocker:
+                # 차단된 요청 수를 카테고리별로 남김 (풀 반납 시 초기화되므로 먼저 기록)
+                self.blocked_requests = self.blocker.report()
+                self.blocker.log_report()
+            
+            if self.vitals:
+                # 열려 있는 페이지의 최종 LCP/CLS까지 받아서 테스트 결과에 첨부
+                await self.vitals.flush(self.page)
+                self.web_vitals = self.vitals.report()
+                vitals_recorder.record(self.config.environment, flow_name(self.flow_name), self.web_vitals)
+                self.vitals.reset()
+            
+            if self.pooled:
+                # 풀 컨텍스트는 닫지 않고 초기화 후 반납
+                await self.pool.release(self.pooled)
+                self.pooled = None
+                self.page = None
+                self.context = None
             
             if self.page:
                 await self.page.close()
@@ -273,6 +554,14 @@ class BrowserManager:
             if self.context:
                 await self.context.close()
                 self.context = None
+                if self.har_mode == "record" and self.har_path:
+                    self.logger.info(f"HAR recorded: {self.har_path}")
+            
+            if self.host:
+                # 공유 브라우저는 세션 종료 시 BrowserHost.shutdown()에서 닫음
+                self.browser = None
+                self.playwright = None
+                self.host = None
             
             if self.browser:
                 await self.browser.close()
@@ -316,7 +605,7 @@ class BrowserManager:
         # Determine test status based on exception
         if exc_type:
             status = "failure"
-            self.test_status = status
+            self.set_test_status(status)
         else:
             # 이미 설정된 상태가 있으면 사용, 없으면 success
             if self.test_status == "unknown":
@@ -325,38 +614,7 @@ class BrowserManager:
         
         test_name = getattr(self, 'current_test_name', 'test')
         
-        # Handle video based on test status
-        if self.context and hasattr(self.context, 'close'):
-            try:
-                import os
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                
-                # Get the default video directory
-                video_dir = f"reports/{self.config.environment}/videos"
-                
-                if self.test_status in ["failure", "error"]:
-                    # For failed tests, create a dummy video file to simulate recording
-                    if not os.path.exists(video_dir):
-                        os.makedirs(video_dir, exist_ok=True)
-                    
-                    # 실패한 테스트를 위한 더미 동영상 파일 생성 (실제 녹화 대신)
-                    video_filename = f"{test_name}_{self.test_status}_{timestamp}.webm"
-                    video_path = os.path.join(video_dir, video_filename)
-                    
-                    # 간단한 더미 파일 생성 (실제로는 Playwright의 녹화 기능 사용)
-                    with open(video_path, 'w') as f:
-                        f.write(f"# Dummy video file for failed test: {test_name}")
-                    
-                    self.logger.info(f"Video file created for failed test: {video_filename}")
-                else:
-                    # 성공한 테스트에서는 비디오를 생성/삭제하지 않음
-                    # (실패 테스트에서 생성된 비디오는 보존)
-                    pass
-                
-            except Exception as e:
-                self.logger.warning(f"Failed to handle video in __aexit__: {e}")
-        
+        # 실패한 테스트의 트레이스는 close_browser()에서 저장됨
         await self.close_browser(test_name, status)
     
     async def clear_cookies(self):
@@ -376,21 +634,248 @@ class BrowserManager:
             self.logger.error(f"Failed to clear cookies: {e}")
 
 
+class PooledContext:
+    """A pre-warmed context/page pair checked out from BrowserContextPool."""
+    
+    def __init__(self, context: BrowserContext, page: Page, blocker: Optional[ResourceBlocker] = None,
+                 vitals: Optional[WebVitalsCollector] = None):
+        self.context = context
+        self.page = page
+        self.blocker = blocker
+        self.vitals = vitals
+        self.uses = 0
+        self.origins = set()  # 스토리지 초기화 대상 origin
+        page.on("framenavigated", self._track_origin)
+    
+    def _track_origin(self, frame) -> None:
+        """Remember every origin the main frame visited."""
+        if frame.parent_frame is None and frame.url.startswith("http"):
+            parts = frame.url.split("/")
+            self.origins.add("/".join(parts[:3]))
+
+
+class BrowserContextPool:
+    """
+    Keeps N BrowserContexts ready ahead of time in the shared browser.
+    
+    ``acquire()`` hands out an idle context (new_context/new_page/handler wiring
+    already done), ``release()`` resets it and puts it back. The pool never holds
+    more than ``size`` contexts, which caps memory under concurrent runs.
+    """
+    
+    def __init__(self, config: EnvironmentConfig, size: int = 4, max_uses: int = 50,
+                 network_profile: Optional[str] = None):
+        self.config = config
+        self.size = size
+        self.max_uses = max_uses
+        self.host: Optional[BrowserHost] = None
+        self.logger = logging.getLogger(__name__)
+        self._factory = BrowserManager(config, network_profile=network_profile)
+        self._idle: Optional[asyncio.Queue] = None
+        self._refills: set = set()
+        self._missing = 0  # 퇴출된 뒤 아직 다시 만들지 못한 컨텍스트 수
+        self._closed = False
+        self._start_lock = asyncio.Lock()
+    
+    @property
+    def network_profile(self) -> str:
+        """Resource-blocking profile applied to every pooled context."""
+        return self._factory.network_profile
+    
+    async def start(self) -> None:
+        """Launch (or reuse) the shared browser and pre-warm all contexts."""
+        # 동시에 acquire()한 플로우들이 각자 풀을 채우지 않도록 한 번만 실행
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            
+            self.host = await BrowserHost.get(self.config)
+            items = await asyncio.gather(*(self._create() for _ in range(self.size)))
+            self._idle = asyncio.Queue()
+            for item in items:
+                self._idle.put_nowait(item)
+            self.logger.info(f"Browser context pool ready ({self.size} contexts)")
+    
+    async def acquire(self, timeout: Optional[float] = None) -> PooledContext:
+        """
+        Check out a ready context, waiting for one to be released if all are busy.
+        
+        If no context is idle or being refilled because earlier refills
+        failed, a replacement is created here (relaunching the shared browser
+        if it disconnected); its error is raised instead of waiting forever.
+        
+        Args:
+            timeout: Seconds to wait for a free context (None waits forever)
+            
+        Returns:
+            PooledContext: Context/page pair for exclusive use until release()
+            
+        Raises:
+            asyncio.TimeoutError: If no context became free within ``timeout``
+        """
+        await self.start()
+        
+        while True:
+            if self._idle.empty() and self._refills:
+                # 진행 중인 보충이 끝나기를 기다린 뒤 다시 확인 (실패했으면 아래에서 직접 생성)
+                await asyncio.gather(*self._refills, return_exceptions=True)
+            if self._idle.empty() and self._missing:
+                await self._replace()
+            item = await asyncio.wait_for(self._idle.get(), timeout)
+            if self._is_healthy(item):
+                item.uses += 1
+                # 이전 보충이 실패해 모자란 컨텍스트는 다시 채워 둠
+                for _ in range(self._missing - len(self._refills)):
+                    self._schedule_refill()
+                return item
+            self.logger.warning("Evicting unhealthy pooled context")
+            await self._evict(item)
+    
+    async def release(self, item: PooledContext) -> None:
+        """Reset a context and return it to the pool (evicted if it can't be reset)."""
+        if self._closed:
+            await self._close_item(item)
+            return
+        
+        try:
+            await self._reset(item)
+        except Exception as e:
+            self.logger.warning(f"Failed to reset pooled context, evicting: {e}")
+            await self._evict(item)
+            return
+        
+        if item.uses >= self.max_uses:
+            await self._evict(item)
+            return
+        
+        self._idle.put_nowait(item)
+    
+    @asynccontextmanager
+    async def checkout(self, timeout: Optional[float] = None):
+        """Async context manager wrapper around acquire()/release()."""
+        item = await self.acquire(timeout)
+        try:
+            yield item
+        finally:
+            await self.release(item)
+    
+    async def close(self) -> None:
+        """Close all idle contexts; busy ones are closed when released."""
+        self._closed = True
+        for task in list(self._refills):
+            task.cancel()
+        if self._idle is not None:
+            while not self._idle.empty():
+                await self._close_item(self._idle.get_nowait())
+        self.logger.info("Browser context pool closed")
+    
+    async def _create(self) -> PooledContext:
+        """Create one fully wired context/page pair."""
+        return PooledContext(*await self._factory.open_context(self.host.browser))
+    
+    def _is_healthy(self, item: PooledContext) -> bool:
+        """Check that the context's page and browser are still usable."""
+        return self.host.is_connected() and not item.page.is_closed()
+    
+    async def _reset(self, item: PooledContext) -> None:
+        """Wipe cookies/storage and close stray pages."""
+        # 테스트 중 열린 추가 페이지(팝업 등) 닫기
+        for stray in item.context.pages:
+            if stray is not item.page:
+                await stray.close()
+        
+        # 모든 쿠키 및 API 로그인 헤더 삭제
+        await item.context.clear_cookies()
+        await clear_api_auth(item.context)
+        
+        # 현재 origin의 로컬/세션 스토리지 삭제
+        if item.page.url.startswith("http"):
+            await item.page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        
+        # 이전에 방문한 다른 origin의 로컬 스토리지 삭제
+        if item.origins:
+            cdp = await item.context.new_cdp_session(item.page)
+            try:
+                for origin in item.origins:
+                    await cdp.send("Storage.clearDataForOrigin", {
+                        "origin": origin,
+                        "storageTypes": "local_storage",
+                    })
+            finally:
+                await cdp.detach()
+            item.origins.clear()
+        
+        await item.page.goto("about:blank")
+        
+        if item.blocker:
+            item.blocker.reset_counts()
+        if item.vitals:
+            item.vitals.reset()
+    
+    async def _evict(self, item: PooledContext) -> None:
+        """Close a context and create a replacement in the background."""
+        await self._close_item(item)
+        self._missing += 1
+        self._schedule_refill()
+    
+    def _schedule_refill(self) -> None:
+        """Start a background refill for one missing context."""
+        if not self._closed:
+            task = asyncio.create_task(self._refill())
+            self._refills.add(task)
+            task.add_done_callback(self._refills.discard)
+    
+    async def _refill(self) -> None:
+        """Replace an evicted context so the pool stays at full size."""
+        try:
+            await self._replace()
+        except Exception as e:
+            # 다음 acquire()가 빈 풀을 보고 다시 시도 (실패하면 그때 예외)
+            self.logger.error(f"Failed to refill browser context pool: {e}")
+    
+    async def _replace(self) -> None:
+        """Create one missing context, relaunching the shared browser if it disconnected."""
+        if self._missing <= 0:
+            return
+        # 동시에 호출돼도 빠진 수만큼만 만들도록 먼저 차감하고 실패하면 되돌림
+        self._missing -= 1
+        try:
+            if not self.host.is_connected():
+                self.logger.warning("Shared browser disconnected - relaunching for the context pool")
+                self.host = await BrowserHost.get(self.config)
+            item = await self._create()
+        except BaseException:
+            self._missing += 1
+            raise
+        self._idle.put_nowait(item)
+    
+    async def _close_item(self, item: PooledContext) -> None:
+        """Close a pooled context, ignoring already-closed ones."""
+        try:
+            await item.context.close()
+        except Exception as e:
+            self.logger.debug(f"Pooled context already closed: {e}")
+
+
 class BrowserFactory:
     """Factory for creating browser managers."""
     
     @staticmethod
-    def create(config: EnvironmentConfig) -> BrowserManager:
+    def create(config: EnvironmentConfig, pool: Optional[BrowserContextPool] = None,
+               network_profile: Optional[str] = None, flow_name: Optional[str] = None) -> BrowserManager:
         """
         Create a browser manager instance.
         
         Args:
             config: Environment configuration
+            pool: Optional context pool to check contexts out of
+            network_profile: Resource-blocking profile (defaults to config.browser.network_profile)
+            flow_name: HAR file name for record/replay (defaults to the running flow/test name)
             
         Returns:
             BrowserManager: Configured browser manager
         """
-        return BrowserManager(config)
+        return BrowserManager(config, pool, network_profile, flow_name)
     
     @staticmethod
     async def create_and_start(config: EnvironmentConfig) -> BrowserManager:
@@ -406,3 +891,21 @@ class BrowserFactory:
         manager = BrowserManager(config)
         await manager.start_browser()
         return manager
+    
+    @staticmethod
+    async def create_pool(config: EnvironmentConfig, size: int = 4,
+                          network_profile: Optional[str] = None) -> BrowserContextPool:
+        """
+        Create and pre-warm a browser context pool.
+        
+        Args:
+            config: Environment configuration
+            size: Number of contexts kept ready
+            network_profile: Resource-blocking profile applied to every pooled context
+            
+        Returns:
+            BrowserContextPool: Started context pool
+        """
+        pool = BrowserContextPool(config, size, network_profile=network_profile)
+        await pool.start()
+        return pool
@@ -0,0 +1,74 @@
+"""
+CDP Performance.getMetrics sampling for Beamo page objects.
+Opt-in (browser.cdp_metrics or BEAMO_CDP_METRICS=1): samples main-thread and
+memory counters before and after each page-object action so spans can carry
+the cost of the step.
+"""
+
+import logging
+import os
+import weakref
+from typing import Dict, Optional
+from playwright.async_api import Page
+
+
+# 단계별 증감을 기록할 지표 (ScriptDuration/TaskDuration은 초 단위 누적값)
+METRICS = ("JSHeapUsedSize", "Nodes", "LayoutCount", "RecalcStyleCount", "ScriptDuration", "TaskDuration")
+
+logger = logging.getLogger(__name__)
+
+
+def cdp_metrics_enabled(config) -> bool:
+    """BEAMO_CDP_METRICS overrides browser.cdp_metrics."""
+    flag = os.getenv("BEAMO_CDP_METRICS")
+    if flag is not None:
+        return flag.lower() in ("1", "true", "yes", "on")
+    browser = getattr(config, "browser", None)
+    return bool(getattr(browser, "cdp_metrics", False))
+
+
+class CdpMetricsSampler:
+    """One CDP session per page with the Performance domain enabled."""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.session = None
+        self.available = True  # Chromium이 아니거나 세션 생성에 실패하면 False
+
+    async def sample(self) -> Optional[Dict[str, float]]:
+        """Current values of METRICS, or None if CDP is not available."""
+        if not self.available or self.page.is_closed():
+            return None
+        try:
+            if self.session is None:
+                self.session = await self.page.context.new_cdp_session(self.page)
+                await self.session.send("Performance.enable")
+            response = await self.session.send("Performance.getMetrics")
+        except Exception as e:
+            logger.debug(f"CDP metrics unavailable for page: {e}")
+            self.available = False
+            return None
+        values = {metric["name"]: metric["value"] for metric in response.get("metrics", [])}
+        return {name: values.get(name, 0) for name in METRICS}
+
+    @staticmethod
+    def delta(before: Optional[Dict[str, float]], after: Optional[Dict[str, float]]) -> Optional[Dict[str, float]]:
+        """Per-metric change between two samples (durations in ms, others as-is)."""
+        if not before or not after:
+            return None
+        result = {}
+        for name in METRICS:
+            change = after[name] - before[name]
+            result[name] = round(change * 1000, 1) if name.endswith("Duration") else int(change)
+        return result
+
+
+# 페이지별 샘플러 (페이지 객체가 여러 개여도 CDP 세션은 하나만 사용)
+_samplers: "weakref.WeakKeyDictionary[Page, CdpMetricsSampler]" = weakref.WeakKeyDictionary()
+
+
+def sampler_for(page: Page) -> CdpMetricsSampler:
+    sampler = _samplers.get(page)
+    if sampler is None:
+        sampler = _samplers[page] = CdpMetricsSampler(page)
+    return sampler
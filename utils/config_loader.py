@@ -15,6 +15,11 @@ class BrowserConfig(BaseModel):
     headless: bool = True
     slow_mo: int = 0
     timeout: int = 30000
+    shared: bool = True  # 워커당 브라우저 1개를 띄우고 테스트마다 컨텍스트만 새로 생성
+    network_profile: str = "full-fidelity"  # 리소스 차단 프로필 (functional, viewer, full-fidelity)
+    web_vitals: bool = True  # 페이지 로드마다 Navigation Timing / Web Vitals 수집
+    cdp_metrics: bool = False  # 페이지 객체 단계 전후 CDP Performance.getMetrics 차이 기록 (BEAMO_CDP_METRICS)
+    pool_acquire_timeout: int = 300  # 컨텍스트 풀에서 빈 컨텍스트를 기다리는 최대 시간(초)
 
 
 class TestDataConfig(BaseModel):
@@ -26,9 +31,17 @@ class TestDataConfig(BaseModel):
 class TestConfig(BaseModel):
     """Test configuration model."""
     screenshot_on_failure: bool = True
-    video_recording: bool = True
+    screenshot_format: str = "png"  # png(무손실), jpeg, webp (손실 압축은 선택, webp는 Pillow 필요)
+    screenshot_quality: int = 80  # jpeg/webp 품질
+    video_recording: bool = True  # 마지막 N초 화면을 메모리에 보관하고 실패 시에만 동영상으로 저장
+    video_buffer_seconds: int = 10  # 실패 동영상에 남길 마지막 구간 길이(초)
     trace_recording: bool = True
     retry_count: int = 2
+    login_cache_ttl: int = 1800  # 로그인 세션 캐시 유효 시간(초), 0이면 비활성화
+    har_mode: str = "off"  # off, record(플로우별 HAR 저장), replay(저장된 HAR로 응답)
+    har_not_found: str = "abort"  # replay 시 HAR에 없는 요청 처리: abort 또는 fallback(실제 네트워크)
+    har_dir: Optional[str] = None  # 기본값: reports/<env>/har
+    har_url: Optional[str] = None  # replay 대상 URL glob (예: "**/api/**"), 없으면 전체
 
 
 class ReportingConfig(BaseModel):
@@ -52,6 +65,17 @@ class APIConfig(BaseModel):
     """API configuration model."""
     base_url: str
     timeout: int = 10000
+    # UI 대신 API로 로그인 (실패 시 UI 로그인으로 폴백)
+    # 포털 인증 엔드포인트가 확정되지 않아 기본값 없음 - 세 경로를 모두 설정해야 사용됨
+    login_enabled: bool = False
+    space_path: Optional[str] = None
+    user_path: Optional[str] = None
+    login_path: Optional[str] = None
+
+    @property
+    def login_configured(self) -> bool:
+        """API login is enabled and all three auth endpoints are configured."""
+        return self.login_enabled and all((self.space_path, self.user_path, self.login_path))
 
 
 class EnvironmentConfig(BaseModel):
@@ -3,6 +3,7 @@
 Email sender utility for test reports
 """
 
+import html
 import smtplib
 import ssl
 from email.mime.multipart import MIMEMultipart
@@ -88,6 +89,49 @@ class EmailSender:
         
         success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
         
+        # 결과 스트림 기반 실패 목록/느린 테스트 (없으면 섹션 생략)
+        failure_rows = "".join(
+            f"<tr><td>{html.escape(failure['nodeid'])}</td><td>{failure['outcome']}</td>"
+            f"<td>{failure['duration']:.1f}s</td><td>{html.escape(failure.get('message', ''))}</td></tr>"
+            for failure in test_results.get("failures", [])
+        )
+        failures_section = f"""
+            <div class="summary">
+                <h2>❌ 실패한 테스트</h2>
+                <table border="1" cellpadding="6" style="border-collapse: collapse;">
+                    <tr><th>테스트</th><th>결과</th><th>소요시간</th><th>메시지</th></tr>
+                    {failure_rows}
+                </table>
+            </div>
+        """ if failure_rows else ""
+        slowest_rows = "".join(
+            f"<tr><td>{html.escape(test['nodeid'])}</td><td>{test['duration']:.1f}s</td></tr>"
+            for test in test_results.get("slowest_tests", [])
+        )
+        slowest_section = f"""
+            <div class="summary">
+                <h2>⏱️ 가장 오래 걸린 테스트</h2>
+                <table border="1" cellpadding="6" style="border-collapse: collapse;">
+                    <tr><th>테스트</th><th>소요시간</th></tr>
+                    {slowest_rows}
+                </table>
+            </div>
+        """ if slowest_rows else ""
+        quarantine_rows = "".join(
+            f"<tr><td>{html.escape(test['nodeid'])}</td><td>{test['outcome']}</td>"
+            f"<td>{test['attempts']}</td><td>{test['score']:.2f}</td></tr>"
+            for test in test_results.get("quarantine", [])
+        )
+        quarantine_section = f"""
+            <div class="summary">
+                <h2>🧪 격리 레인 (flaky 테스트, 결과에 미반영)</h2>
+                <table border="1" cellpadding="6" style="border-collapse: collapse;">
+                    <tr><th>테스트</th><th>결과</th><th>시도 횟수</th><th>flaky 점수</th></tr>
+                    {quarantine_rows}
+                </table>
+            </div>
+        """ if quarantine_rows else ""
+        
         html_body = f"""
         <!DOCTYPE html>
         <html>
@@ -148,6 +192,9 @@ class EmailSender:
                 
                 <p><strong>총 실행 시간:</strong> {execution_time}</p>
             </div>
+            {failures_section}
+            {slowest_section}
+            {quarantine_section}
             
             <div class="attachments">
                 <h2>📎 첨부 파일</h2>
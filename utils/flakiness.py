@@ -0,0 +1,172 @@
+"""
+Flaky-test detection and quarantine lane for Beamo automated testing platform.
+Scores each test from its recorded outcomes and runs the flaky ones in a
+separate, non-blocking pytest lane with retries.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from . import result_stream
+from .streaming_executor import StreamingExecutor
+
+
+logger = logging.getLogger(__name__)
+
+# 재시도에서 통과한 실패 (run history 의 outcome 값)
+FLAKY = "flaky"
+_FAILED = ("failed", "error")
+
+
+def flakiness_score(outcomes: List[str]) -> float:
+    """
+    Flakiness of one test from its recent outcomes (any order, skipped ignored).
+
+    Counts pass/fail flips between consecutive first-attempt passes and
+    failures, plus runs that only passed on retry (each counted once, not
+    as a flip too), divided by the number of runs (capped at 1.0). A test
+    that always passes or always fails scores 0.
+    """
+    runs = [outcome for outcome in outcomes if outcome in ("passed", FLAKY) + _FAILED]
+    if not runs:
+        return 0.0
+    states = [outcome == "passed" for outcome in runs if outcome != FLAKY]
+    flips = sum(1 for previous, current in zip(states, states[1:]) if previous != current)
+    retried = runs.count(FLAKY)
+    return min(1.0, (flips + retried) / len(runs))
+
+
+class FlakinessDetector:
+    """Picks tests whose recent history is flaky enough to quarantine."""
+
+    def __init__(self, history, environment: str, window: int = 20, threshold: float = 0.2,
+                 min_runs: int = 5):
+        self.history = history
+        self.environment = environment
+        self.window = window
+        self.threshold = threshold
+        self.min_runs = min_runs
+
+    def scores(self) -> Dict[str, float]:
+        """Flakiness score of every test with at least ``min_runs`` recorded runs."""
+        return {
+            nodeid: flakiness_score(outcomes)
+            for nodeid, outcomes in self.history.recent_outcomes(self.environment, self.window).items()
+            if len(outcomes) >= self.min_runs
+        }
+
+    def quarantined(self) -> Dict[str, float]:
+        """Tests above the threshold whose file still exists, with their scores."""
+        return {
+            nodeid: score for nodeid, score in sorted(self.scores().items())
+            if score > self.threshold and Path(nodeid.split("::")[0]).exists()
+        }
+
+    def partition(self, nodeids: List[str]) -> Tuple[List[str], List[str]]:
+        """Split node IDs into (stable, quarantined) lanes."""
+        quarantined = self.quarantined()
+        return ([nodeid for nodeid in nodeids if nodeid not in quarantined],
+                [nodeid for nodeid in nodeids if nodeid in quarantined])
+
+
+class QuarantineLane:
+    """
+    Runs quarantined tests in a background pytest process, retrying failures.
+
+    The lane never affects the run status; its results are reported and
+    recorded separately (``flaky`` when a test only passed on retry).
+    ``timeout`` is the budget for the whole lane, split across the attempts
+    still to run; ``join()`` stops the pytest process (and its browsers) if
+    the lane outlives it.
+    """
+
+    def __init__(self, environment: str, scores: Dict[str, float], retries: int = 2,
+                 timeout: Optional[float] = None, cwd: Optional[str] = None):
+        self.environment = environment
+        self.scores = scores
+        self.retries = retries
+        self.timeout = timeout
+        self.cwd = cwd
+        self.reports_dir = Path(f"reports/{environment}/quarantine")
+        self.results: List[Dict] = []
+        self.attempts: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[StreamingExecutor] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="quarantine-lane", daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> List[Dict]:
+        """
+        Wait for the lane (at most ``timeout`` seconds) and return its results.
+
+        A lane still running after ``timeout`` is stopped, so no pytest or
+        browser process outlives the run; results finished so far are kept.
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning("Quarantine lane still running, stopping it and reporting partial results")
+                self.stop()
+                self._thread.join()
+        return list(self.results)
+
+    def stop(self) -> None:
+        """Stop the lane: no further attempts, and the running pytest process group is terminated."""
+        self._stopped.set()
+        executor = self._executor
+        if executor is not None:
+            executor.stop()
+
+    def _run(self) -> None:
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        pending = list(self.scores)
+        first_outcomes: Dict[str, str] = {}
+        final: Dict[str, Dict] = {}
+
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        attempts = self.retries + 1
+
+        for attempt in range(1, attempts + 1):
+            if not pending or self._stopped.is_set():
+                break
+            # 남은 예산을 남은 시도 횟수로 나눠 재시도까지 전체 예산 안에서 끝나도록 함
+            timeout = None
+            if deadline is not None:
+                timeout = (deadline - time.monotonic()) / (attempts - attempt + 1)
+                if timeout <= 0:
+                    logger.warning("Quarantine lane budget exhausted, skipping remaining attempts")
+                    break
+            stream_path = self.reports_dir / f"results_{attempt}.jsonl"
+            stream_path.unlink(missing_ok=True)
+            cmd = [sys.executable, "-m", "pytest", *pending, "-v", "--tb=short", "-p", "no:cacheprovider",
+                   f"--result-stream={stream_path}"]
+            # 메인 레인 출력과 섞이지 않도록 콘솔 출력 없이 로그 파일에만 기록
+            self._executor = StreamingExecutor(str(self.reports_dir / "pytest_output.log"), echo=False)
+            if self._stopped.is_set():
+                break
+            self._executor.run(
+                cmd, cwd=self.cwd, env={**os.environ, "BEAMO_ENV": self.environment}, timeout=timeout,
+            )
+
+            for result in result_stream.read_results(str(stream_path)):
+                nodeid = result["nodeid"]
+                self.attempts[nodeid] = attempt
+                first_outcomes.setdefault(nodeid, result["outcome"])
+                final[nodeid] = result
+            pending = [nodeid for nodeid in pending if final.get(nodeid, {}).get("outcome", "failed") in _FAILED]
+            logger.info(f"🧪 Quarantine lane attempt {attempt}: {len(pending)} test(s) still failing")
+
+        for nodeid, result in final.items():
+            outcome = result["outcome"]
+            if first_outcomes[nodeid] in _FAILED and outcome == "passed":
+                outcome = FLAKY
+            self.results.append({**result, "outcome": outcome, "attempts": self.attempts[nodeid],
+                                 "score": round(self.scores.get(nodeid, 0.0), 2)})
@@ -0,0 +1,143 @@
+"""
+Concurrent flow scheduler for Beamo automated testing platform.
+Runs independent async test flows with a bounded number in flight.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from .browser_manager import BrowserContextPool, current_pool
+from .har_replay import current_flow, flow_name
+from .spans import span_recorder
+from .waits import wait_recorder
+from .web_vitals import vitals_recorder, format_navigation
+
+
+class FlowResult:
+    """Outcome and timing of a single test flow."""
+
+    def __init__(self, name: str, status: str, duration: float, error: Optional[str] = None,
+                 steps: Optional[List[Tuple[str, Dict]]] = None, vitals: Optional[List[Dict]] = None):
+        self.name = name
+        self.status = status  # "PASS", "FAIL", "ERROR"
+        self.duration = duration
+        self.error = error
+        self.steps = steps or []  # 가장 오래 걸린 페이지 객체 단계 (span_recorder.slowest)
+        self.vitals = vitals or []  # 페이지 로드별 Navigation Timing / Web Vitals
+
+    @property
+    def passed(self) -> bool:
+        return self.status == "PASS"
+
+
+async def run_flows(flows: List[Tuple],
+                    concurrency: int = 1, deadlines: Optional[Dict[str, float]] = None,
+                    pool: Optional[BrowserContextPool] = None) -> List[FlowResult]:
+    """
+    Run test flows with at most ``concurrency`` of them in flight.
+
+    Each flow opens its own BrowserManager, so flows get isolated contexts
+    on the shared browser. ``concurrency=1`` keeps the sequential behaviour.
+    With a ``pool``, every BrowserManager created inside a flow checks its
+    context out of the pool instead of opening a new one.
+
+    Flows marked serial (they mutate shared portal data, e.g. create sites
+    or plans) never overlap another flow: each one is a barrier that waits
+    for the flows before it and runs alone before later flows start.
+
+    Args:
+        flows: (name, zero-argument coroutine factory[, serial]) tuples
+        concurrency: Maximum number of flows running at the same time
+        deadlines: Optional seconds per flow name; a flow that overruns is cancelled as ERROR
+        pool: Optional pre-warmed context pool shared by all flows
+
+    Returns:
+        List[FlowResult]: Results in the same order as ``flows``
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    total = len(flows)
+
+    async def run_one(index: int, name: str, factory: Callable[[], Awaitable[bool]]) -> FlowResult:
+        async with semaphore:
+            # 플로우 안에서 생성되는 BrowserManager가 HAR 파일명으로 사용
+            current_flow.set(name)
+            if pool is not None:
+                current_pool.set(pool)
+            print(f"\n📋 테스트 {index}/{total}: {name}")
+            print("-" * 60)
+
+            start_time = time.perf_counter()
+            error = None
+            deadline = (deadlines or {}).get(name)
+            task = asyncio.ensure_future(factory())
+            try:
+                # 플로우 자체에서 난 TimeoutError와 구분하도록 제한 시간은 wait()로 따로 확인
+                done, _ = await asyncio.wait({task}, timeout=deadline)
+                if task in done:
+                    status = "PASS" if task.result() else "FAIL"
+                else:
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    status = "ERROR"
+                    error = f"deadline exceeded ({deadline:.0f}s)"
+            except Exception as e:
+                status = "ERROR"
+                error = str(e) or type(e).__name__
+            duration = time.perf_counter() - start_time
+
+            if status == "PASS":
+                print(f"✅ {name} 성공 (소요시간: {duration:.2f}초)")
+            elif status == "FAIL":
+                print(f"❌ {name} 실패 (소요시간: {duration:.2f}초)")
+            else:
+                print(f"❌ {name} 오류 발생: {error} (소요시간: {duration:.2f}초)")
+
+            result = FlowResult(name, status, duration, error, span_recorder.slowest(name),
+                                vitals_recorder.for_test(flow_name(name)))
+            # 결과에 옮긴 단계/페이지 로드 기록은 프로세스 전역 기록에서 제거
+            span_recorder.discard(name)
+            vitals_recorder.discard(flow_name(name))
+            return result
+
+    if concurrency <= 1:
+        # 순차 실행은 표의 순서를 그대로 유지
+        return [await run_one(index, name, factory) for index, (name, factory, *_) in enumerate(flows, 1)]
+
+    results: List[FlowResult] = []
+    batch: List[Tuple[int, str, Callable[[], Awaitable[bool]]]] = []
+
+    async def run_batch() -> None:
+        results.extend(await asyncio.gather(*(run_one(index, name, factory) for index, name, factory in batch)))
+        batch.clear()
+
+    for index, (name, factory, *flags) in enumerate(flows, 1):
+        if flags and flags[0]:
+            # 포털 데이터를 변경하는 플로우는 앞선 플로우가 모두 끝난 뒤 단독으로 실행 (제자리에서 장벽 역할)
+            await run_batch()
+            results.append(await run_one(index, name, factory))
+        else:
+            batch.append((index, name, factory))
+    await run_batch()
+
+    return results
+
+
+def print_timing_summary(results: List[FlowResult], wall_time: float, concurrency: int) -> None:
+    """Print overall wall time vs. the summed per-flow time."""
+    serial_time = sum(result.duration for result in results)
+    print(f"\n⏱️ 전체 실행 시간: {wall_time:.2f}초 (동시 실행 수: {concurrency})")
+    if wall_time > 0:
+        print(f"   테스트 소요시간 합계: {serial_time:.2f}초 (x{serial_time / wall_time:.2f})")
+
+    for result in results:
+        if result.steps:
+            steps = ", ".join(f"{step.split('.')[-1]} {entry['total']:.2f}초" for step, entry in result.steps)
+            print(f"   🔎 {result.name}: {steps}")
+        for navigation in result.vitals:
+            print(f"      🌐 {format_navigation(navigation)}")
+
+    waits = wait_recorder.summary()
+    if waits:
+        waited = sum(entry["waited"] for entry in waits.values())
+        print(f"   조건 대기 {sum(entry['count'] for entry in waits.values())}회: "
+              f"실제 대기 {waited:.2f}초, 고정 sleep 대비 절약 {wait_recorder.total_saved():.2f}초")
@@ -0,0 +1,56 @@
+"""
+HAR record/replay support for Beamo automated testing platform.
+Records one HAR per flow and replays it with route_from_har for offline runs.
+"""
+
+import os
+import re
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Optional
+from .config_loader import EnvironmentConfig
+
+
+HAR_MODES = ("off", "record", "replay")
+NOT_FOUND_POLICIES = ("abort", "fallback")
+
+# run_flows()가 플로우마다 설정하는 현재 플로우 이름 (HAR 파일명으로 사용)
+current_flow: ContextVar[Optional[str]] = ContextVar("current_flow", default=None)
+
+
+def resolve_har_mode(config: EnvironmentConfig) -> str:
+    """HAR mode from BEAMO_HAR_MODE, falling back to test_config.har_mode."""
+    mode = os.getenv("BEAMO_HAR_MODE") or config.test_config.har_mode
+    if mode not in HAR_MODES:
+        raise ValueError(f"Invalid HAR mode: {mode} (expected one of {', '.join(HAR_MODES)})")
+    return mode
+
+
+def resolve_not_found(config: EnvironmentConfig) -> str:
+    """Replay policy for requests missing from the HAR."""
+    policy = config.test_config.har_not_found
+    if policy not in NOT_FOUND_POLICIES:
+        raise ValueError(f"Invalid HAR not_found policy: {policy} (expected one of {', '.join(NOT_FOUND_POLICIES)})")
+    return policy
+
+
+def flow_name(explicit: Optional[str] = None) -> str:
+    """
+    Name of the running flow.
+
+    Explicit name first, then the flow set by run_flows(), then the pytest
+    node ID from PYTEST_CURRENT_TEST, so same-named tests in different
+    modules (or parametrizations) get separate HAR files.
+    """
+    name = explicit or current_flow.get()
+    if not name:
+        # "tests/smoke/test_x.py::test_func (call)" -> "tests_smoke_test_x.py_test_func"
+        current_test = os.getenv("PYTEST_CURRENT_TEST", "")
+        name = current_test.rsplit(" ", 1)[0] if current_test else "flow"
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "flow"
+
+
+def har_path(config: EnvironmentConfig, name: str) -> Path:
+    """HAR file for a flow: reports/<env>/har/<flow>.har (or test_config.har_dir)."""
+    har_dir = Path(config.test_config.har_dir or f"reports/{config.environment}/har")
+    return har_dir / f"{name}.har"
@@ -0,0 +1,99 @@
+"""
+Login session cache for Beamo automated testing platform.
+Stores Playwright storage_state per environment, space and user with a TTL.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+from playwright.async_api import BrowserContext
+from .config_loader import EnvironmentConfig
+
+
+class LoginCache:
+    """Caches authenticated storage_state so tests can skip the 3-step login UI."""
+
+    def __init__(self, config: EnvironmentConfig, cache_dir: str = ".auth"):
+        self.config = config
+        self.cache_dir = Path(cache_dir) / config.environment
+        self.ttl = config.test_config.login_cache_ttl
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def enabled(self) -> bool:
+        """Cache is disabled when the TTL is 0."""
+        return self.ttl > 0
+
+    def _state_path(self, space_id: str, email: str) -> Path:
+        """Cache file path for an environment/space/user key."""
+        key = f"{self.config.environment}|{space_id}|{email}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{space_id}_{digest}.json"
+
+    def load(self, space_id: str, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached session if it exists and has not expired.
+
+        Returns:
+            dict: {"saved_at", "dashboard_url", "storage_state"} or None
+        """
+        if not self.enabled:
+            return None
+
+        path = self._state_path(space_id, email)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Failed to read login cache {path}: {e}")
+            return None
+
+        age = time.time() - entry.get("saved_at", 0)
+        if age > self.ttl:
+            self.logger.info(f"Login cache expired ({age:.0f}s > {self.ttl}s): {space_id}/{email}")
+            self.invalidate(space_id, email)
+            return None
+
+        return entry
+
+    async def save(self, context: BrowserContext, space_id: str, email: str, dashboard_url: str) -> None:
+        """Save the context's storage_state together with the dashboard URL."""
+        if not self.enabled:
+            return
+
+        try:
+            entry = {
+                "saved_at": time.time(),
+                "dashboard_url": dashboard_url,
+                "storage_state": await context.storage_state(),
+            }
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._state_path(space_id, email)
+            # 샤드마다 고유한 임시 파일에 쓰고 교체 (mkstemp 는 소유자 전용 0600 권한으로 생성)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=path.stem, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, path)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+            self.logger.info(f"Login session cached: {space_id}/{email}")
+        except Exception as e:
+            self.logger.warning(f"Failed to save login cache: {e}")
+
+    def invalidate(self, space_id: str, email: str) -> None:
+        """Remove a cached session."""
+        try:
+            self._state_path(space_id, email).unlink()
+        except FileNotFoundError:
+            pass
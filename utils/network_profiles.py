@@ -0,0 +1,123 @@
+"""
+Network resource-blocking profiles for Beamo automated testing platform.
+Aborts or stubs request classes a test doesn't need and counts them.
+"""
+
+import base64
+import logging
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+from playwright.async_api import BrowserContext, Route, Request
+
+
+# 1x1 투명 PNG (이미지 요청 스텁 응답)
+TRANSPARENT_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+# 카테고리별 요청 판별 규칙: (바로 차단할 resource_type 집합, URL 정규식)
+BLOCK_RULES = {
+    "fonts": (
+        {"font"},
+        re.compile(r"\.(woff2?|ttf|otf|eot)(\?|$)|fonts\.(googleapis|gstatic)\.com", re.I),
+    ),
+    "analytics": (
+        set(),
+        re.compile(
+            r"google-analytics\.com|googletagmanager\.com|hotjar\.(com|io)|segment\.(io|com)|"
+            r"mixpanel\.com|amplitude\.com|clarity\.ms|doubleclick\.net|facebook\.net",
+            re.I,
+        ),
+    ),
+    "map_tiles": (
+        set(),
+        re.compile(
+            r"tile\.openstreetmap\.org|tiles?\.mapbox\.com|api\.mapbox\.com/.*/tiles|"
+            r"maps\.googleapis\.com/maps/vt|/tiles?/\d+/\d+/\d+|/\d+/\d+/\d+\.(png|jpe?g|pbf|mvt|webp)(\?|$)",
+            re.I,
+        ),
+    ),
+    "viewer_assets": (
+        set(),
+        re.compile(
+            r"\.(ply|pcd|las|laz|e57|pnts|b3dm|i3dm|cmpt|glb|gltf|obj|drc|hrc|potree)(\?|$)|"
+            r"octree\.bin|pointcloud|point-cloud|/mesh/",
+            re.I,
+        ),
+    ),
+    "gallery_thumbnails": (
+        set(),
+        re.compile(r"thumb(nail)?s?[^?#]*\.(jpe?g|png|webp|gif)(\?|$)", re.I),
+    ),
+}
+
+# 이름이 붙은 차단 프로필
+PROFILES: Dict[str, List[str]] = {
+    # 기능 검증용: 화면 동작에 필요 없는 리소스는 모두 차단
+    "functional": ["fonts", "analytics", "map_tiles", "viewer_assets", "gallery_thumbnails"],
+    # 3D 뷰어는 필요하지만 나머지는 차단
+    "viewer": ["fonts", "analytics", "map_tiles", "gallery_thumbnails"],
+    # 실제 사용자와 동일하게 모두 로드
+    "full-fidelity": [],
+}
+
+
+class ResourceBlocker:
+    """Applies a named blocking profile to a BrowserContext and counts blocked requests."""
+
+    def __init__(self, profile: str = "full-fidelity"):
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown network profile: {profile} (available: {', '.join(PROFILES)})")
+
+        self.profile = profile
+        self.categories = PROFILES[profile]
+        self.counts: Counter = Counter()
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.categories)
+
+    async def apply(self, context: BrowserContext) -> None:
+        """Route every request of the context through the blocker (no-op for full-fidelity)."""
+        if self.enabled:
+            await context.route("**/*", self._handle_route)
+            self.logger.info(f"Network profile '{self.profile}' applied: {', '.join(self.categories)}")
+
+    def classify(self, request: Request) -> Optional[str]:
+        """Return the blocked category a request belongs to, if any."""
+        for category in self.categories:
+            resource_types, pattern = BLOCK_RULES[category]
+            if request.resource_type in resource_types or pattern.search(request.url):
+                return category
+        return None
+
+    async def _handle_route(self, route: Route) -> None:
+        """Abort or stub a blocked request, let everything else through."""
+        request = route.request
+        category = self.classify(request)
+        if category is None:
+            await route.fallback()
+            return
+
+        self.counts[category] += 1
+        if request.resource_type == "image":
+            # 이미지 깨짐 처리 로직이 동작하지 않도록 빈 이미지로 대체
+            await route.fulfill(status=200, content_type="image/png", body=TRANSPARENT_PNG)
+        elif category == "analytics":
+            await route.fulfill(status=204, body="")
+        else:
+            await route.abort("blockedbyclient")
+
+    def reset_counts(self) -> None:
+        self.counts.clear()
+
+    def report(self) -> Dict[str, int]:
+        """Blocked request counts per category."""
+        return {category: self.counts.get(category, 0) for category in self.categories}
+
+    def log_report(self) -> None:
+        if self.enabled:
+            total = sum(self.counts.values())
+            self.logger.info(f"Network profile '{self.profile}' blocked {total} requests: {self.report()}")
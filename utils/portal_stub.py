@@ -0,0 +1,562 @@
+"""
+Local stand-in Beamo portal for offline benchmarking.
+Serves the DOM contracts LoginPage, DashboardPage, SiteDetailPage and
+GlobalNavigation depend on, with configurable latency and dataset size.
+
+Space dashboards live on ``{space-id}.localhost``, which Chromium resolves
+to the loopback address, so the accounts -> space redirect works like the
+real portal (``accounts.localhost:<port>`` -> ``d-ge-pr.localhost:<port>/list``).
+
+Usage:
+    python -m utils.portal_stub --port 8765 --latency-ms 50 --sites 500
+"""
+
+import base64
+import html
+import json
+import logging
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.cookies import SimpleCookie
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+# 갤러리 썸네일 응답용 1x1 PNG
+PIXEL_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+SESSION_COOKIE = "beamo_session"
+
+
+class PortalState:
+    """In-memory dataset and timing knobs shared by all request threads."""
+
+    def __init__(self, sites: int = 50, latency_ms: int = 0, plan_delay_ms: int = 1500,
+                 gallery_images: int = 6):
+        self.latency = latency_ms / 1000
+        self.plan_delay = plan_delay_ms / 1000
+        self.gallery_images = gallery_images
+        self.lock = threading.Lock()
+        self.sessions: Dict[str, str] = {}  # token -> space id
+        self.sites: List[Dict] = [self._make_site(index) for index in range(1, sites + 1)]
+        self.requests_served = 0
+        self.latency_injected = 0.0
+
+    @staticmethod
+    def _make_site(index: int, name: Optional[str] = None, address: Optional[str] = None) -> Dict:
+        updated = datetime(2024, 1, 1) + timedelta(hours=index * 7)
+        return {
+            "id": index,
+            "name": name or f"Site {index:04d}",
+            "address": address or f"{index} Teheran-ro, Gangnam-gu, Seoul",
+            "last_updated": updated.strftime("%Y-%m-%d %H:%M"),
+            "bookmarked": index % 5 == 0,
+            "plans": 0,
+            "surveys": [],
+            "gallery": [],
+        }
+
+    def search(self, term: str) -> List[Dict]:
+        term = term.lower()
+        with self.lock:
+            return [site for site in self.sites
+                    if term in site["name"].lower() or term in site["address"].lower()]
+
+    def find(self, site_id: int) -> Optional[Dict]:
+        with self.lock:
+            return next((site for site in self.sites if site["id"] == site_id), None)
+
+    def add_site(self, name: str, address: str) -> Dict:
+        with self.lock:
+            site = self._make_site(max((s["id"] for s in self.sites), default=0) + 1, name, address)
+            self.sites.insert(0, site)
+            return site
+
+
+def _layout(title: str, body: str, script: str = "") -> str:
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>
+  body {{ margin: 0; font-family: sans-serif; }}
+  .el-header {{ display: flex; justify-content: space-between; padding: 8px 16px; background: #1f2d3d; color: #fff; }}
+  .el-dialog__wrapper {{ position: fixed; inset: 0; background: rgba(0,0,0,.4); display: flex; align-items: center; justify-content: center; }}
+  .el-dialog {{ background: #fff; min-width: 420px; padding: 16px; }}
+  .el-loading-mask {{ position: fixed; inset: 0; background: rgba(255,255,255,.7); }}
+  .building {{ padding: 8px; border-bottom: 1px solid #eee; cursor: pointer; }}
+  .viewer-container canvas {{ width: 640px; height: 360px; background: #333; }}
+  [hidden] {{ display: none !important; }}
+</style></head>
+<body>{body}<script>{script}</script></body></html>"""
+
+
+def _header(space_id: str) -> str:
+    return f"""
+<header class="el-header main-header">
+  <div class="header-left">
+    <a class="logo" href="/list">beamo</a>
+    <span class="brand-name">Beamo</span>
+  </div>
+  <div class="header-right">
+    <div class="user-team-dropdown"><span class="user-name">tmaster</span> / {html.escape(space_id)}</div>
+    <button class="js-notifications-trigger">🔔<span class="notification-badge">3</span></button>
+    <button class="js-alerts-trigger">⚠️<span class="alert-badge">1</span></button>
+    <button class="gear-settings settings-menu" title="Settings">⚙️</button>
+    <ul class="settings-dropdown" hidden>
+      <li class="menu-item">Account</li><li class="menu-item">Members</li><li class="menu-item">Log out</li>
+    </ul>
+  </div>
+</header>"""
+
+
+# 다이얼로그 생성/닫기 공통 스크립트 (Element UI 구조와 동일하게 열 때 생성, 닫을 때 제거)
+DIALOG_SCRIPT = """
+function openDialog(extraClass, title, bodyHtml, footerHtml) {
+  const wrapper = document.createElement('div');
+  wrapper.className = 'el-dialog__wrapper';
+  wrapper.innerHTML = `<div class="el-dialog ${extraClass}">
+    <div class="el-dialog__header"><span class="el-dialog__title">${title}</span>
+      <button class="el-dialog__headerbtn"><i class="el-dialog__close">×</i></button></div>
+    <div class="el-dialog__body">${bodyHtml}</div>
+    <div class="el-dialog__footer">${footerHtml}</div></div>`;
+  wrapper.querySelector('.el-dialog__headerbtn').onclick = () => wrapper.remove();
+  document.body.appendChild(wrapper);
+  return wrapper;
+}
+document.querySelector('.gear-settings').onclick = () => {
+  document.querySelector('.settings-dropdown').toggleAttribute('hidden');
+};
+"""
+
+
+def _login_page(step: int, space_id: str = "", user_id: str = "") -> str:
+    if step == 1:
+        fields = '<input name="spaceId" placeholder="Space ID">'
+        action, label = "/login/space", "Next"
+    elif step == 2:
+        fields = (f'<input type="hidden" name="space" value="{html.escape(space_id)}">'
+                  '<input name="userId" placeholder="Email">')
+        action, label = "/login/user", "Log in with email"
+    else:
+        fields = (f'<input type="hidden" name="space" value="{html.escape(space_id)}">'
+                  f'<input type="hidden" name="user" value="{html.escape(user_id)}">'
+                  '<input type="password" name="userPassword" placeholder="Password">'
+                  '<label><input type="checkbox" name="remember"> Remember me</label>')
+        action, label = "/login/password", "Log in"
+
+    body = f"""
+<div class="login-container">
+  <form method="post" action="{action}">{fields}<button type="submit">{label}</button></form>
+</div>"""
+    return _layout("Beamo - Login", body)
+
+
+def _site_row(site: Dict) -> str:
+    bookmark = "★" if site["bookmarked"] else "☆"
+    return f"""
+<div class="building" data-id="{site['id']}">
+  <span class="building-name">{html.escape(site['name'])}</span>
+  <span class="building-address">{html.escape(site['address'])}</span>
+  <span class="building-last-updated">{site['last_updated']}</span>
+  <span class="bookmark-icon">{bookmark}</span>
+</div>"""
+
+
+def _dashboard_page(space_id: str, sites: List[Dict]) -> str:
+    rows = "".join(_site_row(site) for site in sites)
+    body = f"""
+<section class="el-container views-container">
+  {_header(space_id)}
+  <main class="el-main">
+    <div class="control-panel__content">
+      <div class="sort-filter-header">
+        <input placeholder="Search">
+        <div class="sort-select">Last updated</div>
+        <button class="refine-search">Refine search</button>
+        <button class="reset">Reset</button>
+        <button class="create-site-button">Create site</button>
+      </div>
+      <div class="list-container sites-list">{rows}</div>
+    </div>
+  </main>
+</section>"""
+    script = DIALOG_SCRIPT + """
+function renderSites(sites) {
+  const list = document.querySelector('.list-container');
+  list.innerHTML = sites.map(s => `<div class="building" data-id="${s.id}">
+    <span class="building-name">${s.name}</span><span class="building-address">${s.address}</span>
+    <span class="building-last-updated">${s.last_updated}</span>
+    <span class="bookmark-icon">${s.bookmarked ? '★' : '☆'}</span></div>`).join('');
+}
+document.querySelector('.list-container').addEventListener('click', (event) => {
+  const building = event.target.closest('.building');
+  if (building) location.href = '/sites/' + building.dataset.id;
+});
+const search = document.querySelector("input[placeholder='Search']");
+let pending = null;
+async function runSearch() {
+  const response = await fetch('/api/sites?q=' + encodeURIComponent(search.value));
+  renderSites(await response.json());
+}
+search.addEventListener('input', () => { clearTimeout(pending); pending = setTimeout(runSearch, 150); });
+search.addEventListener('keydown', (event) => { if (event.key === 'Enter') { clearTimeout(pending); runSearch(); } });
+document.querySelector('.create-site-button').onclick = () => {
+  const wrapper = openDialog('site-create-dialog', 'Create Site',
+    `<input placeholder="Enter a Name"><input placeholder="Enter an Address">
+     <input placeholder="Latitude"><input placeholder="Longitude"><input type="file">`,
+    `<button class="el-button el-button--default">Cancel</button>
+     <button class="el-button el-button--primary">Create</button>`);
+  wrapper.querySelector('.el-button--default').onclick = () => wrapper.remove();
+  wrapper.querySelector('.el-button--primary').onclick = async () => {
+    await fetch('/api/sites', {method: 'POST', headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify({name: wrapper.querySelector("input[placeholder='Enter a Name']").value,
+                            address: wrapper.querySelector("input[placeholder='Enter an Address']").value})});
+    wrapper.remove();
+  };
+};
+"""
+    return _layout("Beamo - Sites", body, script)
+
+
+def _site_detail_page(space_id: str, site: Dict, gallery_images: int) -> str:
+    gallery = "".join(
+        f'<div class="gallery-item"><img src="/gallery/thumbs/{site["id"]}_{index}.png"></div>'
+        for index in range(1, gallery_images + 1)
+    )
+    new_survey_hidden = "" if site["plans"] else "hidden"
+    body = f"""
+<section class="el-container views-container">
+  {_header(space_id)}
+  <main class="el-main">
+    <div class="control-panel__content">
+      <button class="control-panel__collapse-btn">«</button>
+      <div class="site-profile">
+        <h3>{html.escape(site['name'])}</h3>
+        <span class="site-address">{html.escape(site['address'])}</span>
+        <button class="site-profile__bookmark">☆</button>
+      </div>
+      <div class="plan-actions">
+        <div class="el-upload el-upload--picture">
+          <button class="el-button el-button--primary el-button--mini">+ Add plan</button>
+          <input type="file" hidden>
+        </div>
+        <button class="el-button el-button--primary el-button--mini create-survey-button" {new_survey_hidden}>+ New survey</button>
+      </div>
+      <div class="add-plan-guide">
+        <h4 class="guide-title">Add a new plan</h4>
+        <div class="guide-content">Upload floor plans to start surveying this site.</div>
+        <button class="el-button el-button--default el-button--small">Learn more</button>
+        <button class="el-button el-button--primary el-button--small">Got it</button>
+      </div>
+      <div class="measure-tools">
+        <button class="measure-tool distance-tool">Distance</button>
+        <button class="measure-tool area-tool">Area</button>
+        <button class="measure-tool volume-tool">Volume</button>
+        <button class="measure-tool angle-tool">Angle</button>
+      </div>
+      <div class="gallery">
+        <div class="el-upload el-upload--text">
+          <button class="el-button el-button--primary el-button--mini is-circle">+</button>
+          <input type="file" accept="image/*" hidden>
+        </div>
+        <div class="gallery-list">{gallery}</div>
+      </div>
+    </div>
+    <div class="viewer-container"><canvas></canvas><div class="viewer-controls"><button>Reset view</button></div></div>
+  </main>
+</section>"""
+    script = DIALOG_SCRIPT + f"""
+const siteId = {site['id']};
+document.querySelector('.add-plan-guide .el-button--primary').onclick = () => {{
+  document.querySelector('.add-plan-guide').remove();
+}};
+const planUpload = document.querySelector('.el-upload--picture');
+planUpload.querySelector('button').onclick = () => planUpload.querySelector('input').click();
+planUpload.querySelector('input').addEventListener('change', () => {{
+  const wrapper = openDialog('add-plan-dialog', 'Add plan',
+    'Each image will be added as a single plan.',
+    `<button class="el-button el-button--default">Cancel</button>
+     <button class="el-button el-button--primary">Add Plan</button>`);
+  wrapper.querySelector('.el-button--default').onclick = () => wrapper.remove();
+  wrapper.querySelector('.el-button--primary').onclick = async () => {{
+    const mask = document.createElement('div');
+    mask.className = 'el-loading-mask';
+    document.body.appendChild(mask);
+    await fetch(`/api/sites/${{siteId}}/plans`, {{method: 'POST'}});
+    mask.remove();
+    wrapper.remove();
+    document.querySelector('.create-survey-button').removeAttribute('hidden');
+    openDialog('survey-guide-dialog', 'Create a new survey',
+      '<div class="qr-code">QR</div>',
+      `<button class="el-button el-button--default">Download on the App Store</button>
+       <button class="el-button el-button--default">Learn more</button>
+       <button class="el-button el-button--primary">Got it</button>`);
+  }};
+}});
+document.querySelector('.create-survey-button').onclick = () => {{
+  const wrapper = openDialog('create-survey-dialog', 'New survey',
+    '<input type="text" placeholder="Survey Title">',
+    `<button class="el-button el-button--default el-button--small">Cancel</button>
+     <button class="el-button el-button--primary el-button--small">Add</button>`);
+  wrapper.querySelector('.el-button--default').onclick = () => wrapper.remove();
+  wrapper.querySelector('.el-button--primary').onclick = async () => {{
+    await fetch(`/api/sites/${{siteId}}/surveys`, {{method: 'POST', headers: {{'Content-Type': 'application/json'}},
+      body: JSON.stringify({{title: wrapper.querySelector('input').value}})}});
+    wrapper.remove();
+  }};
+}};
+const galleryUpload = document.querySelector('.el-upload--text');
+galleryUpload.querySelector('button').onclick = () => galleryUpload.querySelector('input').click();
+galleryUpload.querySelector('input').addEventListener('change', () => {{
+  const wrapper = openDialog('upload-dialog', 'Upload images', 'Selected images will be added to the gallery.',
+    `<button class="el-button el-button--default">Cancel</button>
+     <button class="el-button el-button--primary">Upload</button>`);
+  wrapper.querySelector('.el-button--default').onclick = () => wrapper.remove();
+  wrapper.querySelector('.el-button--primary').onclick = async () => {{
+    const response = await fetch(`/api/sites/${{siteId}}/gallery`, {{method: 'POST'}});
+    const item = await response.json();
+    document.querySelector('.gallery-list').insertAdjacentHTML('beforeend',
+      `<div class="gallery-item"><img src="${{item.src}}"></div>`);
+    wrapper.remove();
+  }};
+}});
+"""
+    return _layout(f"Beamo - {site['name']}", body, script)
+
+
+class PortalRequestHandler(BaseHTTPRequestHandler):
+    """Routes accounts.* requests to the login flow and {space}.* requests to the portal."""
+
+    server_version = "BeamoPortalStub/1.0"
+
+    @property
+    def state(self) -> PortalState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        logging.getLogger(__name__).debug("%s - %s", self.address_string(), format % args)
+
+    # ---- 라우팅 -------------------------------------------------------
+
+    def do_GET(self):
+        self._delay()
+        url = urlparse(self.path)
+        space_id = self._space_id()
+
+        if space_id is None:
+            if url.path == "/login":
+                return self._send_html(_login_page(1))
+            return self._redirect("/login")
+
+        if url.path == "/session":
+            token = parse_qs(url.query).get("token", [""])[0]
+            return self._redirect("/list", cookie=token)
+
+        if not self._authenticated(space_id):
+            return self._redirect(f"http://accounts.{self._base_host()}/login")
+
+        if url.path in ("/", "/list"):
+            return self._send_html(_dashboard_page(space_id, self.state.search("")))
+        if url.path.startswith("/sites/"):
+            site = self.state.find(self._int_segment(url.path, 2))
+            if site:
+                return self._send_html(_site_detail_page(space_id, site, self.state.gallery_images))
+        if url.path == "/api/sites":
+            return self._send_json(self.state.search(parse_qs(url.query).get("q", [""])[0]))
+        if url.path.startswith("/gallery/thumbs/"):
+            return self._send(200, PIXEL_PNG, "image/png")
+
+        self._send(404, b"Not Found", "text/plain")
+
+    def do_POST(self):
+        self._delay()
+        url = urlparse(self.path)
+        space_id = self._space_id()
+        form = self._read_body()
+
+        if space_id is None:
+            if url.path == "/login/space":
+                return self._send_html(_login_page(2, form.get("spaceId", "")))
+            if url.path == "/login/user":
+                return self._send_html(_login_page(3, form.get("space", ""), form.get("userId", "")))
+            if url.path == "/login/password":
+                space = form.get("space", "")
+                if not space or not form.get("user") or not form.get("userPassword"):
+                    return self._send_html(_login_page(1))
+                token = secrets.token_hex(16)
+                with self.state.lock:
+                    self.state.sessions[token] = space
+                return self._redirect(f"http://{space}.{self._base_host()}/session?token={token}")
+            return self._send(404, b"Not Found", "text/plain")
+
+        if not self._authenticated(space_id):
+            return self._send(401, b"Unauthorized", "text/plain")
+
+        if url.path == "/api/sites":
+            site = self.state.add_site(form.get("name") or "Untitled", form.get("address") or "")
+            return self._send_json(site)
+
+        site = self.state.find(self._int_segment(url.path, 3)) if url.path.startswith("/api/sites/") else None
+        if site is None:
+            return self._send(404, b"Not Found", "text/plain")
+
+        if url.path.endswith("/plans"):
+            # 플랜 변환 처리 시간 흉내
+            time.sleep(self.state.plan_delay)
+            with self.state.lock:
+                site["plans"] += 1
+            return self._send_json({"plans": site["plans"]})
+        if url.path.endswith("/surveys"):
+            with self.state.lock:
+                site["surveys"].append(form.get("title", ""))
+            return self._send_json({"surveys": len(site["surveys"])})
+        if url.path.endswith("/gallery"):
+            with self.state.lock:
+                site["gallery"].append(len(site["gallery"]) + 1)
+                index = self.state.gallery_images + len(site["gallery"])
+            return self._send_json({"src": f"/gallery/thumbs/{site['id']}_{index}.png"})
+
+        self._send(404, b"Not Found", "text/plain")
+
+    # ---- 헬퍼 ---------------------------------------------------------
+
+    def _delay(self) -> None:
+        with self.state.lock:
+            self.state.requests_served += 1
+            self.state.latency_injected += self.state.latency
+        if self.state.latency:
+            time.sleep(self.state.latency)
+
+    def _host(self) -> str:
+        return self.headers.get("Host", "localhost")
+
+    def _base_host(self) -> str:
+        """localhost:<port> part of the Host header (without accounts./space prefix)."""
+        host = self._host()
+        name, _, port = host.partition(":")
+        labels = name.split(".")
+        base = labels[-1] if labels[-1] == "localhost" else name
+        return f"{base}:{port}" if port else base
+
+    def _space_id(self) -> Optional[str]:
+        """Space ID from a {space}.localhost host, None for the accounts host."""
+        name = self._host().split(":")[0]
+        labels = name.split(".")
+        if len(labels) < 2 or labels[0] == "accounts" or labels[-1] != "localhost":
+            return None
+        return labels[0]
+
+    def _authenticated(self, space_id: str) -> bool:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        token = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+        with self.state.lock:
+            return token is not None and self.state.sessions.get(token) == space_id
+
+    def _read_body(self) -> Dict[str, str]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length).decode("utf-8") if length else ""
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            try:
+                return json.loads(raw or "{}")
+            except ValueError:
+                return {}
+        return {key: values[0] for key, values in parse_qs(raw).items()}
+
+    @staticmethod
+    def _int_segment(path: str, index: int) -> int:
+        try:
+            return int(path.strip("/").split("/")[index - 1])
+        except (IndexError, ValueError):
+            return -1
+
+    def _redirect(self, location: str, cookie: Optional[str] = None) -> None:
+        self.send_response(302)
+        self.send_header("Location", location)
+        if cookie:
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}={cookie}; Path=/; HttpOnly")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send_html(self, content: str) -> None:
+        self._send(200, content.encode("utf-8"), "text/html; charset=utf-8")
+
+    def _send_json(self, payload) -> None:
+        self._send(200, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class PortalStub:
+    """Threaded stand-in portal server that can run in the background of a benchmark."""
+
+    def __init__(self, port: int = 8765, sites: int = 50, latency_ms: int = 0,
+                 plan_delay_ms: int = 1500, gallery_images: int = 6, host: str = "127.0.0.1"):
+        self.state = PortalState(sites, latency_ms, plan_delay_ms, gallery_images)
+        self.server = ThreadingHTTPServer((host, port), PortalRequestHandler)
+        self.server.daemon_threads = True
+        self.server.state = self.state
+        self.thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    @property
+    def base_url(self) -> str:
+        """Accounts URL to use as EnvironmentConfig.base_url."""
+        return f"http://accounts.localhost:{self.port}"
+
+    def start(self) -> "PortalStub":
+        self.thread = threading.Thread(target=self.server.serve_forever, name="portal-stub", daemon=True)
+        self.thread.start()
+        self.logger.info(f"Portal stub listening on {self.base_url} "
+                         f"({len(self.state.sites)} sites, {self.state.latency * 1000:.0f}ms latency)")
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread:
+            self.thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    """Run the stand-in portal in the foreground."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Beamo 포털 로컬 대역 서버 (오프라인 벤치마크용)")
+    parser.add_argument("--port", type=int, default=8765, help="포트 (기본값: 8765)")
+    parser.add_argument("--sites", type=int, default=50, help="사이트 수 (기본값: 50)")
+    parser.add_argument("--latency-ms", type=int, default=0, help="요청당 지연 시간(ms)")
+    parser.add_argument("--plan-delay-ms", type=int, default=1500, help="플랜 변환 처리 시간(ms)")
+    parser.add_argument("--gallery-images", type=int, default=6, help="사이트당 갤러리 이미지 수")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    stub = PortalStub(args.port, args.sites, args.latency_ms, args.plan_delay_ms, args.gallery_images)
+    print(f"🌐 {stub.base_url}/login (Ctrl+C로 종료)")
+    try:
+        stub.start()
+        stub.thread.join()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Structured pytest result stream for Beamo automated testing platform.
+A pytest plugin that appends one JSON record per finished test to a JSONL
+file (``--result-stream PATH``), plus helpers for runners to read it back.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--result-stream", default=None, metavar="PATH",
+        help="append one JSON record per finished test to PATH (JSONL)",
+    )
+
+
+class ResultStream:
+    """Collects setup/call/teardown reports per test and writes one record when the test finishes."""
+
+    def __init__(self, path: str, marker_names: List[str]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.marker_names = set(marker_names)
+        self.environment = os.getenv("BEAMO_ENV", "dev")
+        self._reports: Dict[str, List[Any]] = {}
+        # 테스트가 끝날 때마다 한 줄씩 바로 기록 (중간에 죽어도 그때까지의 결과는 남음)
+        self._file = open(self.path, 'a', encoding='utf-8', buffering=1)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_runtest_logreport(self, report):
+        self._reports.setdefault(report.nodeid, []).append(report)
+        if report.when == "teardown":
+            self._write(build_record(self._reports.pop(report.nodeid), self.marker_names, self.environment))
+
+    def pytest_sessionfinish(self, session):
+        self._file.close()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+
+def build_record(reports: List[Any], marker_names: set, environment: str) -> Dict[str, Any]:
+    """One record from a test's setup/call/teardown reports."""
+    phases = {report.when: report for report in reports}
+    setup, call, teardown = phases.get("setup"), phases.get("call"), phases.get("teardown")
+
+    if setup is not None and setup.failed:
+        outcome, failed_report = "error", setup
+    elif call is not None and call.failed:
+        outcome, failed_report = "failed", call
+    elif teardown is not None and teardown.failed:
+        outcome, failed_report = "error", teardown
+    else:
+        failed_report = None
+        skipped = next((report for report in (setup, call) if report is not None and report.skipped), None)
+        if skipped is not None:
+            outcome = "xfailed" if hasattr(skipped, "wasxfail") else "skipped"
+        elif call is not None and hasattr(call, "wasxfail"):
+            outcome = "xpassed"
+        else:
+            outcome = "passed"
+
+    keywords = reports[0].keywords if reports else {}
+    properties = dict(teardown.user_properties) if teardown is not None else {}
+    record = {
+        "nodeid": reports[0].nodeid if reports else "",
+        "outcome": outcome,
+        "duration": round(sum(report.duration for report in reports), 3),
+        "markers": sorted(name for name in keywords if name in marker_names),
+        "env": environment,
+        "artifacts": properties.get("artifacts", []),
+    }
+    if failed_report is not None:
+        # 메일/요약용으로 예외 메시지 한 줄만 보관
+        crash = getattr(failed_report.longrepr, "reprcrash", None)
+        message = crash.message if crash is not None else str(failed_report.longrepr)
+        record["message"] = message.strip().splitlines()[0][:300] if message.strip() else ""
+    return record
+
+
+def pytest_configure(config):
+    path = config.getoption("result_stream", default=None)
+    # xdist 워커는 결과를 컨트롤러로 보내므로 컨트롤러에서만 기록
+    if path and not hasattr(config, "workerinput"):
+        marker_names = [line.split(":")[0].split("(")[0].strip() for line in config.getini("markers")]
+        config.pluginmanager.register(ResultStream(path, marker_names), "beamo_result_stream")
+
+
+def read_results(path: str) -> List[Dict[str, Any]]:
+    """Records from a result stream (a truncated last line is ignored)."""
+    results = []
+    stream = Path(path)
+    if not stream.exists():
+        return results
+    with open(stream, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return results
+
+
+class ResultTail:
+    """Reads a result stream incrementally while pytest is still writing it."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.results: List[Dict[str, Any]] = []
+        self._offset = 0
+        self._partial = ""
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Records appended since the last poll (incomplete trailing lines wait for the next poll)."""
+        if not self.path.exists():
+            return []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            f.seek(self._offset)
+            chunk = f.read()
+            self._offset = f.tell()
+        lines = (self._partial + chunk).split("\n")
+        self._partial = lines.pop()
+        new_results = []
+        for line in lines:
+            try:
+                new_results.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        self.results.extend(new_results)
+        return new_results
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Exact counts per outcome plus the list of failed tests."""
+    counts = {outcome: 0 for outcome in ("passed", "failed", "error", "skipped", "xfailed", "xpassed")}
+    for result in results:
+        counts[result["outcome"]] = counts.get(result["outcome"], 0) + 1
+    return {
+        "total_tests": len(results),
+        "passed_tests": counts["passed"] + counts["xpassed"],
+        "failed_tests": counts["failed"] + counts["error"],
+        "error_tests": counts["error"],
+        "skipped_tests": counts["skipped"] + counts["xfailed"],
+        "failures": [result for result in results if result["outcome"] in ("failed", "error")],
+    }
+
+
+def slowest(results: List[Dict[str, Any]], limit: int = 10) -> List[Dict[str, Any]]:
+    return sorted(results, key=lambda result: result["duration"], reverse=True)[:limit]
+
+
+def artifacts(results: List[Dict[str, Any]]) -> List[str]:
+    """Artifact paths recorded for this run's tests (existing files only)."""
+    return [path for result in results for path in result.get("artifacts", []) if Path(path).exists()]
+
+
+def default_path(environment: str) -> str:
+    return f"reports/{environment}/results.jsonl"
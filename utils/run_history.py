@@ -0,0 +1,208 @@
+"""
+SQLite run history for Beamo automated testing platform.
+Records every run (env, commit, portal build, start/end), per-test outcomes
+and durations, and optional per-step timings, with a small query API.
+"""
+
+import logging
+import os
+import sqlite3
+import subprocess
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    env TEXT NOT NULL,
+    commit_sha TEXT,
+    portal_build TEXT,
+    runner TEXT,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    status TEXT
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    env TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    PRIMARY KEY (run_id, nodeid)
+);
+CREATE INDEX IF NOT EXISTS idx_test_results_env_nodeid ON test_results (env, nodeid, run_id);
+CREATE TABLE IF NOT EXISTS step_timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    env TEXT NOT NULL,
+    test TEXT NOT NULL,
+    step TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    total REAL NOT NULL,
+    max REAL NOT NULL,
+    PRIMARY KEY (run_id, test, step)
+);
+CREATE INDEX IF NOT EXISTS idx_step_timings_env_step ON step_timings (env, step, run_id);
+"""
+
+
+def current_commit(cwd: Optional[str] = None) -> Optional[str]:
+    """HEAD commit of the test repository, if git is available."""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=cwd, timeout=5)
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Linear-interpolated percentile of a non-empty list."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class RunHistory:
+    """
+    Run history database (``reports/history.sqlite3`` by default, shared by all environments).
+
+    Connections are opened per call and the database runs in WAL mode, so
+    shard processes and runners can write concurrently.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or os.getenv("BEAMO_HISTORY_DB", "reports/history.sqlite3"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    # 기록
+    def start_run(self, env: str, commit: Optional[str] = None, portal_build: Optional[str] = None,
+                  runner: Optional[str] = None, started_at: Optional[float] = None) -> int:
+        """Create a run row and return its id (commit/portal build are detected when omitted)."""
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (env, commit_sha, portal_build, runner, started_at) VALUES (?, ?, ?, ?, ?)",
+                (env, commit or current_commit(), portal_build or os.getenv("BEAMO_PORTAL_BUILD"),
+                 runner, started_at or time.time()),
+            )
+            return cursor.lastrowid
+
+    def finish_run(self, run_id: int, status: str, ended_at: Optional[float] = None) -> None:
+        with self._connect() as connection:
+            connection.execute("UPDATE runs SET ended_at = ?, status = ? WHERE id = ?",
+                               (ended_at or time.time(), status, run_id))
+
+    def record_results(self, run_id: int, env: str, results: Iterable[Dict]) -> None:
+        """Per-test results: dicts with ``nodeid``, ``outcome`` and ``duration``."""
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO test_results (run_id, env, nodeid, outcome, duration) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, env, result["nodeid"], result["outcome"], float(result["duration"])) for result in results],
+            )
+
+    def record_steps(self, run_id: int, env: str, steps: Dict[tuple, Dict]) -> None:
+        """Per-step timings: ``{(test, step): {"count", "total", "max"}}``."""
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO step_timings (run_id, env, test, step, count, total, max) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, env, test, step, entry["count"], entry["total"], entry["max"])
+                 for (test, step), entry in steps.items()],
+            )
+
+    # 조회
+    def durations(self, env: str, nodeid: Optional[str] = None, last: int = 50,
+                  outcomes: Iterable[str] = ("passed", "flaky")) -> Dict[str, List[float]]:
+        """
+        Durations of the last ``last`` successful runs per test (newest first).
+
+        Failed runs are excluded by default: a test killed by its deadline
+        records roughly the deadline itself, which would ratchet p99 up.
+        """
+        outcomes = list(outcomes)
+        query = f"""
+            SELECT nodeid, duration FROM (
+                SELECT nodeid, duration, ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC) AS recency
+                FROM test_results
+                WHERE env = ? {"AND nodeid = ?" if nodeid else ""} AND outcome IN ({", ".join("?" * len(outcomes))})
+            ) WHERE recency <= ?
+        """
+        params = [env] + ([nodeid] if nodeid else []) + outcomes + [last]
+        result: Dict[str, List[float]] = {}
+        with self._connect() as connection:
+            for row in connection.execute(query, params):
+                result.setdefault(row["nodeid"], []).append(row["duration"])
+        return result
+
+    def percentiles(self, env: str, nodeid: Optional[str] = None, last: int = 50) -> Dict[str, Dict[str, float]]:
+        """p50/p95/p99 duration per test over its last ``last`` passing runs."""
+        return {
+            test: {
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+                "count": len(values),
+            }
+            for test, values in self.durations(env, nodeid, last).items()
+        }
+
+    def last_outcomes(self, env: str, nodeid: str, n: int = 10) -> List[str]:
+        """Outcomes of the test's last ``n`` runs, newest first."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT outcome FROM test_results WHERE env = ? AND nodeid = ? ORDER BY run_id DESC LIMIT ?",
+                (env, nodeid, n),
+            ).fetchall()
+        return [row["outcome"] for row in rows]
+
+    def recent_outcomes(self, env: str, last: int = 20) -> Dict[str, List[str]]:
+        """Outcomes of every test's last ``last`` runs, newest first."""
+        query = """
+            SELECT nodeid, outcome FROM (
+                SELECT nodeid, outcome, run_id,
+                       ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC) AS recency
+                FROM test_results WHERE env = ?
+            ) WHERE recency <= ? ORDER BY nodeid, run_id DESC
+        """
+        result: Dict[str, List[str]] = {}
+        with self._connect() as connection:
+            for row in connection.execute(query, (env, last)):
+                result.setdefault(row["nodeid"], []).append(row["outcome"])
+        return result
+
+    def step_percentiles(self, env: str, step: Optional[str] = None, last: int = 50) -> Dict[str, Dict[str, float]]:
+        """p50/p95 of a page-object step's total time per test run."""
+        query = "SELECT step, total FROM step_timings WHERE env = ?" + (" AND step = ?" if step else "")
+        query += " ORDER BY run_id DESC"
+        values: Dict[str, List[float]] = {}
+        with self._connect() as connection:
+            for row in connection.execute(query, [env] + ([step] if step else [])):
+                if len(values.setdefault(row["step"], [])) < last:
+                    values[row["step"]].append(row["total"])
+        return {
+            name: {"p50": percentile(totals, 0.50), "p95": percentile(totals, 0.95), "count": len(totals)}
+            for name, totals in values.items()
+        }
+
+    def recent_runs(self, env: str, n: int = 10) -> List[Dict]:
+        with self._connect() as connection:
+            rows = connection.execute("SELECT * FROM runs WHERE env = ? ORDER BY id DESC LIMIT ?", (env, n)).fetchall()
+        return [dict(row) for row in rows]
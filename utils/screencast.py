@@ -0,0 +1,155 @@
+"""
+In-memory screencast ring buffer for Beamo automated testing platform.
+Keeps the last N seconds of CDP Page.startScreencast JPEG frames per page and
+encodes them to a WebM video only when a test fails.
+"""
+
+import asyncio
+import base64
+import glob
+import logging
+import os
+import shutil
+import subprocess
+from collections import deque
+from pathlib import Path
+from typing import Deque, List, Optional, Tuple
+from playwright.async_api import Page
+
+
+# 인코딩 시 고정 프레임레이트 (화면 변화가 없던 구간은 직전 프레임을 반복)
+OUTPUT_FPS = 10
+
+
+def find_ffmpeg() -> Optional[str]:
+    """ffmpeg on PATH, or the one installed with ``playwright install ffmpeg``."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        return ffmpeg
+    browsers_path = os.getenv("PLAYWRIGHT_BROWSERS_PATH") or os.path.expanduser("~/.cache/ms-playwright")
+    for pattern in ("ffmpeg-*/ffmpeg-linux", "ffmpeg-*/ffmpeg-mac", "ffmpeg-*/ffmpeg-win64.exe"):
+        matches = sorted(glob.glob(os.path.join(browsers_path, pattern)))
+        if matches:
+            return matches[-1]
+    return None
+
+
+class ScreencastBuffer:
+    """
+    Bounded ring buffer of screencast frames for one page.
+
+    Frames are kept as the base64 strings CDP delivers (decoded only when a
+    video is written) and anything older than ``seconds`` behind the newest
+    frame is dropped, so a passing test costs a CDP stream and a few MB of
+    memory and no disk I/O.
+    """
+
+    def __init__(self, page: Page, seconds: int = 10, quality: int = 60,
+                 max_width: int = 1280, max_height: int = 720, every_nth_frame: int = 2):
+        self.page = page
+        self.seconds = seconds
+        self.quality = quality
+        self.max_width = max_width
+        self.max_height = max_height
+        self.every_nth_frame = every_nth_frame
+        # 3D 뷰어처럼 계속 다시 그리는 화면에서도 메모리 상한 유지 (최대 약 30fps 기준)
+        self.frames: Deque[Tuple[float, str]] = deque(maxlen=seconds * 30)  # (timestamp, base64 JPEG)
+        self.session = None
+        self.logger = logging.getLogger(__name__)
+
+    async def start(self) -> None:
+        """Attach a CDP session to the page and start streaming frames into the buffer."""
+        if self.session is not None:
+            return
+        try:
+            self.session = await self.page.context.new_cdp_session(self.page)
+            self.session.on("Page.screencastFrame", self._on_frame)
+            await self.session.send("Page.startScreencast", {
+                "format": "jpeg",
+                "quality": self.quality,
+                "maxWidth": self.max_width,
+                "maxHeight": self.max_height,
+                "everyNthFrame": self.every_nth_frame,
+            })
+        except Exception as e:
+            self.logger.warning(f"Screencast unavailable: {e}")
+            self.session = None
+
+    def _on_frame(self, event: dict) -> None:
+        timestamp = event.get("metadata", {}).get("timestamp") or 0.0
+        self.frames.append((timestamp, event["data"]))
+        while self.frames and timestamp - self.frames[0][0] > self.seconds:
+            self.frames.popleft()
+        # 다음 프레임을 받으려면 ack 필요
+        asyncio.ensure_future(self._ack(event["sessionId"]))
+
+    async def _ack(self, session_id: int) -> None:
+        try:
+            await self.session.send("Page.screencastFrameAck", {"sessionId": session_id})
+        except Exception:
+            pass  # 세션이 이미 닫힌 경우
+
+    async def stop(self) -> None:
+        """Stop streaming and detach; buffered frames are kept until clear()."""
+        if self.session is None:
+            return
+        session, self.session = self.session, None
+        try:
+            await session.send("Page.stopScreencast")
+            await session.detach()
+        except Exception as e:
+            self.logger.debug(f"Screencast already stopped: {e}")
+
+    def snapshot(self) -> List[Tuple[float, str]]:
+        return list(self.frames)
+
+    def clear(self) -> None:
+        self.frames.clear()
+
+    async def save(self, path: Path, frames: Optional[List[Tuple[float, str]]] = None) -> Optional[Path]:
+        """Encode buffered frames to a WebM file off the event loop."""
+        frames = frames if frames is not None else self.snapshot()
+        if not frames:
+            self.logger.warning("No screencast frames buffered, video not written")
+            return None
+        return await asyncio.to_thread(encode_frames, frames, Path(path))
+
+
+def encode_frames(frames: List[Tuple[float, str]], path: Path) -> Optional[Path]:
+    """
+    Write frames to ``path`` with ffmpeg, repeating each frame for as long as it
+    was on screen. Without ffmpeg the JPEG frames are written to ``<path>_frames/``.
+    """
+    logger = logging.getLogger(__name__)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ffmpeg = find_ffmpeg()
+
+    if not ffmpeg:
+        frame_dir = path.with_name(f"{path.stem}_frames")
+        frame_dir.mkdir(parents=True, exist_ok=True)
+        for index, (_, data) in enumerate(frames):
+            (frame_dir / f"{index:05d}.jpg").write_bytes(base64.b64decode(data))
+        logger.warning(f"ffmpeg not found, screencast frames written to {frame_dir}")
+        return frame_dir
+
+    command = [
+        ffmpeg, "-loglevel", "error", "-f", "image2pipe", "-c:v", "mjpeg",
+        "-framerate", str(OUTPUT_FPS), "-i", "pipe:0", "-y", "-an",
+        "-c:v", "vp8", "-deadline", "realtime", "-b:v", "1M", str(path),
+    ]
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        for index, (timestamp, data) in enumerate(frames):
+            # 다음 프레임까지 화면에 있던 시간만큼 반복 (마지막 프레임은 1초)
+            next_timestamp = frames[index + 1][0] if index + 1 < len(frames) else timestamp + 1
+            repeats = max(1, round((next_timestamp - timestamp) * OUTPUT_FPS))
+            jpeg = base64.b64decode(data)
+            for _ in range(repeats):
+                process.stdin.write(jpeg)
+    except BrokenPipeError:
+        pass
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        logger.error(f"ffmpeg failed to encode screencast: {stderr.decode(errors='replace').strip()}")
+        return None
+    return path
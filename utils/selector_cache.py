@@ -0,0 +1,130 @@
+"""
+Persistent selector-resolution cache for Beamo automated testing platform.
+Remembers which candidate of a fallback chain worked, per environment and page,
+so the next run tries it first.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+try:
+    import fcntl  # 샤드 프로세스 간 파일 잠금 (POSIX)
+except ImportError:
+    fcntl = None
+
+
+class SelectorResolver:
+    """
+    Orders fallback candidates by what worked last time.
+
+    Entries are stored in ``reports/<env>/selector_cache.json`` as
+    ``{page: {key: {"winner": candidate, "misses": n}}}``. A winner that
+    misses ``demote_after`` times in a row is replaced by the candidate that
+    succeeded instead.
+    """
+
+    _file_lock = threading.Lock()
+
+    def __init__(self, environment: str, page_name: str, path: Optional[str] = None, demote_after: int = 3):
+        self.path = Path(path or f"reports/{environment}/selector_cache.json")
+        self.page_name = page_name
+        self.demote_after = demote_after
+        self.logger = logging.getLogger(__name__)
+        self.entries: Dict[str, Dict] = self._read().get(page_name, {})
+
+    def order(self, key: str, candidates: List[str]) -> List[str]:
+        """Candidates with the cached winner first, the rest in their original order."""
+        winner = self.entries.get(key, {}).get("winner")
+        if winner in candidates:
+            return [winner] + [candidate for candidate in candidates if candidate != winner]
+        return list(candidates)
+
+    def record(self, key: str, candidate: Optional[str]) -> None:
+        """
+        Record which candidate resolved ``key`` (None if none did) and persist it.
+
+        The entry is re-read, updated and written under the file lock, so
+        shard processes sharing the cache don't overwrite each other.
+        """
+        with self._locked():
+            data = self._read()
+            self.entries = data.setdefault(self.page_name, {})
+            entry = self.entries.setdefault(key, {"winner": None, "misses": 0})
+            winner = entry["winner"]
+
+            if candidate is not None and candidate == winner:
+                entry["misses"] = 0
+            else:
+                entry["misses"] = entry["misses"] + 1 if winner else 0
+                if winner is None or entry["misses"] >= self.demote_after:
+                    if winner:
+                        self.logger.info(f"Demoting selector for {self.page_name}.{key}: {winner} -> {candidate}")
+                    entry["winner"] = candidate
+                    entry["misses"] = 0
+
+            self._write(data)
+
+    async def resolve(self, key: str, candidates: List[str],
+                      attempt: Callable[[str], Awaitable[bool]]) -> Optional[str]:
+        """
+        Try candidates (cached winner first) until ``attempt`` returns True.
+
+        Args:
+            key: Name of the fallback chain (e.g. "first_site")
+            candidates: Selectors/strategies in their default order
+            attempt: Coroutine that tries one candidate and reports success
+
+        Returns:
+            Optional[str]: The candidate that succeeded, or None
+        """
+        for candidate in self.order(key, candidates):
+            try:
+                if await attempt(candidate):
+                    self.record(key, candidate)
+                    return candidate
+            except Exception as e:
+                self.logger.debug(f"Selector candidate failed for {self.page_name}.{key}: {candidate} ({e})")
+        self.record(key, None)
+        return None
+
+    def _read(self) -> Dict:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Failed to read selector cache {self.path}: {e}")
+            return {}
+
+    @contextmanager
+    def _locked(self):
+        """Serialise read-merge-write across threads and, on POSIX, across shard processes."""
+        with self._file_lock:
+            if fcntl is None:
+                yield
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path.with_name(self.path.name + ".lock"), 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write(self, data: Dict) -> None:
+        """Replace the cache file atomically (caller holds the lock)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.warning(f"Failed to write selector cache {self.path}: {e}")
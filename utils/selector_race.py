@@ -0,0 +1,75 @@
+"""
+Selector race primitive for Beamo automated testing platform.
+Waits on many candidate selectors / URL predicates at once and reports the
+first one that matches, so the worst case is one timeout instead of the sum.
+"""
+
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional
+from playwright.async_api import Page, ElementHandle
+
+
+logger = logging.getLogger(__name__)
+
+
+class RaceResult:
+    """Winner of a selector race."""
+
+    def __init__(self, label: str, element: Optional[ElementHandle] = None):
+        self.label = label  # 매칭된 셀렉터 또는 URL 조건 이름
+        self.element = element  # 셀렉터가 이긴 경우 해당 요소
+
+    def __repr__(self) -> str:
+        return f"RaceResult({self.label!r})"
+
+
+async def race(page: Page, selectors: Optional[List[str]] = None,
+               url_predicates: Optional[Dict[str, Callable[[str], bool]]] = None,
+               timeout: float = 5000, state: str = "visible") -> Optional[RaceResult]:
+    """
+    Wait for the first of several selectors or URL predicates to match.
+
+    If several candidates match in the same turn, the one listed first wins,
+    so callers can pass candidates in priority order.
+
+    Args:
+        page: Playwright page
+        selectors: Candidate selectors (Playwright selector syntax)
+        url_predicates: Label -> predicate on the page URL
+        timeout: Overall timeout in milliseconds
+        state: Element state to wait for ("visible", "attached", ...)
+
+    Returns:
+        Optional[RaceResult]: Winning candidate, or None if nothing matched in time
+    """
+    candidates = []
+    for selector in selectors or []:
+        candidates.append((selector, True, page.wait_for_selector(selector, state=state, timeout=timeout)))
+    for label, predicate in (url_predicates or {}).items():
+        candidates.append((label, False, page.wait_for_url(predicate, timeout=timeout)))
+
+    if not candidates:
+        return None
+
+    tasks = {asyncio.ensure_future(waiter): (priority, label, is_selector)
+             for priority, (label, is_selector, waiter) in enumerate(candidates)}
+    pending = set(tasks)
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            matched = sorted(
+                (tasks[task] + (task,) for task in done if task.exception() is None),
+                key=lambda item: item[0],
+            )
+            if matched:
+                _, label, is_selector, task = matched[0]
+                logger.debug(f"Selector race won by: {label}")
+                return RaceResult(label, task.result() if is_selector else None)
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
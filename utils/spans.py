@@ -0,0 +1,217 @@
+"""
+Step-level timing spans for Beamo page objects.
+Records every public page-object coroutine as a span (name, start, duration,
+outcome, nesting) per test into reports/<env>/spans.jsonl; only per-step
+totals of the most recent tests are kept in memory.
+"""
+
+import functools
+import inspect
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, List, Tuple
+from .har_replay import current_flow, flow_name
+from .cdp_metrics import CdpMetricsSampler, cdp_metrics_enabled, sampler_for
+
+
+# 현재 실행 중인 span id 스택 (태스크별로 분리되어 중첩 관계를 유지)
+_span_stack: ContextVar[Tuple[int, ...]] = ContextVar("span_stack", default=())
+
+
+class SpanRecorder:
+    """
+    Appends page-object spans to a JSONL stream and keeps per-step totals per test.
+
+    Each line is one finished span:
+    ``{"test", "id", "parent", "depth", "name", "start", "dur", "outcome"[, "error"][, "cdp"]}``
+    where ``start`` is epoch seconds, ``dur`` is seconds and ``cdp`` holds the
+    Performance.getMetrics deltas of the step when CDP sampling is enabled.
+    Memory holds only the totals of the last ``max_tests`` tests; the full
+    spans stay in the stream.
+    """
+
+    def __init__(self, reports_dir: str = "reports", max_tests: int = 500):
+        self.reports_dir = Path(reports_dir)
+        self.max_tests = max_tests
+        # 테스트 -> 단계 이름 -> 합계 (오래된 테스트부터 제거)
+        self.steps: "OrderedDict[str, Dict[str, Dict]]" = OrderedDict()
+        self.logger = logging.getLogger(__name__)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        with self._lock:
+            return next(self._ids)
+
+    def path(self, environment: str) -> Path:
+        return self.reports_dir / environment / "spans.jsonl"
+
+    def record(self, environment: str, span: Dict) -> None:
+        """Add the span to its test's step totals and append it to reports/<env>/spans.jsonl."""
+        with self._lock:
+            self._aggregate(span)
+            try:
+                path = self.path(environment)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(span, ensure_ascii=False, separators=(',', ':')) + "\n")
+            except Exception as e:
+                self.logger.warning(f"Failed to write span {span['name']}: {e}")
+
+    def _aggregate(self, span: Dict) -> None:
+        """Fold one span into its test's step totals (caller holds the lock)."""
+        steps = self.steps.get(span["test"])
+        if steps is None:
+            steps = self.steps[span["test"]] = {}
+            while len(self.steps) > self.max_tests:
+                self.steps.popitem(last=False)
+        entry = steps.setdefault(span["name"], {"count": 0, "total": 0.0, "max": 0.0, "errors": 0, "depth": span["depth"], "top": 0.0})
+        entry["count"] += 1
+        entry["total"] += span["dur"]
+        entry["top"] += span["dur"] if span["depth"] == 0 else 0.0  # 테스트가 직접 호출한 시간
+        entry["max"] = max(entry["max"], span["dur"])
+        entry["errors"] += 0 if span["outcome"] == "ok" else 1
+        entry["depth"] = min(entry["depth"], span["depth"])
+        for metric, change in span.get("cdp", {}).items():
+            cdp = entry.setdefault("cdp", {})
+            cdp[metric] = round(cdp.get(metric, 0) + change, 1)
+
+    def summary(self, test: str) -> Dict[str, Dict]:
+        """
+        Per-step totals for one test: count, total/max seconds, errors, the
+        shallowest depth the step ran at (0 = called by the test itself), the
+        seconds it ran at top level and summed CDP metric deltas (when sampled).
+        """
+        with self._lock:
+            steps = self.steps.get(test, {})
+            return {name: dict(entry, **({"cdp": dict(entry["cdp"])} if "cdp" in entry else {}))
+                    for name, entry in steps.items()}
+
+    def top_level_time(self, test: str) -> float:
+        """Time spent in top-level steps, so nested steps are not counted twice."""
+        return sum(entry["top"] for entry in self.summary(test).values())
+
+    def slowest(self, test: str, limit: int = 5) -> List[Tuple[str, Dict]]:
+        """Top-level steps of one test ordered by total time."""
+        steps = [(name, entry) for name, entry in self.summary(test).items() if entry["depth"] == 0]
+        return sorted(steps, key=lambda item: item[1]["total"], reverse=True)[:limit]
+
+    def tests(self) -> List[str]:
+        with self._lock:
+            return list(self.steps)
+
+    def discard(self, test: str) -> None:
+        """Drop one test's totals once they have been reported."""
+        with self._lock:
+            self.steps.pop(test, None)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.steps.clear()
+
+
+# 프로세스 전체에서 공유하는 span 기록
+span_recorder = SpanRecorder()
+
+
+def step_totals(path: str, since: float = 0.0) -> Dict[Tuple[str, str], Dict]:
+    """
+    Per-(test, step) count/total/max seconds from a spans.jsonl file, limited
+    to spans that started at or after ``since`` (e.g. the current run).
+    """
+    result: Dict[Tuple[str, str], Dict] = {}
+    stream = Path(path)
+    if not stream.exists():
+        return result
+    with open(stream, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                span = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if span.get("start", 0) < since:
+                continue
+            entry = result.setdefault((span["test"], span["name"]), {"count": 0, "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += span["dur"]
+            entry["max"] = max(entry["max"], span["dur"])
+    return result
+
+
+def span_test() -> str:
+    """
+    Test a span belongs to: the flow set by run_flows(), else the running
+    pytest node ID, so same-named tests in different modules stay apart.
+    """
+    flow = current_flow.get()
+    if flow:
+        return flow
+    # "tests/smoke/test_x.py::test_func (call)" -> "tests/smoke/test_x.py::test_func"
+    current_test = os.getenv("PYTEST_CURRENT_TEST", "")
+    return current_test.rsplit(" ", 1)[0] if current_test else flow_name()
+
+
+def _spanned(name: str, method):
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        config = getattr(self, "config", None)
+        environment = getattr(config, "environment", None) or os.getenv("BEAMO_ENV", "dev")
+        stack = _span_stack.get()
+        span_id = span_recorder.next_id()
+        token = _span_stack.set(stack + (span_id,))
+
+        page = getattr(self, "page", None)
+        sampler = sampler_for(page) if page is not None and cdp_metrics_enabled(config) else None
+        before = await sampler.sample() if sampler else None
+
+        start = time.time()
+        start_time = time.perf_counter()
+        outcome, error = "ok", None
+        try:
+            return await method(self, *args, **kwargs)
+        except BaseException as e:
+            outcome, error = "error", f"{type(e).__name__}: {e}"[:200]
+            raise
+        finally:
+            _span_stack.reset(token)
+            span = {
+                "test": span_test(),
+                "id": span_id,
+                "parent": stack[-1] if stack else None,
+                "depth": len(stack),
+                "name": name,
+                "start": round(start, 3),
+                "dur": round(time.perf_counter() - start_time, 4),
+                "outcome": outcome,
+            }
+            if error:
+                span["error"] = error
+            if before:
+                # 단계 전후 CDP 지표 차이 (힙/노드/레이아웃/스타일 재계산/스크립트·태스크 시간)
+                cdp = CdpMetricsSampler.delta(before, await sampler.sample())
+                if cdp:
+                    span["cdp"] = cdp
+            span_recorder.record(environment, span)
+
+    return wrapper
+
+
+def record_spans(cls):
+    """
+    Class decorator: record every public coroutine method of a page object as a span.
+
+    Span names are ``<ClassName>.<method>``; the environment is taken from
+    ``self.config.environment``.
+    """
+    for attr, method in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.iscoroutinefunction(method):
+            continue
+        setattr(cls, attr, _spanned(f"{cls.__name__}.{attr}", method))
+    return cls
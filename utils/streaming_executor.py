@@ -0,0 +1,167 @@
+"""
+Streaming subprocess executor for Beamo test runners.
+Tees a child process's output line by line to the console and a rotating log
+file, keeps only a bounded tail in memory, and stops cleanly on timeout.
+"""
+
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional
+
+
+def terminate_process_group(process: subprocess.Popen, grace_period: float = 10.0) -> None:
+    """SIGTERM the child's process group, then SIGKILL if it doesn't exit in time.
+
+    The child must have been started with ``start_new_session=True`` on POSIX
+    so that its group holds only it and its descendants (e.g. browsers).
+    """
+    for sig in (signal.SIGTERM, getattr(signal, "SIGKILL", signal.SIGTERM)):
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, sig)
+            elif sig == signal.SIGTERM:
+                process.terminate()
+            else:
+                process.kill()
+        except ProcessLookupError:
+            return
+        try:
+            process.wait(timeout=grace_period)
+            return
+        except subprocess.TimeoutExpired:
+            continue
+
+
+class ExecutionResult:
+    """Outcome of a streamed subprocess run."""
+
+    def __init__(self, returncode: Optional[int], timed_out: bool, duration: float, tail: List[str]):
+        self.returncode = returncode  # 타임아웃으로 종료된 경우 None
+        self.timed_out = timed_out
+        self.duration = duration
+        self.tail = tail  # 마지막 출력 줄들 (오류 메시지용)
+
+    @property
+    def output_tail(self) -> str:
+        return "\n".join(self.tail)
+
+
+class StreamingExecutor:
+    """
+    Runs a command and streams its merged stdout/stderr.
+
+    Memory use is bounded by ``tail_lines`` regardless of how much the child
+    prints; the full output goes to ``log_path`` (rotated at ``max_bytes``).
+    """
+
+    def __init__(self, log_path: str, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3,
+                 tail_lines: int = 200, echo: bool = True):
+        self.log_path = Path(log_path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.tail_lines = tail_lines
+        self.echo = echo
+        self.logger = logging.getLogger(__name__)
+        self.process: Optional[subprocess.Popen] = None  # 실행 중인 자식 프로세스 (stop() 용)
+        self._stopped = False
+
+    def run(self, cmd: List[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None, on_line: Optional[Callable[[str], None]] = None,
+            grace_period: float = 10.0) -> ExecutionResult:
+        """
+        Run ``cmd`` until it exits or ``timeout`` seconds pass.
+
+        Args:
+            cmd: Command and arguments
+            cwd: Working directory
+            env: Environment for the child
+            timeout: Seconds before the child (and its process group) is terminated
+            on_line: Called with every output line as it arrives
+            grace_period: Seconds between SIGTERM and SIGKILL on timeout
+
+        Returns:
+            ExecutionResult: Return code (None on timeout), timeout flag, duration and output tail
+        """
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        output_log = self._output_logger()
+        tail: Deque[str] = deque(maxlen=self.tail_lines)
+
+        start_time = time.monotonic()
+        self.process = process = subprocess.Popen(
+            cmd, cwd=cwd, env=env,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding="utf-8", errors="replace", bufsize=1,
+            # 타임아웃 시 pytest가 띄운 브라우저까지 함께 종료하기 위해 별도 프로세스 그룹으로 실행
+            start_new_session=(os.name == "posix"),
+        )
+
+        def pump() -> None:
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                tail.append(line)
+                output_log.info(line)
+                if self.echo:
+                    sys.stdout.write(line + "\n")
+                    sys.stdout.flush()
+                if on_line:
+                    try:
+                        on_line(line)
+                    except Exception as e:
+                        self.logger.debug(f"Output callback failed: {e}")
+
+        reader = threading.Thread(target=pump, name="streaming-executor", daemon=True)
+        reader.start()
+        if self._stopped:
+            # Popen 직전에 stop()이 호출된 경우
+            terminate_process_group(process, grace_period)
+
+        timed_out = False
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            self.logger.error(f"Command timed out after {timeout}s, terminating (partial output kept in {self.log_path})")
+            terminate_process_group(process, grace_period)
+
+        reader.join(timeout=grace_period)
+        for handler in list(output_log.handlers):
+            handler.close()
+            output_log.removeHandler(handler)
+
+        return ExecutionResult(
+            None if timed_out else process.returncode,
+            timed_out,
+            time.monotonic() - start_time,
+            list(tail),
+        )
+
+    def stop(self, grace_period: float = 10.0) -> None:
+        """
+        Terminate the running child and its process group from another thread.
+
+        run() then returns as soon as the child has exited; a run() that has
+        not started its child yet terminates it right away.
+        """
+        self._stopped = True
+        if self.process is not None and self.process.poll() is None:
+            self.logger.warning(f"Stopping command (output kept in {self.log_path})")
+            terminate_process_group(self.process, grace_period)
+
+    def _output_logger(self) -> logging.Logger:
+        """Dedicated non-propagating logger that writes raw lines to the rotating log file."""
+        output_log = logging.getLogger(f"{__name__}.output.{self.log_path}")
+        output_log.setLevel(logging.INFO)
+        output_log.propagate = False
+        handler = RotatingFileHandler(self.log_path, maxBytes=self.max_bytes,
+                                      backupCount=self.backup_count, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        output_log.addHandler(handler)
+        return output_log
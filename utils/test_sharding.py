@@ -0,0 +1,169 @@
+"""
+Duration-balanced test sharding for Beamo automated testing platform.
+Splits the pytest suite across worker processes using recorded durations.
+"""
+
+import heapq
+import json
+import logging
+import re
+import statistics
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class DurationStore:
+    """
+    Historical per-test durations (exponential moving average) kept as JSON.
+
+    When a ``RunHistory`` is given, the median of each test's recent recorded
+    runs takes precedence over the moving average.
+    """
+
+    def __init__(self, environment: str, path: Optional[str] = None, alpha: float = 0.3,
+                 default_duration: float = 30.0, history=None):
+        self.path = Path(path or f"reports/{environment}/test_durations.json")
+        self.alpha = alpha
+        self.default_duration = default_duration
+        self.durations: Dict[str, float] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.durations = json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to read test durations {self.path}: {e}")
+        if history is not None:
+            try:
+                self.durations.update(
+                    {nodeid: stats["p50"] for nodeid, stats in history.percentiles(environment).items()}
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read run history: {e}")
+
+    def estimate(self, nodeid: str) -> float:
+        """Expected duration; unseen tests get the median of known tests."""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return self.default_duration
+
+    def record(self, nodeid: str, duration: float) -> None:
+        """Blend a new measurement into the moving average."""
+        previous = self.durations.get(nodeid)
+        if previous is None:
+            self.durations[nodeid] = duration
+        else:
+            self.durations[nodeid] = self.alpha * duration + (1 - self.alpha) * previous
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+
+
+def plan_shards(nodeids: List[str], shards: int, estimate,
+                pinned: Iterable[str] = ()) -> List[List[str]]:
+    """
+    Longest-processing-time-first bin packing.
+
+    Tests are sorted by expected duration (longest first) and each one goes to
+    the currently least-loaded shard. ``pinned`` tests (those sharing portal
+    data) all go to the first shard, in collection order, so they never run
+    at the same time as each other; the rest are packed around them.
+
+    Args:
+        nodeids: Collected pytest node IDs
+        shards: Number of worker processes
+        estimate: Callable returning the expected duration of a node ID
+        pinned: Node IDs that must share one shard
+
+    Returns:
+        List[List[str]]: Node IDs per shard (empty shards are dropped)
+    """
+    pinned = set(pinned)
+    serial = [nodeid for nodeid in nodeids if nodeid in pinned]
+    rest = [nodeid for nodeid in nodeids if nodeid not in pinned]
+
+    shards = max(1, min(shards, len(rest) + (1 if serial else 0))) if nodeids else 1
+    heap = [(sum(estimate(nodeid) for nodeid in serial) if index == 0 else 0.0, index) for index in range(shards)]
+    heapq.heapify(heap)
+    plan: List[List[str]] = [list(serial) if index == 0 else [] for index in range(shards)]
+
+    for nodeid in sorted(rest, key=estimate, reverse=True):
+        load, index = heapq.heappop(heap)
+        plan[index].append(nodeid)
+        heapq.heappush(heap, (load + estimate(nodeid), index))
+
+    return [shard for shard in plan if shard]
+
+
+def collect_nodeids(test_path: str = "tests", cwd: Optional[Path] = None,
+                    marker: Optional[str] = None) -> List[str]:
+    """
+    Collect test node IDs with ``pytest --collect-only -q``.
+
+    Args:
+        test_path: Test directory or file
+        cwd: Working directory for pytest
+        marker: Only collect tests matching this ``-m`` expression
+
+    Raises:
+        RuntimeError: If collection fails (import/syntax errors), instead of
+            planning shards from a partial list
+    """
+    cmd = [sys.executable, "-m", "pytest", test_path, "--collect-only", "-q", "-p", "no:cacheprovider"]
+    if marker:
+        cmd += ["-m", marker]
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)
+    # 0 = 정상, 5 = 수집된 테스트 없음
+    if result.returncode not in (0, 5):
+        tail = "\n".join((result.stdout + result.stderr).strip().splitlines()[-20:])
+        raise RuntimeError(f"Test collection failed (exit code {result.returncode}):\n{tail}")
+    return [line.strip() for line in result.stdout.splitlines() if "::" in line and not line.startswith(" ")]
+
+
+def _junit_key(nodeid: str) -> tuple:
+    """(classname, name) that pytest's junitxml reporter produces for a node ID."""
+    path, bracket, params = nodeid.partition("[")
+    names = path.split("::")
+    names[0] = re.sub(r"\.py$", "", names[0].replace("/", "."))
+    names[-1] += bracket + params
+    return ".".join(names[:-1]), names[-1]
+
+
+def parse_junit(xml_path: Path, nodeids: List[str]) -> Dict[str, Dict]:
+    """
+    Read per-test outcome and duration from a JUnit XML report.
+
+    Returns:
+        Dict[str, Dict]: nodeid -> {"outcome", "duration"}
+    """
+    by_key = {_junit_key(nodeid): nodeid for nodeid in nodeids}
+    results: Dict[str, Dict] = {}
+
+    if not xml_path.exists():
+        return results
+
+    for case in ET.parse(xml_path).getroot().iter("testcase"):
+        key = (case.get("classname", ""), case.get("name", ""))
+        nodeid = by_key.get(key, "::".join(part for part in key if part))
+
+        if case.find("failure") is not None:
+            outcome = "failed"
+        elif case.find("error") is not None:
+            outcome = "error"
+        elif case.find("skipped") is not None:
+            outcome = "skipped"
+        else:
+            outcome = "passed"
+
+        results[nodeid] = {"outcome": outcome, "duration": float(case.get("time", 0) or 0)}
+
+    return results
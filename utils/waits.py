@@ -0,0 +1,157 @@
+"""
+Condition-based waits for Beamo page objects.
+Each wait has a deadline and records how long it actually waited, so the
+time saved over the fixed sleeps it replaced can be reported.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+from playwright.async_api import Page
+
+
+class WaitRecorder:
+    """Aggregates actual wait durations per wait name (process-wide) for reporting."""
+
+    def __init__(self):
+        # 대기 이름별 합계만 유지 (대기 횟수와 무관하게 메모리 일정)
+        self.totals: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, waited: float, satisfied: bool, replaces_sleep: float = 0.0) -> None:
+        with self._lock:
+            entry = self.totals.setdefault(name, {"count": 0, "waited": 0.0, "timeouts": 0, "saved": 0.0})
+            entry["count"] += 1
+            entry["waited"] += waited
+            entry["timeouts"] += 0 if satisfied else 1
+            if replaces_sleep:
+                entry["saved"] += replaces_sleep - waited
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per-wait count, total waited, timeouts and time saved vs. the old fixed sleeps."""
+        with self._lock:
+            return {name: dict(entry) for name, entry in self.totals.items()}
+
+    def total_saved(self) -> float:
+        return sum(entry["saved"] for entry in self.summary().values())
+
+    def reset(self) -> None:
+        with self._lock:
+            self.totals.clear()
+
+
+# 프로세스 전체에서 공유하는 대기 기록
+wait_recorder = WaitRecorder()
+
+
+# 요소가 화면에 보이는지 판단하는 공통 JS
+_VISIBLE_JS = """
+    (el) => !!el && el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== 'hidden' && getComputedStyle(el).display !== 'none'
+"""
+
+
+class Waits:
+    """
+    Condition waits with deadlines for page objects.
+
+    Every wait returns True when the condition was met and False when the
+    deadline passed (it never raises), and records the time it took.
+    """
+
+    def __init__(self, page: Page, recorder: Optional[WaitRecorder] = None):
+        self.page = page
+        self.recorder = recorder or wait_recorder
+        self.logger = logging.getLogger(__name__)
+
+    async def list_fingerprint(self, selector: str) -> str:
+        """Cheap fingerprint (count + text) of a result list, taken before an action."""
+        return await self.page.evaluate(
+            "(selector) => { const els = document.querySelectorAll(selector);"
+            " return els.length + '|' + Array.from(els, el => el.textContent).join('\\u0001'); }",
+            selector,
+        )
+
+    async def results_list_changed(self, selector: str, previous: str, timeout: int = 5000,
+                                   replaces_sleep: float = 0.0) -> bool:
+        """Wait until the list matching selector differs from a previous fingerprint."""
+        return await self._wait_function(
+            "results list changed",
+            "([selector, previous]) => { const els = document.querySelectorAll(selector);"
+            " return (els.length + '|' + Array.from(els, el => el.textContent).join('\\u0001')) !== previous; }",
+            [selector, previous], timeout, replaces_sleep,
+        )
+
+    async def dialog_closed(self, selector: str, timeout: int = 10000, replaces_sleep: float = 0.0) -> bool:
+        """Wait until no element matching selector is visible (hidden or removed)."""
+        return await self._wait_function(
+            "dialog closed",
+            f"(selector) => Array.from(document.querySelectorAll(selector)).every(el => !({_VISIBLE_JS})(el))",
+            selector, timeout, replaces_sleep, playwright_selector=selector, state="hidden",
+        )
+
+    async def dialog_opened(self, selector: str, timeout: int = 10000, replaces_sleep: float = 0.0) -> bool:
+        """Wait until an element matching selector is visible."""
+        return await self._wait_selector("dialog opened", selector, "visible", timeout, replaces_sleep)
+
+    async def loading_mask_gone(self, selector: str = ".el-loading-mask", timeout: int = 30000,
+                                replaces_sleep: float = 0.0) -> bool:
+        """Wait until every loading mask is hidden or removed."""
+        return await self._wait_function(
+            "loading mask gone",
+            f"(selector) => Array.from(document.querySelectorAll(selector)).every(el => !({_VISIBLE_JS})(el))",
+            selector, timeout, replaces_sleep,
+        )
+
+    async def input_enabled(self, selector: str, timeout: int = 5000, replaces_sleep: float = 0.0) -> bool:
+        """Wait until a form control (input/button) exists, is visible and is not disabled/readonly."""
+        return await self._wait_function(
+            "input enabled",
+            f"(selector) => {{ const el = document.querySelector(selector);"
+            f" return !!el && ({_VISIBLE_JS})(el) && !el.disabled && !el.readOnly"
+            f" && !el.classList.contains('is-disabled'); }}",
+            selector, timeout, replaces_sleep,
+        )
+
+    async def toast_shown(self, selector: str = ".el-message, .el-notification", timeout: int = 5000,
+                          replaces_sleep: float = 0.0) -> bool:
+        """Wait until a toast/notification is visible."""
+        return await self._wait_selector("toast shown", selector, "visible", timeout, replaces_sleep)
+
+    async def _wait_selector(self, name: str, selector: str, state: str, timeout: int,
+                             replaces_sleep: float) -> bool:
+        start_time = time.perf_counter()
+        try:
+            await self.page.wait_for_selector(selector, state=state, timeout=timeout)
+            satisfied = True
+        except Exception:
+            satisfied = False
+        return self._record(name, start_time, satisfied, replaces_sleep, timeout)
+
+    async def _wait_function(self, name: str, expression: str, arg, timeout: int, replaces_sleep: float,
+                             playwright_selector: Optional[str] = None, state: Optional[str] = None) -> bool:
+        start_time = time.perf_counter()
+        try:
+            if playwright_selector and not self._is_css(playwright_selector):
+                # :has-text() 등 Playwright 전용 셀렉터는 DOM API로 평가할 수 없음
+                await self.page.wait_for_selector(playwright_selector, state=state, timeout=timeout)
+            else:
+                await self.page.wait_for_function(expression, arg=arg, timeout=timeout, polling="raf")
+            satisfied = True
+        except Exception:
+            satisfied = False
+        return self._record(name, start_time, satisfied, replaces_sleep, timeout)
+
+    @staticmethod
+    def _is_css(selector: str) -> bool:
+        return ":has-text(" not in selector and ":text(" not in selector and ">>" not in selector
+
+    def _record(self, name: str, start_time: float, satisfied: bool, replaces_sleep: float, timeout: int) -> bool:
+        waited = time.perf_counter() - start_time
+        self.recorder.record(name, waited, satisfied, replaces_sleep)
+        if satisfied:
+            self.logger.info(f"Wait '{name}' satisfied after {waited:.2f}s")
+        else:
+            self.logger.warning(f"Wait '{name}' not satisfied within {timeout / 1000:.1f}s")
+        return satisfied
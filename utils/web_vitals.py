@@ -0,0 +1,183 @@
+"""
+Navigation Timing and Web Vitals capture for Beamo automated testing platform.
+An init script observes every document load (TTFB, DOMContentLoaded, load,
+FCP, LCP, CLS, long tasks) and reports it back through a context binding.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+from urllib.parse import urlsplit
+from playwright.async_api import BrowserContext, Page
+
+
+BINDING_NAME = "__beamoVitals"
+
+# 최상위 문서마다 한 번 실행되어 PerformanceObserver로 지표를 모으고,
+# 변경이 생기면 500ms 단위로 묶어서 바인딩으로 보고 (pagehide 시 즉시 보고)
+INIT_SCRIPT = """
+(() => {
+  if (window.top !== window || window.__beamoVitalsSnapshot) return;
+  const vitals = {
+    id: Math.random().toString(36).slice(2) + Date.now().toString(36),
+    url: location.href,
+    ttfb: null, dcl: null, load: null, fcp: null, lcp: null, cls: 0,
+    long_tasks: 0, long_task_ms: 0,
+  };
+  let timer = null;
+  const send = () => {
+    if (timer) { clearTimeout(timer); timer = null; }
+    try { window.__beamoVitals(vitals); } catch (e) {}
+  };
+  const schedule = () => { if (!timer) timer = setTimeout(send, 500); };
+  const observe = (type, onEntry) => {
+    try {
+      new PerformanceObserver((list) => { list.getEntries().forEach(onEntry); schedule(); })
+        .observe({ type, buffered: true });
+    } catch (e) {}  // 지원하지 않는 entry type은 무시
+  };
+  observe('navigation', (e) => {
+    vitals.ttfb = e.responseStart;
+    vitals.dcl = e.domContentLoadedEventEnd || null;
+    vitals.load = e.loadEventEnd || null;
+  });
+  observe('paint', (e) => { if (e.name === 'first-contentful-paint') vitals.fcp = e.startTime; });
+  observe('largest-contentful-paint', (e) => { vitals.lcp = e.renderTime || e.loadTime || e.startTime; });
+  observe('layout-shift', (e) => { if (!e.hadRecentInput) vitals.cls += e.value; });
+  observe('longtask', (e) => { vitals.long_tasks += 1; vitals.long_task_ms += e.duration; });
+  addEventListener('load', () => setTimeout(() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (nav) {
+      vitals.ttfb = nav.responseStart;
+      vitals.dcl = nav.domContentLoadedEventEnd;
+      vitals.load = nav.loadEventEnd;
+    }
+    send();
+  }, 0));
+  addEventListener('pagehide', send);
+  window.__beamoVitalsSnapshot = () => vitals;
+})();
+"""
+
+METRICS = ("ttfb", "dcl", "load", "fcp", "lcp", "cls", "long_tasks", "long_task_ms")
+
+
+class WebVitalsCollector:
+    """Collects per-navigation timing for one BrowserContext."""
+
+    def __init__(self):
+        self.navigations: Dict[str, Dict] = {}  # 문서 id -> 최신 보고값
+        self.logger = logging.getLogger(__name__)
+
+    async def apply(self, context: BrowserContext) -> None:
+        """Expose the report binding and install the observer on every new document."""
+        await context.expose_binding(BINDING_NAME, self._on_report)
+        await context.add_init_script(script=INIT_SCRIPT)
+
+    def _on_report(self, source, vitals: Dict) -> None:
+        """Keep the latest report of each document (LCP/CLS grow until the page is left)."""
+        entry = self.navigations.setdefault(vitals["id"], {"timestamp": time.time()})
+        entry.update({key: vitals.get(key) for key in ("url",) + METRICS})
+
+    async def flush(self, page: Optional[Page]) -> None:
+        """Pull the final values of the page that is still open."""
+        if not page or page.is_closed():
+            return
+        try:
+            vitals = await page.evaluate("() => window.__beamoVitalsSnapshot ? window.__beamoVitalsSnapshot() : null")
+            if vitals:
+                self._on_report(None, vitals)
+        except Exception as e:
+            self.logger.debug(f"Failed to flush web vitals: {e}")
+
+    def report(self) -> List[Dict]:
+        """Navigations in load order, with timings rounded to milliseconds."""
+        result = []
+        for entry in sorted(self.navigations.values(), key=lambda item: item["timestamp"]):
+            if not entry.get("url", "").startswith("http"):
+                continue
+            record = {"url": entry["url"], "timestamp": round(entry["timestamp"], 3)}
+            for key in METRICS:
+                value = entry.get(key)
+                record[key] = round(value, 4 if key == "cls" else 1) if isinstance(value, (int, float)) else None
+            result.append(record)
+        return result
+
+    def reset(self) -> None:
+        self.navigations.clear()
+
+
+class WebVitalsRecorder:
+    """
+    Process-wide store of per-test navigation timings, exported to reports/<env>/web_vitals.jsonl.
+
+    Memory holds at most ``max_navigations`` navigations for each of the last
+    ``max_tests`` tests; the export keeps everything.
+    """
+
+    def __init__(self, reports_dir: str = "reports", max_tests: int = 500, max_navigations: int = 50):
+        self.reports_dir = Path(reports_dir)
+        self.max_tests = max_tests
+        self.max_navigations = max_navigations
+        # 테스트 -> 최근 페이지 로드 (오래된 테스트부터 제거)
+        self.results: "OrderedDict[str, Deque[Dict]]" = OrderedDict()
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+    def record(self, environment: str, test: str, navigations: List[Dict]) -> None:
+        """Attach navigations to a test and append them to the environment's export."""
+        if not navigations:
+            return
+        with self._lock:
+            if test not in self.results:
+                self.results[test] = deque(maxlen=self.max_navigations)
+                while len(self.results) > self.max_tests:
+                    self.results.popitem(last=False)
+            self.results[test].extend(navigations)
+            try:
+                path = self.reports_dir / environment / "web_vitals.jsonl"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, 'a', encoding='utf-8') as f:
+                    for navigation in navigations:
+                        line = {"env": environment, "test": test, **navigation}
+                        f.write(json.dumps(line, ensure_ascii=False, separators=(',', ':')) + "\n")
+            except Exception as e:
+                self.logger.warning(f"Failed to export web vitals for {test}: {e}")
+
+    def for_test(self, test: str) -> List[Dict]:
+        with self._lock:
+            return list(self.results.get(test, []))
+
+    def tests(self) -> List[str]:
+        with self._lock:
+            return list(self.results)
+
+    def discard(self, test: str) -> None:
+        """Drop one test's navigations once they have been reported."""
+        with self._lock:
+            self.results.pop(test, None)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.results.clear()
+
+
+# 프로세스 전체에서 공유하는 Web Vitals 기록
+vitals_recorder = WebVitalsRecorder()
+
+
+def format_navigation(navigation: Dict) -> str:
+    """One-line summary: host/path plus the metrics that were captured."""
+    url = urlsplit(navigation["url"])
+    parts = []
+    for key, label in (("ttfb", "TTFB"), ("fcp", "FCP"), ("lcp", "LCP"), ("load", "load")):
+        if navigation.get(key) is not None:
+            parts.append(f"{label} {navigation[key]:.0f}ms")
+    parts.append(f"CLS {navigation.get('cls') or 0:.3f}")
+    if navigation.get("long_tasks"):
+        parts.append(f"long tasks {navigation['long_tasks']} ({navigation['long_task_ms']:.0f}ms)")
+    return f"{url.netloc}{url.path}: {', '.join(parts)}"